@@ -0,0 +1,209 @@
+"""
+Benchmarks for multiaxes
+
+Usage:
+    python benchmarks/run.py                      # run and print
+    python benchmarks/run.py --save base.json     # store the results as a baseline
+    python benchmarks/run.py --compare base.json  # report regressions against a baseline
+    python benchmarks/run.py --quick -k drawfig   # small grids, only cases matching 'drawfig'
+
+Each case records the best wall time of --repeat runs and the peak memory
+traced by tracemalloc in one extra run (in the child process for the import
+cases). With --compare, a case regresses when
+its time (or peak memory) exceeds the baseline by more than --threshold, and
+the exit status is 1.
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from multiaxes import Multiaxes  # noqa: E402
+
+GRIDS = [(1, 1), (3, 2), (8, 6), (20, 15)]
+QUICK_GRIDS = [(1, 1), (3, 2)]
+
+
+def _wcs():
+    from astropy.wcs import WCS
+    w = WCS(naxis=2)
+    w.wcs.ctype = ['RA---TAN', 'DEC--TAN']
+    w.wcs.crval = [83.8, -5.4]
+    w.wcs.crpix = [50., 50.]
+    w.wcs.cdelt = [-0.001, 0.001]
+    return w
+
+
+def _multiaxes(grid, cpos='top', share=True, proj='plain'):
+    nx, ny = grid
+    mx = Multiaxes(col=2, nx=nx, ny=ny, xlab=0.2, ylab=0.2, xpad=0.02, ypad=0.02, tit=0.,
+                   cb=0.05, clab=0.1, cpad=0.02, cpos=cpos, proj=_wcs() if proj == 'wcs' else None)
+    if share:
+        mx.shareaxes(pad=0.02)
+    return mx
+
+
+def bench_layout(grid, cpos, share):
+    mx = _multiaxes(grid, cpos, share)
+    return lambda: mx.compute_layout(cache=False)
+
+
+def bench_drawfig(grid, cpos, share, proj):
+    def run():
+        mx = _multiaxes(grid, cpos, share, proj)
+        with mx.figure():
+            pass
+    return run
+
+
+def bench_save(grid, proj, fmt):
+    def run():
+        mx = _multiaxes(grid, 'top', True, proj)
+        with mx.figure() as (fig, ax, cax):
+            for a in np.ravel(ax):
+                a.imshow(np.random.rand(100, 100), origin='lower')
+            fig.savefig(io.BytesIO(), format=fmt, dpi=100)
+    return run
+
+
+def bench_wcsgrid(grid):
+    # identical but distinct WCS objects per panel, build and PNG save
+    def run():
+        mx = _multiaxes(grid, 'top', True)
+        mx._pj[:, :] = [[_wcs() for xi in range(grid[0])] for yi in range(grid[1])]
+        with mx.figure() as (fig, ax, cax):
+            for a in np.ravel(ax):
+                a.imshow(np.zeros((100, 100)), origin='lower')
+            fig.savefig(io.BytesIO(), format='png', dpi=100)
+    return run
+
+
+def bench_sharecolorbar(grid, loc):
+    def run():
+        mx = _multiaxes(grid, 'top', True)
+        with mx.figure():
+            mx.sharecolorbar(loc)
+    return run
+
+
+def bench_subgrid(cells):
+    def run():
+        mx = Multiaxes(col=1, xlab=0.3, ylab=0.4)
+        with mx.figure() as (fig, ax, cax):
+            mx.subgrid(ax, (cells, cells), pad=0.001, repr=(0, 0))
+            fig.savefig(io.BytesIO(), format='pdf')
+    return run
+
+
+def bench_import(stmt):
+    # a fresh interpreter, so that nothing is imported yet
+    cmd = [sys.executable, '-c', 'import multiaxes; '+stmt]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    def run():
+        subprocess.check_call(cmd, env=env)
+
+    def peak():
+        # traced in the child, where the import happens
+        code = ('import tracemalloc; tracemalloc.start(); import multiaxes; {}; '
+                'print(tracemalloc.get_traced_memory()[1])')
+        return int(subprocess.check_output([sys.executable, '-c', code.format(stmt)], env=env))
+    run.peak = peak
+    return run
+
+
+def cases(quick=False):
+    grids = QUICK_GRIDS if quick else GRIDS
+    for grid, cpos, share in itertools.product(grids, ('top', 'right'), (False, True)):
+        name = 'layout[{}x{},{},share={}]'.format(grid[0], grid[1], cpos, share)
+        yield name, bench_layout(grid, cpos, share)
+    for grid, cpos, share, proj in itertools.product(grids, ('top', 'right'), (False, True), ('plain', 'wcs')):
+        name = 'drawfig[{}x{},{},share={},{}]'.format(grid[0], grid[1], cpos, share, proj)
+        yield name, bench_drawfig(grid, cpos, share, proj)
+    for grid, proj, fmt in itertools.product(grids, ('plain', 'wcs'), ('pdf', 'png')):
+        name = 'save[{}x{},{},{}]'.format(grid[0], grid[1], proj, fmt)
+        yield name, bench_save(grid, proj, fmt)
+    for grid in ([(6, 6)] if quick else [(6, 6), (10, 10)]):
+        yield 'wcsgrid[{}x{}]'.format(grid[0], grid[1]), bench_wcsgrid(grid)
+    # sharecolorbar needs more than one panel
+    for grid, loc in itertools.product(grids[1:], ('right', 'top')):
+        yield 'sharecolorbar[{}x{},{}]'.format(grid[0], grid[1], loc), bench_sharecolorbar(grid, loc)
+    for cells in ((5, 10) if quick else (5, 10, 20)):
+        yield 'subgrid[{0}x{0}]'.format(cells), bench_subgrid(cells)
+    yield 'import[multiaxes]', bench_import('pass')
+    yield 'import[casacmap]', bench_import('[multiaxes.casacmap[k] for k in multiaxes.casacmap]')
+
+
+def measure(func, repeat):
+    func()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter()-t0)
+    if hasattr(func, 'peak'):
+        # cases run in a subprocess measure their own peak
+        return {'time': min(times), 'peak': func.peak()}
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time': min(times), 'peak': peak}
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, res in results.items():
+        if name not in baseline:
+            continue
+        for key in ('time', 'peak'):
+            ref = baseline[name][key]
+            if ref > 0 and res[key] > ref*threshold:
+                regressions.append('{} {}: {:.4g} -> {:.4g} ({:+.0%})'.format(name, key, ref, res[key], res[key]/ref-1.))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='multiaxes benchmarks')
+    parser.add_argument('-k', dest='select', default='', help='run only cases whose name contains this string')
+    parser.add_argument('--quick', action='store_true', help='small grids only')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to compare with')
+    parser.add_argument('--threshold', type=float, default=1.2, help='allowed ratio to the baseline (default 1.2)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, func in cases(args.quick):
+        if args.select not in name:
+            continue
+        results[name] = measure(func, args.repeat)
+        print('{:<45s} {:10.4f} s {:10.2f} MB'.format(name, results[name]['time'], results[name]['peak']/1e6))
+        sys.stdout.flush()
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print('\nRegressions (threshold {:.2f}):'.format(args.threshold))
+            print('\n'.join(regressions))
+            return 1
+        print('\nNo regressions (threshold {:.2f}).'.format(args.threshold))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
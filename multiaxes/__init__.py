@@ -7,4 +7,9 @@ This script makes easy to draw a figure with multiple axes for the AASTex manusc
 
 from . import multiaxes
 from .multiaxes import *
+from .layout import compute_layout
+from .imaging import blockreduce, sharedlimits, contourpaths
 from .colorbars import *
+from .buildcache import fingerprint
+from .figureset import figureset, pagegrid
+from .metrics import textextent
@@ -0,0 +1,107 @@
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# per-process state of the render_many workers
+_worker = {}
+
+
+def _initworker(cls, spec, proj, settings, style, reuse):
+    import matplotlib
+    matplotlib.use('Agg')
+    _worker['mx'] = cls.fromspec(spec, proj)
+    vars(_worker['mx']).update(settings)
+    _worker['style'] = style
+    _worker['reuse'] = reuse
+
+
+def _renderitem(mx, style, index, item, plot_fn, fname, savekw, reuse=False):
+    try:
+        if reuse:
+            # the figure of the previous item, cleared by drawfig(reuse=True)
+            fig, ax, cax = mx.drawfig(style=style, reuse=True, pyplot=False)
+            plot_fn(fig, ax, cax, item)
+            fig.savefig(fname, **savekw)
+        else:
+            with mx.figure(style=style) as (fig, ax, cax):
+                plot_fn(fig, ax, cax, item)
+                fig.savefig(fname, **savekw)
+        return index, fname, None
+    except Exception:
+        if reuse:
+            # start the next item from a new figure
+            mx.closefig()
+        return index, None, traceback.format_exc()
+
+
+def _workeritem(index, item, plot_fn, fname, savekw):
+    return _renderitem(_worker['mx'], _worker['style'], index, item, plot_fn, fname, savekw, _worker['reuse'])
+
+
+def render_many(mx, items, plot_fn, outdir, workers=None, fname='{:04d}.png', style=True, reuse=False, **savekw):
+    """
+    Render one figure per item with the layout of 'mx' and save it in 'outdir'.
+
+    plot_fn(fig, ax, cax, item) draws an item on a fresh figure. 'fname' is a
+    format string taking the item index, or a callable fname(index, item).
+    With workers > 1, plot_fn and the items must be picklable and the figures
+    are rendered by Agg worker processes. Yields (index, filename, error) in
+    completion order, where error is the formatted traceback or None; items
+    that cannot be sent to a worker (unpicklable, or a crashed pool) are
+    reported the same way. With reuse=True each process draws the figure
+    once and clears it for the next item (Multiaxes.clearfig), so plot_fn
+    must set again everything it changes apart from the data, titles and
+    colorbars.
+    """
+    from .multiaxes import _settings
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    def path(index, item):
+        name = fname(index, item) if callable(fname) else fname.format(index)
+        return os.path.join(outdir, name)
+
+    spec = mx.spec()
+    if workers <= 1:
+        local = type(mx).fromspec(spec, mx._pj)
+        vars(local).update(_settings(mx))
+        try:
+            for index, item in enumerate(items):
+                yield _renderitem(local, style, index, item, plot_fn, path(index, item), savekw, reuse)
+        finally:
+            if local._fig is not None:
+                local.closefig()
+        return
+
+    pool = ProcessPoolExecutor(workers, initializer=_initworker,
+                               initargs=(type(mx), spec, mx._pj, _settings(mx), style, reuse))
+    pending = {}
+
+    def results(done):
+        for future in done:
+            index = pending.pop(future)
+            try:
+                yield future.result()
+            except Exception as err:
+                yield index, None, ''.join(traceback.format_exception(type(err), err, err.__traceback__))
+
+    try:
+        for index, item in enumerate(items):
+            try:
+                pending[pool.submit(_workeritem, index, item, plot_fn, path(index, item), savekw)] = index
+            except Exception:
+                # the pool is broken
+                yield index, None, traceback.format_exc()
+                continue
+            if len(pending) >= 2*workers:
+                done = wait(pending, return_when=FIRST_COMPLETED)[0]
+                yield from results(done)
+        while pending:
+            done = wait(pending, return_when=FIRST_COMPLETED)[0]
+            yield from results(done)
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
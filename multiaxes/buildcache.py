@@ -0,0 +1,133 @@
+import os
+import re
+import json
+import hashlib
+import types
+import functools
+import numpy as np
+
+
+def _update(h, obj, seen=None):
+    if isinstance(obj, np.memmap) and getattr(obj, 'filename', None):
+        st = os.stat(obj.filename)
+        h.update(repr(('memmap', obj.filename, st.st_size, st.st_mtime_ns, obj.offset, obj.shape,
+                       obj.dtype.str)).encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(repr(('ndarray', obj.shape, obj.dtype.str)).encode())
+        if obj.dtype == object:
+            for item in obj.flat:
+                _update(h, item, seen)
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (str, os.PathLike)) and os.path.isfile(obj):
+        st = os.stat(obj)
+        h.update(repr(('file', os.path.abspath(obj), st.st_size, st.st_mtime_ns)).encode())
+    elif isinstance(obj, (list, tuple)):
+        h.update(repr((type(obj).__name__, len(obj))).encode())
+        for item in obj:
+            _update(h, item, seen)
+    elif isinstance(obj, dict):
+        h.update(repr(('dict', len(obj))).encode())
+        for k in sorted(obj, key=repr):
+            _update(h, k, seen)
+            _update(h, obj[k], seen)
+    elif isinstance(obj, functools.partial):
+        _update(h, (obj.func, obj.args, obj.keywords), seen)
+    elif isinstance(obj, types.FunctionType):
+        h.update(repr(('function', obj.__module__, obj.__qualname__)).encode())
+        _updatecode(h, obj.__code__)
+        _updatefunction(h, obj, (obj.__module__, set()) if seen is None else seen)
+    elif isinstance(obj, types.ModuleType):
+        h.update(repr(('module', obj.__name__)).encode())
+    elif hasattr(obj, 'to_header_string'):
+        h.update(obj.to_header_string().encode())
+    else:
+        # without the object addresses, which change from run to run
+        h.update(re.sub(' at 0x[0-9a-fA-F]+', '', repr(obj)).encode())
+
+
+def _updatecode(h, code):
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _updatecode(h, const)
+        else:
+            h.update(repr(const).encode())
+    h.update(repr(code.co_names).encode())
+
+
+def _names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _names(const)
+    return names
+
+
+def _updatefunction(h, fn, seen):
+    # defaults, closure cells and the module globals the code names; 'seen' is (module of the first
+    # function, ids of the functions done). Functions of other modules (libraries) are not followed.
+    module, done = seen
+    if id(fn) in done or fn.__module__ != module:
+        return
+    done.add(id(fn))
+    _update(h, (fn.__defaults__, fn.__kwdefaults__), seen)
+    for cell in fn.__closure__ or ():
+        try:
+            _update(h, cell.cell_contents, seen)
+        except ValueError:
+            # empty cell
+            h.update(b'cell')
+    for name in sorted(_names(fn.__code__)):
+        if name in fn.__globals__:
+            _update(h, name, seen)
+            _update(h, fn.__globals__[name], seen)
+
+
+def fingerprint(*objs):
+    """
+    Hash of arrays, files, functions and plain values for the build cache.
+
+    Arrays are hashed by content, memory-mapped arrays and file paths by
+    name, size and modification time, functions by name, bytecode,
+    defaults, closure values and the globals they use (followed into the
+    functions of the same module they call; modules are hashed by name,
+    functions of other modules by bytecode only) and WCS objects by their
+    header. Attributes of modules and objects (np.pi, cfg.level) are not
+    hashed.
+    """
+    h = hashlib.sha256()
+    for obj in objs:
+        _update(h, obj)
+    return h.hexdigest()
+
+
+def build(mx, fname, plot_fn, inputs=(), cachedir='.multiaxes', force=False, **kwargs):
+    """
+    Render 'fname' with plot_fn(fig, ax, cax, inputs) unless it exists and
+    the layout of 'mx', the plotting function, the inputs and the save
+    options hash to the value stored in 'cachedir' for it. Returns the
+    Multiaxes.savefig report with 'skipped' set, or only the file name and
+    'skipped' when nothing was rendered. The figure is rendered on a copy
+    of 'mx' (Multiaxes.fromspec), so a figure drawn on 'mx' is kept.
+    """
+    spec = mx.spec(layout=False)
+    key = fingerprint(json.dumps(spec, sort_keys=True), mx._pj, plot_fn, inputs, kwargs)
+    entry = os.path.join(cachedir, hashlib.sha256(os.path.abspath(str(fname)).encode()).hexdigest()[:32]+'.json')
+    if not force and os.path.exists(fname) and os.path.exists(entry):
+        with open(entry) as f:
+            if json.load(f).get('hash') == key:
+                return {'fname': fname, 'skipped': True}
+    # a copy of the layout, so that the figure of 'mx' is left open
+    from .multiaxes import _settings
+    mb = type(mx).fromspec(mx.spec(), mx._pj)
+    vars(mb).update(_settings(mx))
+    with mb.figure() as (fig, ax, cax):
+        plot_fn(fig, ax, cax, inputs)
+        report = mb.savefig(fname, **kwargs)
+    if not os.path.isdir(cachedir):
+        os.makedirs(cachedir)
+    with open(entry, 'w') as f:
+        json.dump({'fname': os.path.abspath(str(fname)), 'hash': key}, f)
+    report['skipped'] = False
+    return report
@@ -0,0 +1,306 @@
+"""
+multiaxes command line
+
+Usage:
+    multiaxes figure.yaml                 # render one spec
+    multiaxes specs/*.json -j 4           # render many specs with 4 worker processes
+    multiaxes figure.yaml -o build        # write the outputs in 'build'
+
+A spec is a JSON or YAML (needs PyYAML) mapping, or a list of them:
+
+    layout: {col: 2, nx: 3, ny: 2, cb: 0.1, proj: m0}   # Multiaxes() arguments
+    shareaxes: {pad: 0.05}                              # or true
+    data:
+      m0: image.fits                                    # or {fits: ..., hdu: 1}
+      cube: {npy: cube.npy}                             # memory-mapped
+      raw: {memmap: cube.dat, dtype: float32, shape: [64, 512, 512]}
+    panels:                                             # top-left panel first
+      - {data: m0, cmap: jet, origin: lower, title: 'Moment 0'}
+      - {data: cube, index: 10, plot: contour, levels: [1, 2, 4], colors: k}
+    sharenorm: {percentile: [1, 99]}                    # or true
+    sharecolorbar: {loc: right, width: 0.1, label: 'K km/s'}
+    wcs: {w0: {CTYPE1: RA---TAN, ...}}                  # headers usable as 'proj'
+    output: figure.pdf
+    save: {dpi: 300}
+
+Paths are relative to the spec file. All specs of a run share one process
+(or one pool of worker processes), so the imports are paid once per batch.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from functools import lru_cache
+
+import numpy as np
+
+_plots = ('imshow', 'contour', 'contourf', 'plot')
+# panel keys that are not passed to the plotting method
+_panelkeys = ('data', 'index', 'plot', 'x', 'proj', 'title', 'xlabel', 'ylabel', 'text', 'colorbar')
+
+
+def loadspecs(fname):
+    # list of the figure specs in a JSON or YAML file, with their 'base' directory
+    with open(fname) as f:
+        if fname.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError('Reading YAML specs needs PyYAML, use a JSON spec instead.')
+            specs = yaml.safe_load(f)
+        else:
+            specs = json.load(f)
+    if isinstance(specs, dict):
+        specs = [specs]
+    stem = os.path.splitext(os.path.basename(fname))[0]
+    base = os.path.dirname(os.path.abspath(fname))
+    for i, spec in enumerate(specs):
+        spec.setdefault('base', base)
+        spec.setdefault('output', stem+'.pdf' if len(specs) == 1 else '{}_{:d}.pdf'.format(stem, i))
+    return specs
+
+
+def _sourcekind(src):
+    if isinstance(src, str):
+        name = src.lower()
+        if name.endswith(('.fits', '.fit', '.fts', '.fits.gz')):
+            return 'fits', {'fits': src}
+        if name.endswith(('.npy', '.npz')):
+            return 'npy', {'npy': src}
+        raise ValueError("Unknown data file type '{}'.".format(src))
+    for kind in ('fits', 'npy', 'memmap'):
+        if kind in src:
+            return kind, src
+    raise ValueError("Data source needs one of 'fits', 'npy' or 'memmap': {}".format(src))
+
+
+@lru_cache(maxsize=32)
+def _loadsource(key, path, mtime):
+    # (data, header) of a source; memory-mapped where possible and reused by later specs of the process
+    kind, src = _sourcekind(json.loads(key))
+    if kind == 'fits':
+        from astropy.io import fits
+        with fits.open(path, memmap=True) as hdul:
+            hdu = hdul[src.get('hdu', 0)]
+            return hdu.data, hdu.header
+    if kind == 'npy':
+        data = np.load(path, mmap_mode='r' if src.get('mmap', True) else None)
+        if path.endswith('.npz'):
+            data = data[src.get('key', data.files[0])]
+        return data, None
+    data = np.memmap(path, dtype=src.get('dtype', 'float32'), mode='r', offset=src.get('offset', 0),
+                     shape=tuple(src['shape']) if 'shape' in src else None, order=src.get('order', 'C'))
+    return data, None
+
+
+def loadsource(src, base='.'):
+    kind, src = _sourcekind(src)
+    path = os.path.join(base, src[kind])
+    data, header = _loadsource(json.dumps(src, sort_keys=True), path, os.stat(path).st_mtime_ns)
+    if 'index' in src:
+        data = data[_index(src['index'])]
+    return data, header
+
+
+def _index(index):
+    return tuple(index) if isinstance(index, list) else index
+
+
+def _wcs(header):
+    from astropy.wcs import WCS
+    return WCS(header).celestial
+
+
+def _header(header):
+    # FITS header from a card string or a {keyword: value} mapping
+    from astropy.io import fits
+    if isinstance(header, str):
+        return fits.Header.fromstring(header)
+    return fits.Header(list(header.items()))
+
+
+def _cmap(name):
+    from .colorbars import casacmap
+    return casacmap[name] if name in casacmap else name
+
+
+def _option(value, default):
+    # true/false/None or a mapping of keyword arguments
+    if value is True:
+        return dict(default)
+    if isinstance(value, dict):
+        return dict(default, **value)
+    return None
+
+
+def render(spec, outdir=None, arrays=None):
+    """
+    Render one figure spec and save it. 'arrays' are in-memory data sources
+    by name, next to those of spec['data'], and spec['output'] can be a file
+    object (give spec['save']['format']). Returns the Multiaxes.savefig
+    report.
+    """
+    from .multiaxes import Multiaxes
+    base = spec.get('base', '.')
+    sources = {name: loadsource(src, base) for name, src in spec.get('data', {}).items()}
+    sources.update((name, (data, None)) for name, data in (arrays or {}).items())
+
+    def proj(name):
+        if name is None:
+            return None
+        if name in spec.get('wcs', {}):
+            return _wcs(_header(spec['wcs'][name]))
+        return _wcs(sources[name][1] if name in sources else loadsource(name, base)[1])
+
+    layout = dict(spec.get('layout', {}))
+    layout['proj'] = proj(layout.get('proj'))
+    mx = Multiaxes(**layout)
+    shareaxes = _option(spec.get('shareaxes'), {})
+    if shareaxes is not None:
+        mx.shareaxes(**shareaxes)
+    panels = spec.get('panels', [])
+    if len(panels) > mx._nx*mx._ny:
+        raise ValueError('{} panels for a {}x{} grid.'.format(len(panels), mx._nx, mx._ny))
+    # per-panel projections, in the top-left first order of the panels
+    for i, panel in enumerate(panels):
+        if panel is not None and panel.get('proj') is not None:
+            mx._pj[mx._ny-1-i//mx._nx, i % mx._nx] = proj(panel['proj'])
+
+    with mx.figure(style=spec.get('style', True)) as (fig, ax, cax):
+        axes, caxes = np.ravel(ax), np.ravel(cax)
+        mappables = []
+        for i, panel in enumerate(panels):
+            if panel is None:
+                continue
+            mappables.append(_panel(mx, axes[i], caxes[i], panel, sources))
+        sharenorm = _option(spec.get('sharenorm'), {})
+        if sharenorm is not None:
+            if 'percentile' in sharenorm:
+                sharenorm['percentile'] = tuple(sharenorm['percentile'])
+            mx.sharenorm(**sharenorm)
+        sharecb = _option(spec.get('sharecolorbar'), {})
+        mappable = next((m for m in mappables if m is not None and hasattr(m, 'get_cmap')), None)
+        if sharecb is not None and mappable is not None:
+            label = sharecb.pop('label', None)
+            loc = sharecb.get('loc', 'right')
+            cb = mx.colorbar(mappable, cax=mx.sharecolorbar(**sharecb),
+                             orientation='vertical' if loc == 'right' else 'horizontal')
+            if label is not None:
+                cb.set_label(label)
+        output = spec['output']
+        if hasattr(output, 'write'):
+            pass
+        elif outdir is not None:
+            output = os.path.join(outdir, os.path.basename(output))
+        else:
+            output = os.path.join(base, output)
+        return mx.savefig(output, **spec.get('save', {}))
+
+
+def _panel(mx, ax, cax, panel, sources):
+    data = sources[panel['data']][0] if 'data' in panel else None
+    if data is not None and 'index' in panel:
+        data = data[_index(panel['index'])]
+    kind = panel.get('plot', 'imshow')
+    if kind not in _plots:
+        raise ValueError("'plot' should be in {}".format(list(_plots)))
+    kwargs = {k: v for k, v in panel.items() if k not in _panelkeys}
+    if 'cmap' in kwargs:
+        kwargs['cmap'] = _cmap(kwargs['cmap'])
+    if kind == 'imshow':
+        artist = mx.imshow(ax, data, **kwargs)
+    elif kind == 'plot':
+        args = (data,) if 'x' not in panel else (sources[panel['x']][0], data)
+        artist = ax.plot(*args, **kwargs)[0]
+    else:
+        artist = getattr(ax, kind)(data, **kwargs)
+    if 'title' in panel:
+        ax.set_title(panel['title'])
+    if 'xlabel' in panel:
+        ax.set_xlabel(panel['xlabel'])
+    if 'ylabel' in panel:
+        ax.set_ylabel(panel['ylabel'])
+    if 'text' in panel:
+        x, y, s = panel['text']
+        ax.text(x, y, s, transform=ax.transAxes, ha='left', va='top')
+    if panel.get('colorbar') and cax is not None:
+        cb = mx.colorbar(artist, cax=cax, orientation='horizontal' if mx._cb == 't' else 'vertical')
+        if mx._cb == 't':
+            mx.topcolorbar(cax)
+        if isinstance(panel['colorbar'], str):
+            cb.set_label(panel['colorbar'])
+    return artist
+
+
+def _initworker():
+    import matplotlib
+    matplotlib.use('Agg')
+    from . import multiaxes  # noqa: F401
+
+
+def _renderspec(spec, outdir):
+    # (output, report or None, error or None) of one spec
+    try:
+        return spec['output'], render(spec, outdir), None
+    except Exception:
+        return spec['output'], None, traceback.format_exc()
+
+
+def _tasks(fnames):
+    # (spec file, spec or None, error or None) of every spec of the files, in order
+    for fname in fnames:
+        try:
+            specs = loadspecs(fname)
+        except Exception:
+            yield fname, None, traceback.format_exc()
+            continue
+        for spec in specs:
+            yield fname, spec, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='multiaxes', description='Render Multiaxes figures from JSON/YAML specs.')
+    parser.add_argument('specs', nargs='+', help='spec files')
+    parser.add_argument('-j', '--workers', type=int, default=1, help='number of worker processes (default 1)')
+    parser.add_argument('-o', '--outdir', help='write all outputs in this directory')
+    parser.add_argument('-q', '--quiet', action='store_true', help='print only the errors')
+    args = parser.parse_args(argv)
+
+    if args.outdir is not None and not os.path.isdir(args.outdir):
+        os.makedirs(args.outdir)
+    t0 = time.perf_counter()
+    # one task per spec, so that the specs of one file are also rendered in parallel
+    tasks = list(_tasks(args.specs))
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(args.workers, initializer=_initworker)
+        futures = [None if spec is None else pool.submit(_renderspec, spec, args.outdir) for _, spec, _ in tasks]
+        results = (future.result() if future is not None else (None, None, err)
+                   for future, (_, _, err) in zip(futures, tasks))
+    else:
+        _initworker()
+        pool = None
+        results = (_renderspec(spec, args.outdir) if spec is not None else (None, None, err) for _, spec, err in tasks)
+    failed = n = 0
+    try:
+        for (fname, _, _), (output, report, err) in zip(tasks, results):
+            n += 1
+            if err is not None:
+                failed += 1
+                sys.stderr.write('{}: {} failed\n{}'.format(fname, output, err))
+            elif not args.quiet:
+                print('{} -> {} ({:.1f} kB, {:.2f} s)'.format(fname, report['fname'], report['size']/1e3,
+                                                             report['time']))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if not args.quiet:
+        print('{} figures, {} failed, {:.2f} s'.format(n, failed, time.perf_counter()-t0))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,313 @@
 import numpy as np
-from astropy.io import ascii
-from matplotlib.colors import ListedColormap
-
-_casacolors_dat = ['CMAP_NAME;RED;GREEN;BLUE',
-                   'Rainbow1;1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.997646987 0.976469994 0.955294013 0.934117973 0.912940979 0.891764998 0.870588005 0.849412024 0.828234971 0.80705899 0.785881996 0.764706016 0.743529022 0.722352982 0.701177001 0.680000007 0.658823013 0.637646973 0.616469979 0.595293999 0.574118018 0.552941024 0.531764984 0.51058799 0.48941201 0.468234986 0.447059005 0.425882012 0.404706001 0.383529991 0.362352997 0.341176987 0.319999993 0.298822999 0.277646989 0.256471008 0.235293999 0.214118004 0.192940995 0.171765 0.150588006 0.129411995 0.108235002 0.0870589986 0.0658821985 0.0447059013 0.0235294998 0.00235271011 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00941180997 0.0305882003 0.0517647006 0.0729411989 0.0941175967 0.115294002 0.136471003 0.157646999 0.178822994 0.200000003 0.221176997 0.242353007 0.263529986 0.284705997 0.305882007 0.327059001 0.348235011 0.369412005 0.390587986 0.411765009 0.43294099 0.454118013 0.475293994 0.496470988 0.517647028 0.538824022 0.560000002 0.581175983 0.602352977 0.623529017 0.644706011 0.665881991 0.687058985 0.708235025 0.729412019 0.750588 0.771764994 0.792940974 0.814118028 0.835294008 0.856471002 0.877646983 0.898823023 0.920000017 0.941175997 0.962352991 0.983528972 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0188235994 0.0399999991 0.0611763 0.0823531002 0.103528999 0.124706 0.145881996 0.167059004 0.188235 0.209411994 0.230588004 0.251765013 0.272940993 0.294117987 0.315293998 0.336470991 0.357647002 0.378823996 0.400000006 0.421175987 0.44235301 0.463530004 0.484706014 0.505882025 0.527059019 0.548234999 0.569411993 0.590587974 0.611764014 0.632941008 0.654118001 0.675293982 0.696470022 0.717647016 0.73882401 0.75999999 0.781176984 0.802353024 0.823529005 0.844705999 0.865881979 0.887058973 0.908235013 0.929412007 0.950587988 0.971764982 0.992941022 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.995293975 0.974117994 0.952941 0.93176502 0.910588026 0.889411986 0.868234992 0.847059011 0.825882018 0.804705977 0.783528984 0.762353003 0.741176009 0.720000029 0.698823988 0.677646995 0.656471014 0.63529402 0.61411798 0.592940986 0.571765006 0.550588012 0.529411972 0.508234978 0.487058997 0.465882003 0.444705993 0.423528999 0.402352989 0.381175995 0.360000014 0.338824004 0.31764701 0.296471 0.275294006 0.254117996 0.232941002 0.211765006 0.190587997 0.169412002 0.148234993 0.127058998 0.105881996 0.0847058967 0.063529402 0.0423528999 0.0211765002 0;0.600000024 0.621176004 0.642352998 0.663528979 0.684705973 0.705882013 0.727059007 0.748236001 0.769411981 0.790588021 0.811765015 0.832940996 0.854116976 0.87529403 0.896471024 0.917647004 0.938823998 0.959999979 0.981176019 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.985881984 0.964706004 0.943530023 0.922353029 0.901175976 0.879999995 0.858824015 0.837647021 0.816470981 0.795293987 0.774116993 0.752941012 0.731764972 0.710587978 0.689411998 0.668235004 0.647059023 0.62588203 0.604705989 0.583528996 0.562353015 0.541176975 0.519999981 0.498824 0.477647007 0.456470013 0.435294002 0.414117992 0.392940998 0.371764988 0.350587994 0.329412013 0.30823499 0.287059009 0.265881985 0.244706005 0.223528996 0.202353001 0.181176007 0.159999996 0.138824001 0.117647 0.0964706019 0.0752940029 0.0541176982 0.0329410993 0.0117648002 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0',
-                   'Rainbow2;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0509800017 0.10588 0.160779998 0.215690002 0.270590007 0.325489998 0.37647 0.43136999 0.48627001 0.541180015 0.596080005 0.650979996 0.705879986 0.725489974 0.74901998 0.772549987 0.796079993 0.815689981 0.839219987 0.862749994 0.886269987 0.905879974 0.929409981 0.952939987 0.976469994 1 0.996079981 0.996079981 0.996079981 0.996079981 0.992160022 0.992160022 0.992160022 0.992160022 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.992160022 0.992160022 0.992160022 0.992160022 0.996079981 0.996079981 0.996079981 0.996079981 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0352899991 0.0705899969 0.109800003 0.145099998 0.18039 0.219610006 0.254900008 0.294120014 0.329409987 0.364710003 0.403919995 0.439220011 0.478430003 0.50195998 0.525489986 0.549019992 0.572549999 0.596080005 0.619610012 0.643140018 0.666670024 0.690199971 0.713729978 0.73724997 0.760779977 0.784309983 0.800000012 0.815689981 0.831369996 0.847060025 0.866670012 0.882350028 0.898039997 0.913730025 0.933329999 0.949020028 0.964709997 0.980390012 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.976469994 0.956860006 0.933329999 0.913730025 0.894119978 0.870589972 0.850979984 0.827449977 0.80783999 0.788240016 0.764710009 0.745100021 0.725489974 0.705879986 0.686269999 0.666670024 0.647059977 0.627449989 0.607840002 0.588240027 0.56862998 0.549019992 0.529410005 0.509800017 0.490200013 0.470589995 0.43136999 0.396079987 0.360780001 0.325489998 0.286269993 0.25097999 0.215690002 0.18039 0.141179994 0.10588 0.0705899969 0.0352899991 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0352899991 0.0705899969 0.10588 0.141179994 0.18039 0.215690002 0.25097999 0.286269993 0.325489998 0.360780001 0.396079987 0.43136999 0.470589995 0.48627001 0.505879998 0.521570027 0.541180015 0.560779989 0.576470017 0.596080005 0.61176002 0.631370008 0.650979996 0.666670024 0.686269999 0.705879986 0.745100021 0.788240016 0.831369996 0.870589972 0.913730025 0.956860006 1;0.0117600001 0.0274500009 0.0431400016 0.0588200018 0.0745100006 0.0901999995 0.10588 0.121569999 0.137250006 0.152940005 0.168630004 0.184310004 0.200000003 0.211759999 0.227449998 0.243139997 0.258819997 0.274509996 0.290199995 0.30588001 0.321570009 0.337249994 0.352939993 0.368629992 0.384310007 0.400000006 0.411760002 0.427450001 0.44314 0.458819985 0.474510014 0.490200013 0.505879998 0.521570027 0.537249982 0.552940011 0.56862998 0.584309995 0.600000024 0.61176002 0.627449989 0.643140018 0.658819973 0.674510002 0.690199971 0.705879986 0.721570015 0.73724997 0.752939999 0.768630028 0.784309983 0.800000012 0.811760008 0.827449977 0.843140006 0.858820021 0.87450999 0.890200019 0.905879974 0.921570003 0.937250018 0.952939987 0.968630016 0.984309971 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.976469994 0.952939987 0.929409981 0.905879974 0.886269987 0.862749994 0.839219987 0.815689981 0.796079993 0.772549987 0.74901998 0.725489974 0.705879986 0.650979996 0.596080005 0.541180015 0.48627001 0.43136999 0.37647 0.325489998 0.270590007 0.215690002 0.160779998 0.10588 0.0509800017 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0509800017 0.10588 0.160779998 0.215690002 0.270590007 0.325489998 0.37647 0.43136999 0.48627001 0.541180015 0.596080005 0.650979996 0.705879986 0.725489974 0.74901998 0.772549987 0.796079993 0.815689981 0.839219987 0.862749994 0.886269987 0.905879974 0.929409981 0.952939987 0.976469994 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1',
-                   'Rainbow3;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0602950007 0.112232998 0.157962993 0.198901996 0.236032993 0.270065993 0.301530987 0.330834001 0.35829401 0.384164006 0.408650994 0.431923985 0.454124004 0.475367993 0.495759994 0.515384018 0.53431499 0.55261898 0.570352972 0.587566018 0.604304016 0.620604992 0.636506975 0.652040005 0.667234004 0.682114005 0.696705997 0.711030006 0.725108027 0.738956988 0.752595007 0.766038001 0.779299974 0.792396009 0.805338025 0.818139017 0.830811024 0.843364 0.855808973 0.868156016 0.880414009 0.892592013 0.904699981 0.91674602 0.928737998 0.940684021 0.952592015 0.964470029 0.976325989 0.988166988 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0.0602950007 0.112232998 0.157962993 0.198901996 0.236032993 0.270065993 0.301530987 0.330834001 0.35829401 0.384164006 0.408650994 0.431923985 0.454124004 0.475367993 0.495759994 0.515384018 0.53431499 0.55261898 0.570352972 0.587566018 0.604304016 0.620604992 0.636506975 0.652040005 0.667234004 0.682114005 0.696705997 0.711030006 0.725108027 0.738956988 0.752595007 0.766038001 0.779299974 0.792396009 0.805338025 0.818139017 0.830811024 0.843364 0.855808973 0.868156016 0.880414009 0.892592013 0.904699981 0.91674602 0.928737998 0.940684021 0.952592015 0.964470029 0.976325989 0.988166988 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.988166988 0.976325989 0.964470029 0.952592015 0.940684021 0.928737998 0.91674602 0.904699981 0.892592013 0.880414009 0.868156016 0.855808973 0.843364 0.830811024 0.818139017 0.805338025 0.792396009 0.779299974 0.766038001 0.752595007 0.738956988 0.725108027 0.711030006 0.696705997 0.682114005 0.667234004 0.652040005 0.636506975 0.620604992 0.604304016 0.587566018 0.570352972 0.55261898 0.53431499 0.515384018 0.495759994 0.475367993 0.454124004 0.431923985 0.408650994 0.384164006 0.35829401 0.330834001 0.301530987 0.270065993 0.236032993 0.198901996 0.157962993 0.112232998 0.0602950007 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0;1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.988166988 0.976325989 0.964470029 0.952592015 0.940684021 0.928737998 0.91674602 0.904699981 0.892592013 0.880414009 0.868156016 0.855808973 0.843364 0.830811024 0.818139017 0.805338025 0.792396009 0.779299974 0.766038001 0.752595007 0.738956988 0.725108027 0.711030006 0.696705997 0.682114005 0.667234004 0.652040005 0.636506975 0.620604992 0.604304016 0.587566018 0.570352972 0.55261898 0.53431499 0.515384018 0.495759994 0.475367993 0.454124004 0.431923985 0.408650994 0.384164006 0.35829401 0.330834001 0.301530987 0.270065993 0.236032993 0.198901996 0.157962993 0.112232998 0.0602950007 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0602950007 0.112232998 0.157962993 0.198901996 0.236032993 0.270065993 0.301530987 0.330834001 0.35829401 0.384164006 0.408650994 0.431923985 0.454124004 0.475367993 0.495759994 0.515384018 0.53431499 0.55261898 0.570352972 0.587566018 0.604304016 0.620604992 0.636506975 0.652040005 0.667234004 0.682114005 0.696705997 0.711030006 0.725108027 0.738956988 0.752595007 0.766038001 0.779299974 0.792396009 0.805338025 0.818139017 0.830811024 0.843364 0.855808973 0.868156016 0.880414009 0.892592013 0.904699981 0.91674602 0.928737998 0.940684021 0.952592015 0.964470029 0.976325989 0.988166988 1',
-                   'Rainbow4;0 0 0 0 0 0 0 0 0 0 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 1 1 1 1 1 1 1 1 1 1 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.862749994 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.705879986 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.117650002 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.596080005 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.725489974 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.850979984 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.901960015 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.00392000005 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0.235290006 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1',
-                   'HotMetal1;0 0.0117600001 0.0235300008 0.0352899991 0.0470600016 0.0588200018 0.0705899969 0.0823500007 0.0941200033 0.10588 0.117650002 0.129409999 0.141179994 0.152940005 0.16471 0.176469997 0.188240007 0.200000003 0.211759999 0.223529994 0.235290006 0.247060001 0.258819997 0.270590007 0.282350004 0.294120014 0.30588001 0.31764999 0.329409987 0.341179997 0.352939993 0.364710003 0.37647 0.38824001 0.400000006 0.411760002 0.423530012 0.435290009 0.447059989 0.458819985 0.470589995 0.482349992 0.494120002 0.505879998 0.517650008 0.529410005 0.541180015 0.552940011 0.564710021 0.576470017 0.588240027 0.600000024 0.61176002 0.623529971 0.635290027 0.647059977 0.658819973 0.670589983 0.68234998 0.69411999 0.705879986 0.717649996 0.729409993 0.741180003 0.752939999 0.764710009 0.776470006 0.788240016 0.800000012 0.811760008 0.823530018 0.835290015 0.847060025 0.858820021 0.870589972 0.882350028 0.894119978 0.905879974 0.917649984 0.929409981 0.941179991 0.952939987 0.964709997 0.976469994 0.988240004 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.31764999 0.321570009 0.325489998 0.329409987 0.333330005 0.337249994 0.341179997 0.345099986 0.349020004 0.352939993 0.356860012 0.360780001 0.364710003 0.368629992 0.372550011 0.37647 0.380389988 0.384310007 0.38824001 0.392159998 0.396079987 0.400000006 0.403919995 0.407840014 0.411760002 0.415690005 0.419609994 0.423530012 0.427450001 0.43136999 0.435290009 0.439220011 0.44314 0.447059989 0.450980008 0.454899997 0.458819985 0.462749988 0.466670007 0.470589995 0.474510014 0.478430003 0.482349992 0.48627001 0.490200013 0.494120002 0.498039991 0.50195998 0.505879998 0.509800017 0.51372999 0.517650008 0.521570027 0.525489986 0.529410005 0.533330023 0.537249982 0.541180015 0.545099974 0.549019992 0.552940011 0.55686003 0.560779989 0.564710021 0.56862998 0.572549999 0.576470017 0.580389977 0.584309995 0.588240027 0.592159986 0.596080005 0.600000024 0.603919983 0.607840002 0.61176002 0.615689993 0.619610012 0.623529971 0.627449989 0.631370008 0.635290027 0.639219999 0.643140018 0.647059977 0.650979996 0.654900014 0.658819973 0.662750006 0.666670024 0.670589983 0.674510002 0.678430021 0.68234998 0.686269999 0.690199971 0.69411999 0.698040009 0.701960027 0.705879986 0.709800005 0.713729978 0.717649996 0.721570015 0.725489974 0.729409993 0.733330011 0.73724997 0.741180003 0.745100021 0.74901998 0.752939999 0.756860018 0.760779977 0.764710009 0.768630028 0.772549987 0.776470006 0.780390024 0.784309983 0.788240016 0.792159975 0.796079993 0.800000012 0.803919971 0.80783999 0.811760008 0.815689981 0.81961 0.823530018 0.827449977 0.831369996 0.835290015 0.839219987 0.843140006 0.847060025 0.850979984 0.854900002 0.858820021 0.862749994 0.866670012 0.870589972 0.87450999 0.878430009 0.882350028 0.886269987 0.890200019 0.894119978 0.898039997 0.901960015 0.905879974 0.909799993 0.913730025 0.917649984 0.921570003 0.925490022 0.929409981 0.933329999 0.937250018 0.941179991 0.945100009 0.949020028 0.952939987 0.956860006 0.960780025 0.964709997 0.968630016 0.972549975 0.976469994 0.980390012 0.984309971 0.988240004 0.992160022 0.996079981 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0117600001 0.0235300008 0.0352899991 0.0470600016 0.0588200018 0.0705899969 0.0823500007 0.0941200033 0.10588 0.117650002 0.129409999 0.141179994 0.152940005 0.16471 0.176469997 0.188240007 0.200000003 0.211759999 0.223529994 0.235290006 0.247060001 0.258819997 0.270590007 0.282350004 0.294120014 0.30588001 0.31764999 0.329409987 0.341179997 0.352939993 0.364710003 0.37647 0.38824001 0.400000006 0.411760002 0.423530012 0.435290009 0.447059989 0.458819985 0.470589995 0.482349992 0.494120002 0.505879998 0.517650008 0.529410005 0.541180015 0.552940011 0.564710021 0.576470017 0.588240027 0.600000024 0.61176002 0.623529971 0.635290027 0.647059977 0.658819973 0.670589983 0.68234998 0.69411999 0.705879986 0.717649996 0.729409993 0.741180003 0.752939999 0.764710009 0.776470006 0.788240016 0.800000012 0.811760008 0.823530018 0.835290015 0.847060025 0.858820021 0.870589972 0.882350028 0.894119978 0.905879974 0.917649984 0.929409981 0.941179991 0.952939987 0.964709997 0.976469994 0.988240004 1 1 1 1 1 1',
-                   'HotMetal2;0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1',
-                   'Smooth1;0 0.0156900007 0.0352899991 0.0509800017 0.0666700006 0.0862699971 0.101960003 0.117650002 0.137250006 0.152940005 0.168630004 0.188240007 0.203920007 0.219610006 0.239219993 0.254900008 0.270590007 0.286269993 0.30588001 0.321570009 0.337249994 0.356860012 0.372550011 0.38824001 0.407840014 0.423530012 0.439220011 0.458819985 0.474510014 0.490200013 0.509800017 0.525489986 0.541180015 0.560779989 0.576470017 0.592159986 0.61176002 0.627449989 0.643140018 0.662750006 0.678430021 0.69411999 0.713729978 0.729409993 0.745100021 0.760779977 0.780390024 0.796079993 0.811760008 0.831369996 0.847060025 0.862749994 0.882350028 0.898039997 0.913730025 0.933329999 0.949020028 0.964709997 0.984309971 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.996079981 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.992160022 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.984309971 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.980390012 0.964709997 0.949020028 0.929409981 0.913730025 0.898039997 0.882350028 0.862749994 0.847060025 0.831369996 0.815689981 0.796079993 0.780390024 0.764710009 0.74901998 0.729409993 0.713729978 0.698040009 0.68234998 0.662750006 0.647059977 0.631370008 0.615689993 0.600000024 0.580389977 0.564710021 0.549019992 0.533330023 0.51372999 0.498039991 0.482349992 0.466670007 0.447059989 0.43136999 0.415690005 0.400000006 0.380389988 0.364710003 0.349020004 0.333330005 0.31764999 0.298040003 0.282350004 0.266669989 0.25097999 0.231370002 0.215690002 0.200000003 0.184310004 0.16471 0.149020001 0.133330002 0.117650002 0.0980399996 0.0823500007 0.0666700006 0.0509800017 0.0313699991 0.0156900007 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0117600001 0.0196100008 0.0313699991 0.0392200015 0.0509800017 0.0588200018 0.0705899969 0.0823500007 0.0901999995 0.101960003 0.109800003 0.121569999 0.129409999 0.141179994 0.152940005 0.160779998 0.172549993 0.18039 0.192159995 0.203920007 0.211759999 0.223529994 0.231370002 0.243139997 0.25097999 0.26275 0.274509996 0.282350004 0.294120014 0.301959991 0.313730001 0.321570009 0.333330005 0.345099986 0.352939993 0.364710003 0.372550011 0.384310007 0.392159998 0.403919995 0.415690005 0.423530012 0.435290009 0.44314 0.454899997 0.466670007 0.474510014 0.48627001 0.494120002 0.505879998 0.51372999 0.525489986 0.537249982 0.545099974 0.55686003 0.564710021 0.576470017 0.584309995 0.596080005 0.600000024 0.607840002 0.61176002 0.615689993 0.619610012 0.627449989 0.631370008 0.635290027 0.643140018 0.647059977 0.650979996 0.658819973 0.662750006 0.666670024 0.674510002 0.678430021 0.68234998 0.686269999 0.69411999 0.698040009 0.701960027 0.709800005 0.713729978 0.717649996 0.725489974 0.729409993 0.733330011 0.73724997 0.745100021 0.74901998 0.752939999 0.760779977 0.764710009 0.768630028 0.772549987 0.780390024 0.784309983 0.788240016 0.796079993 0.800000012 0.803919971 0.811760008 0.815689981 0.81961 0.827449977 0.831369996 0.835290015 0.839219987 0.847060025 0.850979984 0.854900002 0.862749994 0.866670012 0.870589972 0.878430009 0.882350028 0.886269987 0.890200019 0.898039997 0.901960015 0.901960015 0.886269987 0.870589972 0.854900002 0.839219987 0.827449977 0.811760008 0.796079993 0.780390024 0.764710009 0.74901998 0.733330011 0.717649996 0.701960027 0.686269999 0.674510002 0.658819973 0.643140018 0.627449989 0.61176002 0.596080005 0.580389977 0.564710021 0.549019992 0.533330023 0.521570027 0.505879998 0.490200013 0.474510014 0.458819985 0.44314 0.427450001 0.411760002 0.396079987 0.380389988 0.368629992 0.352939993 0.337249994 0.321570009 0.30588001 0.290199995 0.274509996 0.258819997 0.243139997 0.227449998 0.215690002 0.200000003 0.184310004 0.168630004 0.152940005 0.137250006 0.121569999 0.10588 0.0901999995 0.0745100006 0.0627499968 0.0470600016 0.0313699991 0.0156900007 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0;1 0.984309971 0.964709997 0.949020028 0.933329999 0.913730025 0.898039997 0.882350028 0.862749994 0.847060025 0.831369996 0.811760008 0.796079993 0.780390024 0.760779977 0.745100021 0.729409993 0.713729978 0.69411999 0.678430021 0.662750006 0.643140018 0.627449989 0.61176002 0.592159986 0.576470017 0.560779989 0.541180015 0.525489986 0.509800017 0.490200013 0.474510014 0.458819985 0.439220011 0.423530012 0.407840014 0.38824001 0.372550011 0.356860012 0.337249994 0.321570009 0.30588001 0.286269993 0.270590007 0.254900008 0.239219993 0.219610006 0.203920007 0.188240007 0.168630004 0.152940005 0.137250006 0.117650002 0.101960003 0.0862699971 0.0666700006 0.0509800017 0.0352899991 0.0156900007 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0',
-                   'Smooth2;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.600000024 0.600000024 0.600000024 0.600000024 0.600000024 0.600000024 0.600000024 0.600000024 0.666670024 0.666670024 0.666670024 0.666670024 0.666670024 0.666670024 0.666670024 0.666670024 0.733330011 0.733330011 0.733330011 0.733330011 0.733330011 0.733330011 0.733330011 0.733330011 0.800000012 0.800000012 0.800000012 0.800000012 0.800000012 0.800000012 0.800000012 0.800000012 0.866670012 0.866670012 0.866670012 0.866670012 0.866670012 0.866670012 0.866670012 0.866670012 0.933329999 0.933329999 0.933329999 0.933329999 0.933329999 0.933329999 0.933329999 0.933329999 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0666700006 0.0666700006 0.133330002 0.133330002 0.200000003 0.200000003 0.266669989 0.266669989 0.333330005 0.333330005 0.400000006 0.400000006 0.466670007 0.466670007 0.533330023 0.533330023 0.600000024 0.600000024 0.666670024 0.666670024 0.733330011 0.733330011 0.800000012 0.800000012 0.866670012 0.866670012 0.933329999 0.933329999 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.133330002 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.200000003 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.266669989 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.333330005 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.400000006 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.466670007 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.533330023 0.466670007 0.466670007 0.466670007 0.466670007 0.400000006 0.400000006 0.400000006 0.400000006 0.333330005 0.333330005 0.333330005 0.333330005 0.266669989 0.266669989 0.266669989 0.266669989 0.200000003 0.200000003 0.200000003 0.200000003 0.133330002 0.133330002 0.133330002 0.133330002 0.0666700006 0.0666700006 0.0666700006 0.0666700006 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0666700006 0.0666700006 0.133330002 0.133330002 0.200000003 0.200000003 0.266669989 0.266669989 0.333330005 0.333330005 0.400000006 0.400000006 0.466670007 0.466670007 0.533330023 0.533330023 0.600000024 0.600000024 0.666670024 0.666670024 0.733330011 0.733330011 0.800000012 0.800000012 0.866670012 1',
-                   'Smooth3;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1',
-                   'Smooth4;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1;0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.00780999986 0.0156199997 0.0234399997 0.03125 0.0390600003 0.0468799993 0.0546899997 0.0625 0.0703099966 0.0781200007 0.0859400034 0.09375 0.101559997 0.109379999 0.117190003 0.125 0.132809997 0.140619993 0.148440003 0.15625 0.164059997 0.171880007 0.179690003 0.1875 0.195309997 0.203119993 0.210940003 0.21875 0.226559997 0.234380007 0.242190003 0.25 0.257809997 0.265619993 0.273440003 0.28125 0.289059997 0.296880007 0.304690003 0.3125 0.320309997 0.328119993 0.335940003 0.34375 0.351559997 0.359380007 0.367190003 0.375 0.382809997 0.390619993 0.398440003 0.40625 0.414059997 0.421880007 0.429690003 0.4375 0.445309997 0.453119993 0.460940003 0.46875 0.476559997 0.484380007 0.492190003 0.5 0.507809997 0.515619993 0.523440003 0.53125 0.539059997 0.546880007 0.554690003 0.5625 0.570309997 0.578119993 0.585940003 0.59375 0.601559997 0.609380007 0.617190003 0.625 0.632809997 0.640619993 0.648440003 0.65625 0.664059997 0.671880007 0.679690003 0.6875 0.695309997 0.703119993 0.710940003 0.71875 0.726559997 0.734380007 0.742190003 0.75 0.757809997 0.765619993 0.773440003 0.78125 0.789059997 0.796880007 0.804690003 0.8125 0.820309997 0.828119993 0.835940003 0.84375 0.851559997 0.859380007 0.867190003 0.875 0.882809997 0.890619993 0.898440003 0.90625 0.914059997 0.921880007 0.929690003 0.9375 0.945309997 0.953119993 0.960940003 0.96875 0.976559997 0.984380007 0.992190003 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1',
-                   'RGB1;0 0.0117600001 0.0274500009 0.0431400016 0.0588200018 0.0745100006 0.0862699971 0.101960003 0.117650002 0.133330002 0.149020001 0.160779998 0.176469997 0.192159995 0.207839996 0.223529994 0.235290006 0.25097999 0.266669989 0.282350004 0.298040003 0.309799999 0.325489998 0.341179997 0.356860012 0.372550011 0.384310007 0.400000006 0.415690005 0.43136999 0.447059989 0.458819985 0.474510014 0.490200013 0.505879998 0.521570027 0.537249982 0.549019992 0.564710021 0.580389977 0.596080005 0.61176002 0.623529971 0.639219999 0.654900014 0.670589983 0.686269999 0.698040009 0.713729978 0.729409993 0.745100021 0.760779977 0.772549987 0.788240016 0.803919971 0.81961 0.835290015 0.847060025 0.862749994 0.878430009 0.894119978 0.909799993 0.921570003 0.937250018 0.952939987 0.968630016 0.984309971 1 0.984309971 0.968630016 0.952939987 0.937250018 0.921570003 0.901960015 0.886269987 0.870589972 0.854900002 0.839219987 0.823530018 0.803919971 0.788240016 0.772549987 0.756860018 0.741180003 0.721570015 0.705879986 0.690199971 0.674510002 0.658819973 0.643140018 0.623529971 0.607840002 0.592159986 0.576470017 0.560779989 0.541180015 0.525489986 0.509800017 0.494120002 0.478430003 0.462749988 0.44314 0.427450001 0.411760002 0.396079987 0.380389988 0.360780001 0.345099986 0.329409987 0.313730001 0.298040003 0.282350004 0.26275 0.247060001 0.231370002 0.215690002 0.200000003 0.18039 0.16471 0.149020001 0.133330002 0.117650002 0.101960003 0.0823500007 0.0666700006 0.0509800017 0.0352899991 0.0196100008 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0117600001 0.0274500009 0.0431400016 0.0588200018 0.0745100006 0.0901999995 0.10588 0.121569999 0.137250006 0.152940005 0.168630004 0.184310004 0.200000003 0.215690002 0.231370002 0.247060001 0.26275 0.278430015 0.294120014 0.309799999 0.325489998 0.341179997 0.356860012 0.372550011 0.38824001 0.403919995 0.419609994 0.435290009 0.450980008 0.466670007 0.482349992 0.498039991 0.51372999 0.529410005 0.545099974 0.560779989 0.576470017 0.592159986 0.607840002 0.623529971 0.639219999 0.654900014 0.670589983 0.686269999 0.701960027 0.717649996 0.733330011 0.74901998 0.764710009 0.780390024 0.796079993 0.811760008 0.827449977 0.843140006 0.858820021 0.87450999 0.890200019 0.905879974 0.921570003 0.937250018 0.952939987 0.968630016 0.984309971 1 0.984309971 0.968630016 0.952939987 0.937250018 0.921570003 0.905879974 0.890200019 0.87450999 0.858820021 0.843140006 0.827449977 0.811760008 0.796079993 0.780390024 0.764710009 0.74901998 0.733330011 0.717649996 0.701960027 0.686269999 0.666670024 0.650979996 0.635290027 0.619610012 0.603919983 0.588240027 0.572549999 0.55686003 0.541180015 0.525489986 0.509800017 0.494120002 0.478430003 0.462749988 0.447059989 0.43136999 0.415690005 0.400000006 0.384310007 0.368629992 0.352939993 0.333330005 0.31764999 0.301959991 0.286269993 0.270590007 0.254900008 0.239219993 0.223529994 0.207839996 0.192159995 0.176469997 0.160779998 0.145099998 0.129409999 0.113729998 0.0980399996 0.0823500007 0.0666700006 0.0509800017 0.0352899991 0.0196100008 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0117600001 0.0274500009 0.0431400016 0.0588200018 0.0745100006 0.0901999995 0.10588 0.117650002 0.133330002 0.149020001 0.16471 0.18039 0.196079999 0.211759999 0.223529994 0.239219993 0.254900008 0.270590007 0.286269993 0.301959991 0.31764999 0.333330005 0.345099986 0.360780001 0.37647 0.392159998 0.407840014 0.423530012 0.439220011 0.450980008 0.466670007 0.482349992 0.498039991 0.51372999 0.529410005 0.545099974 0.55686003 0.572549999 0.588240027 0.603919983 0.619610012 0.635290027 0.650979996 0.666670024 0.678430021 0.69411999 0.709800005 0.725489974 0.741180003 0.756860018 0.772549987 0.784309983 0.800000012 0.815689981 0.831369996 0.847060025 0.862749994 0.878430009 0.890200019 0.905879974 0.921570003 0.937250018 0.952939987 0.968630016 0.984309971 1 0.984309971 0.968630016 0.952939987 0.937250018 0.921570003 0.905879974 0.890200019 0.87450999 0.858820021 0.843140006 0.827449977 0.811760008 0.796079993 0.780390024 0.764710009 0.74901998 0.733330011 0.717649996 0.701960027 0.686269999 0.666670024 0.650979996 0.635290027 0.619610012 0.603919983 0.588240027 0.572549999 0.55686003 0.541180015 0.525489986 0.509800017 0.494120002 0.478430003 0.462749988 0.447059989 0.43136999 0.415690005 0.400000006 0.384310007 0.368629992 0.352939993 0.333330005 0.31764999 0.301959991 0.286269993 0.270590007 0.254900008 0.239219993 0.223529994 0.207839996 0.192159995 0.176469997 0.160779998 0.145099998 0.129409999 0.113729998 0.0980399996 0.0823500007 0.0666700006 0.0509800017 0.0352899991 0.0196100008 0',
-                   'RGB2;0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.31764999 0.321570009 0.325489998 0.329409987 0.333330005 0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.31764999 0.321570009 0.325489998 0.329409987 0.333330005 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.949020028 0.960780025 0.972549975 0.984309971 0.992160022 1;0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.31764999 0.321570009 0.325489998 0.329409987 0.333330005 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.952939987 0.964709997 0.976469994 0.988240004 1 0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.392159998 0.529410005 0.666670024 0.803919971 0.800000012 1;0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.313730001 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.470589995 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.627449989 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.784309983 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.941179991 0.952939987 0.964709997 0.976469994 0.988240004 1 0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.31764999 0.321570009 0.325489998 0.329409987 0.333330005 0.00392000005 0.00784000009 0.0117600001 0.0156900007 0.0196100008 0.0235300008 0.0274500009 0.0313699991 0.0352899991 0.0392200015 0.0431400016 0.0470600016 0.0509800017 0.0549000017 0.0588200018 0.0627499968 0.0666700006 0.0705899969 0.0745100006 0.078429997 0.0823500007 0.0862699971 0.0901999995 0.0941200033 0.0980399996 0.101960003 0.10588 0.109800003 0.113729998 0.117650002 0.121569999 0.125489995 0.129409999 0.133330002 0.137250006 0.141179994 0.145099998 0.149020001 0.152940005 0.156859994 0.160779998 0.16471 0.168630004 0.172549993 0.176469997 0.18039 0.184310004 0.188240007 0.192159995 0.196079999 0.200000003 0.203920007 0.207839996 0.211759999 0.215690002 0.219610006 0.223529994 0.227449998 0.231370002 0.235290006 0.239219993 0.243139997 0.247060001 0.25097999 0.254900008 0.258819997 0.26275 0.266669989 0.270590007 0.274509996 0.278430015 0.282350004 0.286269993 0.290199995 0.294120014 0.298040003 0.301959991 0.30588001 0.309799999 0.313730001 0.392159998 0.529410005 0.666670024 0.803919971 0.800000012 1',
-                   'Isophotes;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0.0470600016 0.0941200033 0.141179994 0.188240007 0.235290006 0.282350004 0.329409987 0.37647 0.423530012 0.470589995 0.517650008 0.564710021 0.61176002 0.658819973 0.705879986 0.725489974 0.745100021 0.764710009 1 1 1 0.843140006 0.862749994 0.882350028 0.901960015 0.921570003 0.941179991 0.960780025 0.980390012 1 0.996079981 0.996079981 0.996079981 0.996079981 0.992160022 0.992160022 0.992160022 0.992160022 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 1 1 1 0.988240004 0.988240004 0.988240004 0.988240004 0.988240004 0.992160022 0.992160022 0.992160022 0.992160022 0.996079981 0.996079981 0.996079981 0.996079981 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0.0313699991 0.0627499968 0.0941200033 0.125489995 0.156859994 0.188240007 0.219610006 0.254900008 0.286269993 0.31764999 0.349020004 0.380389988 0.411760002 0.44314 0.478430003 0.498039991 0.517650008 0.537249982 1 1 1 0.619610012 0.639219999 0.658819973 0.678430021 0.701960027 0.721570015 0.741180003 0.760779977 0.784309983 0.796079993 0.811760008 0.823530018 0.839219987 0.854900002 0.866670012 0.882350028 0.894119978 0.909799993 0.925490022 0.937250018 0.952939987 0.968630016 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.980390012 0.960780025 0.941179991 0.925490022 0.905879974 0.886269987 0.870589972 0.850979984 0.831369996 0.815689981 0.796079993 0.776470006 0.760779977 1 1 1 0.690199971 0.670589983 0.654900014 0.639219999 0.619610012 0.603919983 0.588240027 0.56862998 0.552940011 0.537249982 0.517650008 0.50195998 0.48627001 0.470589995 0.435290009 0.403919995 0.372550011 0.341179997 0.309799999 0.278430015 0.247060001 0.215690002 1 1 1 0.0901999995 0.0588200018 0.0274500009 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0.141179994 0.176469997 0.211759999 0.25097999 0.286269993 0.321570009 0.360780001 0.396079987 0.43136999 0.470589995 0.48627001 0.505879998 0.521570027 0.541180015 0.560779989 0.576470017 0.596080005 0.61176002 0.631370008 0.650979996 0.666670024 0.686269999 0.705879986 0.745100021 0.788240016 0.831369996 0.870589972 0.913730025 0.956860006 1;0 0 0 0 0 0.0392200015 0.078429997 0.117650002 0.156859994 0.196079999 0.235290006 0.278430015 0.31764999 0.356860012 0.396079987 0.435290009 0.474510014 0.517650008 0.55686003 0.596080005 0.635290027 0.674510002 0.717649996 1 1 1 0.878430009 0.917649984 0.956860006 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.960780025 0.941179991 0.921570003 0.901960015 0.882350028 0.862749994 0.843140006 0.823530018 0.803919971 0.784309983 0.764710009 0.745100021 0.725489974 0.705879986 0.654900014 0.607840002 0.560779989 0.51372999 0.466670007 0.419609994 0.372550011 0.325489998 1 1 1 0.137250006 0.0901999995 0.0431400016 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0470600016 0.0941200033 0.141179994 1 1 1 0.329409987 0.37647 0.423530012 0.470589995 0.517650008 0.564710021 0.61176002 0.658819973 0.705879986 0.725489974 0.74901998 0.772549987 0.796079993 0.815689981 0.839219987 0.862749994 0.886269987 0.905879974 0.929409981 0.952939987 0.976469994 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1',
-                   'Topography;0 0.0158699993 0.0317399986 0.0476099998 0.0634799972 0.0793500021 0.0952199996 0.111089997 0.126959994 0.142829999 0.158700004 0.174569994 0.190439999 0.206310004 0.222179994 0.238049999 0.253919989 0.269789994 0.285659999 0.301530004 0.317400008 0.333270013 0.349139988 0.365009993 0.380879998 0.396750003 0.412620008 0.428490013 0.444359988 0.460229993 0.476099998 0.491970003 0.507839978 0.523710012 0.539579988 0.555450022 0.571319997 0.587189972 0.603060007 0.618929982 0.634800017 0.650669992 0.666540027 0.682410002 0.698279977 0.714150012 0.730019987 0.745890021 0.761759996 0.777629972 0.793500006 0.809369981 0.825240016 0.841109991 0.856980026 0.872850001 0.888719976 0.904590011 0.920459986 0.93633002 0.952199996 0.968069971 0.983940005 0.99980998 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0.0158699993 0.0317399986 0.0476099998 0.0634799972 0.0793500021 0.0952199996 0.111089997 0.126959994 0.142829999 0.158700004 0.174569994 0.190439999 0.206310004 0.222179994 0.238049999 0.253919989 0.269789994 0.285659999 0.301530004 0.317400008 0.333270013 0.349139988 0.365009993 0.380879998 0.396750003 0.412620008 0.428490013 0.444359988 0.460229993 0.476099998 0.491970003 0.507839978 0.523710012 0.539579988 0.555450022 0.571319997 0.587189972 0.603060007 0.618929982 0.634800017 0.650669992 0.666540027 0.682410002 0.698279977 0.714150012 0.730019987 0.745890021 0.761759996 0.777629972 0.793500006 0.809369981 0.825240016 0.841109991 0.856980026 0.872850001 0.888719976 0.904590011 0.920459986 0.93633002 0.952199996 0.968069971 0.983940005 0.99980998 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1;0 0.0158699993 0.0317399986 0.0476099998 0.0634799972 0.0793500021 0.0952199996 0.111089997 0.126959994 0.142829999 0.158700004 0.174569994 0.190439999 0.206310004 0.222179994 0.238049999 0.253919989 0.269789994 0.285659999 0.301530004 0.317400008 0.333270013 0.349139988 0.365009993 0.380879998 0.396750003 0.412620008 0.428490013 0.444359988 0.460229993 0.476099998 0.491970003 0.507839978 0.523710012 0.539579988 0.555450022 0.571319997 0.587189972 0.603060007 0.618929982 0.634800017 0.650669992 0.666540027 0.682410002 0.698279977 0.714150012 0.730019987 0.745890021 0.761759996 0.777629972 0.793500006 0.809369981 0.825240016 0.841109991 0.856980026 0.872850001 0.888719976 0.904590011 0.920459986 0.93633002 0.952199996 0.968069971 0.983940005 0.99980998 0 0.0158699993 0.0317399986 0.0476099998 0.0634799972 0.0793500021 0.0952199996 0.111089997 0.126959994 0.142829999 0.158700004 0.174569994 0.190439999 0.206310004 0.222179994 0.238049999 0.253919989 0.269789994 0.285659999 0.301530004 0.317400008 0.333270013 0.349139988 0.365009993 0.380879998 0.396750003 0.412620008 0.428490013 0.444359988 0.460229993 0.476099998 0.491970003 0.507839978 0.523710012 0.539579988 0.555450022 0.571319997 0.587189972 0.603060007 0.618929982 0.634800017 0.650669992 0.666540027 0.682410002 0.698279977 0.714150012 0.730019987 0.745890021 0.761759996 0.777629972 0.793500006 0.809369981 0.825240016 0.841109991 0.856980026 0.872850001 0.888719976 0.904590011 0.920459986 0.93633002 0.952199996 0.968069971 0.983940005 0.99980998 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 1 0.99980998 0.983940005 0.968069971 0.952199996 0.93633002 0.920459986 0.904590011 0.888719976 0.872850001 0.856980026 0.841109991 0.825240016 0.809369981 0.793500006 0.777629972 0.761759996 0.745890021 0.730019987 0.714150012 0.698279977 0.682410002 0.666540027 0.650669992 0.634800017 0.618929982 0.603060007 0.587189972 0.571319997 0.555450022 0.539579988 0.523710012 0.507839978 0.491970003 0.476099998 0.460229993 0.444359988 0.428490013 0.412620008 0.396750003 0.380879998 0.365009993 0.349139988 0.333270013 0.317400008 0.301530004 0.285659999 0.269789994 0.253919989 0.238049999 0.222179994 0.206310004 0.190439999 0.174569994 0.158700004 0.142829999 0.126959994 0.111089997 0.0952199996 0.0793500021 0.0634799972 0.0476099998 0.0317399986 0.0158699993 0;0 0.0158699993 0.0317399986 0.0476099998 0.0634799972 0.0793500021 0.0952199996 0.111089997 0.126959994 0.142829999 0.158700004 0.174569994 0.190439999 0.206310004 0.222179994 0.238049999 0.253919989 0.269789994 0.285659999 0.301530004 0.317400008 0.333270013 0.349139988 0.365009993 0.380879998 0.396750003 0.412620008 0.428490013 0.444359988 0.460229993 0.476099998 0.491970003 0.507839978 0.523710012 0.539579988 0.555450022 0.571319997 0.587189972 0.603060007 0.618929982 0.634800017 0.650669992 0.666540027 0.682410002 0.698279977 0.714150012 0.730019987 0.745890021 0.761759996 0.777629972 0.793500006 0.809369981 0.825240016 0.841109991 0.856980026 0.872850001 0.888719976 0.904590011 0.920459986 0.93633002 0.952199996 0.968069971 0.983940005 0.99980998 0.99980998 0.983940005 0.968069971 0.952199996 0.93633002 0.920459986 0.904590011 0.888719976 0.872850001 0.856980026 0.841109991 0.825240016 0.809369981 0.793500006 0.777629972 0.761759996 0.745890021 0.730019987 0.714150012 0.698279977 0.682410002 0.666540027 0.650669992 0.634800017 0.618929982 0.603060007 0.587189972 0.571319997 0.555450022 0.539579988 0.523710012 0.507839978 0.491970003 0.476099998 0.460229993 0.444359988 0.428490013 0.412620008 0.396750003 0.380879998 0.365009993 0.349139988 0.333270013 0.317400008 0.301530004 0.285659999 0.269789994 0.253919989 0.238049999 0.222179994 0.206310004 0.190439999 0.174569994 0.158700004 0.142829999 0.126959994 0.111089997 0.0952199996 0.0793500021 0.0634799972 0.0476099998 0.0317399986 0.0158699993 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0',
-                   'CubeHelix;0 0.0080199996 0.01578 0.0232699998 0.03046 0.03737 0.0439600013 0.0502300002 0.0561800003 0.0617900006 0.0670600012 0.0719799995 0.0765499994 0.0807700008 0.0846199989 0.0881199986 0.0912500024 0.0940200016 0.0964400023 0.0984999985 0.100199997 0.101559997 0.102569997 0.103239998 0.103589997 0.103610002 0.103320003 0.102729999 0.101839997 0.100670002 0.0992399976 0.0975499973 0.0956100002 0.0934500024 0.0910800025 0.0885099992 0.0857599974 0.0828400031 0.0797799975 0.0765900016 0.0732899979 0.0698899999 0.0664199963 0.0628900006 0.0593300015 0.0557500012 0.052170001 0.0486100018 0.0450999998 0.0416399986 0.0382600017 0.0349900015 0.0318300016 0.02881 0.0259399991 0.0232500006 0.0207599998 0.0184700005 0.0164100006 0.0146000003 0.0130500002 0.0117699997 0.0107899997 0.0101199998 0.00977000035 0.0097500002 0.0100800004 0.0107800001 0.0118399998 0.0132900001 0.0151300002 0.0173799992 0.0200299993 0.0230999999 0.0265999995 0.0305199996 0.0348800011 0.0396800004 0.0449099988 0.0505999997 0.0567199998 0.06329 0.0702999979 0.0777600035 0.085649997 0.0939799994 0.102739997 0.111929998 0.121529996 0.131549999 0.141969994 0.152789995 0.163990006 0.175559998 0.1875 0.199790001 0.212420002 0.225370005 0.238639995 0.252189994 0.266030014 0.280129999 0.294479996 0.309049994 0.323839992 0.338809997 0.353960007 0.369269997 0.384710014 0.400269985 0.415919989 0.431650013 0.447430015 0.463239998 0.479070008 0.494890004 0.51068002 0.526419997 0.542089999 0.557669997 0.573140025 0.588479996 0.603670001 0.61868 0.63349998 0.648119986 0.662500024 0.676639974 0.690509975 0.704100013 0.717400014 0.730369985 0.743019998 0.755320013 0.767270029 0.778840005 0.790019989 0.800809979 0.811179996 0.821139991 0.830669999 0.839760005 0.84841001 0.856599987 0.864340007 0.871609986 0.878409982 0.884739995 0.890590012 0.895969987 0.900879979 0.905300021 0.909259975 0.912739992 0.915750027 0.918290019 0.920379996 0.922010005 0.923189998 0.923929989 0.924239993 0.924130023 0.923600018 0.92268002 0.921360016 0.919669986 0.91760999 0.915199995 0.912460029 0.909389973 0.906019986 0.902360022 0.89842999 0.894240022 0.889810026 0.885169983 0.880320013 0.87529999 0.870109975 0.864769995 0.859319985 0.853760004 0.84811002 0.842400014 0.836650014 0.830869973 0.825079978 0.819320023 0.813579977 0.807910025 0.802299976 0.796790004 0.791390002 0.786119998 0.781000018 0.776040018 0.771269977 0.766690016 0.762329996 0.75819999 0.754310012 0.750689983 0.74733001 0.744270027 0.74150002 0.739030004 0.736890018 0.735080004 0.73360002 0.732469976 0.73168999 0.731270015 0.731220007 0.731530011 0.732219994 0.733269989 0.734709978 0.736519992 0.738699973 0.741259992 0.744189978 0.747489989 0.751150012 0.755180001 0.759549975 0.764270008 0.769330025 0.77471 0.780420005 0.786430001 0.792739987 0.799329996 0.806190014 0.813319981 0.820680022 0.828270018 0.836080015 0.844079971 0.85224998 0.860589981 0.869069993 0.877680004 0.886389971 0.895179987 0.904039979 0.912949979 0.921880007 0.930809975 0.939729989 0.948620021 0.957449973 0.966189981 0.974839985 0.98338002 0.991770029 1;0 0.00135999999 0.00279000006 0.00431999983 0.00594000006 0.0076700002 0.00951000024 0.0114700003 0.0135700004 0.0157999992 0.0181799997 0.0207000002 0.0233900007 0.02623 0.0292499997 0.0324300006 0.0357999988 0.0393400006 0.043060001 0.0469699986 0.0510599986 0.0553499982 0.0598200001 0.0644799992 0.0693299994 0.0743599981 0.0795900002 0.0850000009 0.0905900002 0.096359998 0.102310002 0.108439997 0.11473 0.121179998 0.127800003 0.134570003 0.141489998 0.148550004 0.155739993 0.163059995 0.170499995 0.178059995 0.185719997 0.193470001 0.201320007 0.209240004 0.217230007 0.225280002 0.233380005 0.241520002 0.249689996 0.257880002 0.266079992 0.274280012 0.282480001 0.29065001 0.298790008 0.306890011 0.314949989 0.322939992 0.330859989 0.338690013 0.346439987 0.354090005 0.361629993 0.369040012 0.376329988 0.383489996 0.390489995 0.397350013 0.404040009 0.410560012 0.416900009 0.42306 0.429030001 0.434810013 0.440380007 0.445740014 0.450890005 0.455819994 0.460519999 0.465009987 0.469260007 0.473280013 0.477070004 0.480619997 0.483940005 0.487010002 0.489850014 0.492449999 0.494800001 0.496930003 0.498809993 0.500469983 0.501890004 0.503090024 0.50405997 0.504809976 0.50533998 0.505659997 0.505779982 0.505689979 0.505410016 0.504949987 0.504299998 0.503480017 0.502489984 0.501349986 0.500050008 0.498620003 0.497049987 0.495359987 0.493550003 0.491649985 0.489639997 0.487560004 0.485399991 0.483179986 0.48089999 0.478590012 0.476240009 0.473870009 0.471489996 0.469119996 0.46676001 0.464419991 0.462119997 0.459859997 0.45765999 0.455520004 0.453460008 0.451490015 0.449620008 0.447849989 0.446200013 0.444680005 0.443300009 0.442059994 0.440970004 0.440050006 0.439300001 0.438730001 0.438340008 0.438140005 0.438140005 0.438349992 0.438769996 0.439410001 0.440270007 0.441359997 0.442669988 0.444220006 0.446009994 0.448029995 0.450300008 0.452809989 0.455570012 0.458570004 0.461820006 0.465310007 0.46904999 0.473030001 0.47725001 0.481709987 0.486409992 0.491349995 0.496509999 0.501900017 0.507510006 0.513339996 0.519379973 0.525619984 0.532069981 0.538709998 0.545530021 0.552529991 0.559700012 0.567040026 0.574530005 0.58217001 0.589940012 0.597850025 0.605870008 0.614009976 0.622240007 0.630559981 0.638970017 0.647440016 0.655969977 0.66456002 0.673179984 0.681840003 0.690509975 0.699190021 0.707859993 0.716530025 0.725170016 0.733780026 0.742349982 0.750869989 0.759320021 0.76770997 0.776009977 0.78421998 0.792339981 0.80035001 0.808239996 0.816009998 0.823650002 0.831160009 0.83851999 0.845730007 0.852779984 0.859679997 0.866400003 0.872959971 0.879329979 0.885529995 0.891550004 0.897379994 0.903020024 0.908469975 0.913730025 0.918799996 0.923669994 0.928349972 0.93283999 0.937150002 0.94125998 0.945179999 0.948920012 0.952489972 0.955869973 0.959079981 0.96213001 0.965009987 0.967729986 0.970300019 0.972729981 0.975019991 0.977180004 0.979219973 0.981149971 0.982959986 0.984679997 0.986320019 0.987869978 0.989359975 0.990779996 0.992160022 0.993499994 0.994809985 0.996110022 0.997399986 0.998690009 1;0 0.00662000012 0.0135300001 0.0207199994 0.0281700008 0.0358700007 0.0437900014 0.0519200005 0.0602400005 0.0687299967 0.0773800015 0.0861599967 0.0950499997 0.104039997 0.113109998 0.122230001 0.131390005 0.140560001 0.149729997 0.158869997 0.167970002 0.17701 0.185959995 0.194810003 0.203539997 0.212119997 0.220550001 0.228809997 0.236870006 0.244719997 0.252339989 0.259719998 0.266849995 0.273699999 0.28027001 0.286549985 0.292510003 0.298150003 0.303469986 0.30844 0.313059986 0.317319989 0.321220011 0.324750006 0.327899992 0.330669999 0.333059996 0.33506 0.336670011 0.337900013 0.338730007 0.339179993 0.339240015 0.338919997 0.338230014 0.337159991 0.335720003 0.333929986 0.331779987 0.329290003 0.326469988 0.323320001 0.319860011 0.316100001 0.312050015 0.307720006 0.303140014 0.298299998 0.293240011 0.287959993 0.282480001 0.276820004 0.270999998 0.265029997 0.258929998 0.252719998 0.246419996 0.240050003 0.233620003 0.227170005 0.220699996 0.21424 0.20781 0.201429993 0.195109993 0.188889995 0.182769999 0.17678 0.170939997 0.165270001 0.159779996 0.154499993 0.149440005 0.14463 0.140080005 0.135800004 0.131819993 0.128150001 0.124799997 0.121799998 0.119149998 0.116870001 0.114969999 0.113470003 0.112379998 0.111699998 0.11146 0.111639999 0.112279996 0.113370001 0.114909999 0.116920002 0.119410001 0.122369997 0.125799999 0.129710004 0.134110004 0.13899 0.144339994 0.150179997 0.156489998 0.163279995 0.170540005 0.178259999 0.186430007 0.19506 0.204129994 0.213630006 0.223560005 0.233899996 0.244639993 0.255780011 0.267289996 0.279159993 0.291390002 0.303950012 0.316830009 0.33002001 0.343490005 0.357230008 0.371230006 0.385459989 0.399899989 0.414539993 0.429360002 0.444330007 0.459450006 0.474680007 0.490009993 0.505410016 0.52086997 0.536369979 0.551880002 0.567390025 0.582870007 0.59829998 0.613669991 0.62895 0.644119978 0.659160018 0.674059987 0.688799977 0.703350008 0.717700005 0.731830001 0.745729983 0.759370029 0.77275002 0.785839975 0.798629999 0.81111002 0.823260009 0.835080028 0.846539974 0.857649982 0.86838001 0.878729999 0.888689995 0.898249984 0.907410026 0.916149974 0.924480021 0.932399988 0.939880013 0.946950018 0.953580022 0.959789991 0.965579987 0.97092998 0.975870013 0.980379999 0.984480023 0.988170028 0.991460025 0.994350016 0.99684 0.998960018 1 1 1 1 1 1 1 1 1 1 1 0.998790026 0.997070014 0.995159984 0.993089974 0.990859985 0.988499999 0.986029983 0.983470023 0.980830014 0.978129983 0.975399971 0.972649992 0.969910026 0.967180014 0.96450001 0.961880028 0.959339976 0.956889987 0.954569995 0.952369988 0.950330019 0.948459983 0.946770012 0.945280015 0.944019973 0.942979991 0.942200005 0.941670001 0.941420019 0.94145 0.941789985 0.942430019 0.943390012 0.944679976 0.946309984 0.948279977 0.950600028 0.953270018 0.95630002 0.959699988 0.963460028 0.967589974 0.972090006 0.97694999 0.982169986 0.987760007 0.993700027 1']
-_casacolors = ascii.read(_casacolors_dat, delimiter=';')
-casacmap = {}
-for i in range(len(_casacolors)):
-    r = np.array(_casacolors['RED'][i].split(), dtype='float')
-    g = np.array(_casacolors['GREEN'][i].split(), dtype='float')
-    b = np.array(_casacolors['BLUE'][i].split(), dtype='float')
-    a = np.full_like(r, 1.)
-    rgba = np.vstack((r, g, b, a)).T
-    casacmap[_casacolors['CMAP_NAME'][i]] = ListedColormap(rgba)
+from base64 import b64decode
+from zlib import decompress
+
+from collections.abc import Mapping
+
+# CASA colormaps as a (15, 256, 3) little-endian float32 RGB table, zlib-compressed and base64-encoded.
+_casacolors_names = ('Rainbow1', 'Rainbow2', 'Rainbow3', 'Rainbow4', 'HotMetal1', 'HotMetal2', 'Smooth1', 'Smooth2', 'Smooth3', 'Smooth4', 'RGB1', 'RGB2', 'Isophotes', 'Topography', 'CubeHelix')
+_casacolors_size = 256
+_casacolors_lut = (
+    b'eNrtnQeYFcXS9w9RQCUKElSCSlgBlxz2TNeSQRAJC5Ik7JJBYAEJSzoEAZGgoIIYQEAJAiIgKgoSRRERyQYQJUiWC4pE9z3/U1PV'
+    b'TfB99Xku+N3vss/Td34Xe2dneqqqe7r+3RMIhCgQ/pn6cq7wkbltmrzKlPiAcvo9RZQP1HxY+Z2lpZXH5Kuo3G4sKT98rqryhYRH'
+    b'lHd89ZjytJhGyp1mN1Oulq21cr4h7ZSPHu2svL5xD+UJa55SblZ8AH3RbkiE8W+nzvdXLji+t3LzAt2VQ8s6KS97pK3yd3tbKmfp'
+    b'1VS5zG1xyl1eqav83MO1lD9dW0X52ONGOd/x8sqNQ6WUB9xVXHn6nMLKO4L3K1/Ycq9ydLucyu3PZ1V+dtydyqvyp1M++F5K5bIv'
+    b'XDDCQz7+RfnYgQPKZe78Vnl6ma+Ub2+5TrnRyA+VVy1cqJxh10zluOQpyp8UGq/8UL3hykdO9bDnqdRcueHEaspR+x9WXlkqt/IL'
+    b'I1Ir15u3xxO+XHuxMp0YqfzMveWUT61aFRQ+8XDuGGH875lSU4PCGXbd7wkHXkhSXjlnjnKq27Yrf98uWfnu+OxGeESWh5QXrIpV'
+    b'ztWjsXKVvF2Vm/wcUj6+8lnlGS+9pFyu2xvKJ6rNVx527/vK5X9brfzlpk3KbWbtUs458CflzQ1PKCc8dE554NAU6mePn0irnL/p'
+    b'HcqX1mVR/jT6buXnX71HuWu6Aso1ehdSzrKvqPL3tUsqv/9+OeWJ93vKLSZUVi53sYZyyg6PKm/a2kB5tmminDjvCeU6ORKU7x7W'
+    b'Ufn0iSeVP27aS3ny+n7K8SUGK+O4Nn6g8vmzfZQffjZROS5vV+V+S9orL6zRRvnAd82V0/dorGxS11dOmFJbeXTR6sorV8Uqn4mL'
+    b'Uc55pIxy3UHRyr2yPKQ8980HlTdXyKecanNu5cLx2ZVbns2kPGlMBuUP7kujHPYHY2Pwr8o9lh0xNtbuVa5+23ZjY+rnyhcfX6lc'
+    b'LbRE+d05c4yNka8ZGxcnKr+Tf7Sx8S9J+fMDbZ0495hy6ZEVnHh2v/KPhTI6ceuUxpI2E9d7Nj5NVX563hNOHEqrXHB1bPCPUrk1'
+    b'xuR54YJyhdviNH6UjH9RefmqVZ6NE8eVM35yuxMP8iu3vrec4/d1lCsMjHf8u59yhxMjjfXj54313VeN9dfZxvroYmP9coVywYsb'
+    b'lPds3Wqsz+1RLjzssLG+dUa5Z4k/bLwckVp9q9Wp9MpFWmRSPrPhLuXNpXIrvzzNjml63/6gsukbpZxrvx3THKhbRvmT5XZM80zB'
+    b'WDtOmlhNufgfdkyToXM95e077JjmnUrNlfsvsGOaqrnaK+d9uotyuB9UXteij/L4zwZcEWNe+mKw8qZWdnzzrzO9lAuN7qZc5x47'
+    b'vhm6KEH5rap2fPP97ibKKZ5saMcKKez4pvmLNZWfL2LHN8tWeMrH69vxTf5DJZWrJxVTHpjRjm/emFFAeWdZO765uPFu5RKt7Pim'
+    b'8Zk77Fhn1G3Ki/KkdNrkvPpojtEnjb33/cpf7N5t40GKzcqhImuNvZcPlB9PWmDsNc9QvuOLycZe21jl1XmGOdfQTfnE7ibO36ri'
+    b'nL+Y8tGNdzvnSak8d/dujR+1khYoL80zTDmYVMxzrjnojmncn9QLYoPC2/buU564JNoTNid6KC+ZMkV5w/IPlF/btVv53fPnlKs+'
+    b'e4cRrvvqPcpNFhRVXvtRUJnjk5yzifLswx2NPX8/5YwjRihPGjtWOeeLLzh/91XlbbNmKaebP1953NKlyllXfKxcc90659o2KZeJ'
+    b'xDP+Wf7tt8q0/yfl3kePKl84fVp5yMULys0iYyn/fp9Oo1zumfTKSTqWD8fI57MoP/5idmV+j9N2Vn5uej6y9/6A8pP6bhEILJpf'
+    b'VPn0omiybVJaecsH5ZU7fxxUXqBjjEDg1LqqymM+q0nOM1UeGnnv85/7tobKaXc/rvyGjnkCgf0/tFIueCBBedXPHZRTHe+i/Pov'
+    b'3ZX3aRwMBO4/11d5xcUBjh/477tjM2s/Ouj555TDPqGc88W7bL/1QXnbV/3YWrnSsGHKh5zx+ZORsYn/XvvRcuWpmzc759mnvOHX'
+    b'X5V7hQIa94ePtOPtSWPteHvmxKzKS6bkVF77+n3K/PyZ98+z/R8/c3/M/H5ZZX7OzElr7Bibn62OJ5QzfW37v3nb45RP7Lbj7Rx7'
+    b'7Xj73R/b2P77oH2/L3u0kx3zn+xm5w9O91QO/m77xV0Xkq7oF1123/v3Of3ilsiY3n/XVFsK0eSf4u1YfU8L5by77Nib75P50Bd2'
+    b'7L1zfTX73v8J2X7xwwrK1qfC48y3CirzM/N/1xk/x587p3F/1PffKy9YtcqOV996y9jfHaO8a08L5eEzH1C2sTpEHbfU81w/4P/P'
+    b'zPV8u4v8vt/ekfP673aRv8fM1yHvtauU+br996Rz55zfzXBdm+V2YR7nzDFxO/q/+4mdY+J2930u8jyutUd+fv6cVOS5+u9wkefN'
+    b'zHbAvMV552O7YWZ7utbWciUPVlsDb/i1tzLbMDPbdiBQ6o9BdMfBtsqX/Dkm8LZvmipLjKxzeSBN3VxXOdfGWsrp11VR3rfSKIvd'
+    b'gcXuwG3feViZ4wDzh/47H/6u9BvgDq/kUT70Ug5l6YtwXxyLmDv74zFwpWEplW2/F6Ki/zp1XbtO3rhRufAHH1zXxi8+b9/neoVC'
+    b'17V3js/Mg57PfF3b5zjvv5NF4v/VY6T/nW/5yt/3FdvPSvsz2/aT58Vs+1l5vsz83JnZHphtu4r9MLNdMds2Fjtktu0domY6xxW+'
+    b'tsi4jNk+hxDVmJBJecykbMr2+YSors53hajvG/nJXmdBZdsXh3zfZLbPM+T7NTP7PrPtZ0N+DGG2fWjIj0Whq8qVtnzg9z5qv52/'
+    b'Pah852o7j/D7/Np27nFxovLd1a1dV4ufqpwtYa5yvZ52HvLBd9cpL634tfIDD9p5gX858wLdE+y8QKXtl5XLnEql97L3s3TKPfrd'
+    b'aef6Utpx0fLOOZTfXmLnCM79YMdIeU/bOcmcx61vffOVHS+lnVZcuWFzOz+ZOa0dOy2cbv2vVlE7V5llnp1HyJLH5kZKh+y8Zd9v'
+    b'7ZzCjKi6Nr+RWF853SI7vlp66HFnDtOZa6CW1kfj7VjrSKitcpep1o/3vmPzKp+utj799hY7H5F1j/XvYT/bMVjolPX14ecG/ul4'
+    b'jP+b/957yo7N+FzM/DeY+W/7Y5vVdszG1+rnXqba8Rvfmz/Gi7fzqNwW/jxIDjunym3HzG3KzG3NzM+AmZ+NPzcYeWZ+XihPVcvz'
+    b'7LwrP3t/Xne6HQeyrfj5jeZ2foRti5ltzp+zPW7HimyjzGy7flstsXOzbOvM7AP+XGs/mxdin/HzPBFfYmYfY2bf8+eVIj7JzL7q'
+    b't2HEh5nZt/08TMTnmTkW+HO2kRjBzLHDb+dITGHmWMPMMYiZY5M/Nx6JWbdi2K0YdiuG3Yph/3/EsFvx7FY8uznx7J/5adIrFIN3'
+    b'LhxvNmNO459gzJf+E4zn/E8w5gyk3W8Wy7y0zFvdTMZ7uuQ7bibz3w/dVN7zSw8jcyY3m8XObiaLnaHNbyZL/MDxZrLED1zLzeRv'
+    b'D7WngadPeWj7m8nyvKVfvJnszoHfLMa8veSabiZfnY+4WYxcr+RTbiYjJwk7+ycYBc/7ZvK188u3yv/b5UoNEPd3gcDl1avCHAiK'
+    b'JkL0QZdXx3r1R4eCogcq9Ob0oGgl8Dvg+2bP8URDFP43b/uggCe5McmvIe4WejOfx9qd1EZ0Rsj54G+ITkjy0ivmFjbb9rb2/LGP'
+    b'ES1SuK7JOjzkiWao5pjRnmiGJK93x8G2RvRKiLuHp033/PhgcK2iH2q4cJEn+TnRNBV/7jmDexAdR8nPP/NES9Rxy5YIp5k5w0g+'
+    b'EfoO1oqE36XfWWiqHzvsia4I9yy6D9FGIefXKxSIxOR2Gz41GX39OjRGc0elM6IxEv3Uid27jeQxG+3da1iLgns8EL7HnEb0RqKx'
+    b'gk8enpYvwi+cPWsk/1/n8iWDNhXtkeiwlo1ITacXRUcY+Vu0teQdJZcKHZJotXY+l5nwDCJj4UnZaPL6qobbKgeV/LymEU2S6LmQ'
+    b'Bws/0wjPnZaXUm6Pi3DLGQVIdF7IP0sOF/ok1tUEAp+//RBy5REetLA4iRbsm3dLUOXjXY2Mi6VvPfJ+OcpxtneEX1tekUQvdn6F'
+    b'R3j2oluS3DHy56zbCdvbp9VJNGXIsz00aqQRncu50awdhoZJdBZ7tjYg0Z09v6MRtRk/3ojmBTYkeibJWSNHJ9o06F9YIxSx1XBf'
+    b'yWskkFsNTeX5pXuOdSbRryHPmuf11/3n24PKvzHdSM4Vtii6GNG4If8qeXP0iU86+uiYefOUrQ4uRLBd4dOLFtn1GIsXG6thWarc'
+    b'fNmy6+brWePkz4Wqng55zJXX1bAkrVmjbDV3IYJvCId98Lo6AavLCxHrqUTbssWuY1G9Xoga7LC68ry7djqaTKsFtZq+K/UJjRx9'
+    b'Ouu1fP2A6v5CBJ8U/vbQIeXZh+3co9UGhuj5E8eVW/1y8rrjN6sfRD7Xaufh29fTCrlaC/i8cK7kPxztREDng6wOMaSaDfBXw+2c'
+    b'6rKIDtvXUTxtdf2sSfPnNh0tbv3Rdm7W6hmv1DfNf/Z2u25grNX0Jjnrl9qMz6jMOXdfbxWOQcJWFxki1sIxc17enzd+4S5lq50M'
+    b'qaYlohmefPd1NVlWXxkK+6adoxZtjM31+zrq16yGmTV4vnY3okf31zRMt+sqWBvgr6VwtNDHZ9p1X1a/GVKtjmgJuJ8O2+rsQsT9'
+    b'cYgQQ0VvcWluEeL+lfUG3I+GCLFVdBjQgXK/GKLJC4oR938hQswVfQb0CdyfIT5EE/dbIUIsFt3GqsUlifuhsM0vKUXc37CegfuV'
+    b'sP2/V8bvP0IEzaGsS0Ds5v4gRNCcctxnDZ28ryGmcxwP0YiPYvx4Hba9j4MkGhvEeo6/rJ0QLSa0MHX9dQzoAzhuhv1odSUSjSa0'
+    b'jhwHQxFtFce7EEHfKtpN6GhEt4M+g+NUiGZtqEGytgrvt2X8dQ/oSzi+IHY94scR1g9yvEAcq+PHhbDtffmojquh+2I/DxH6HvZn'
+    b'1iGKTuXs1/V9/wy/Y4b7JPbDUEQ/JpoVaEXYr8IxJ9xXsf+wtlH0K9Dhsj9ENOok60PxXiNaluXfNvPtOETo29heWS/Jdhki6DxZ'
+    b'Y8y6FNhZxPZ+aBWxJ/DGfa0jdhNZuxPuC0XvAp3REX+tFzS/r/nrMNBHnl/B8/bQi7L2OBR592ENHGs58Tw43nZUrQz0MKJVRZ86'
+    b'1F9/Cu3wHn9t2NHjXSPtIvpQ0a1Cv8ea5BBBXyw6G/TBomHNdjrR1/MhVvck0Uehb8bfEx2OaKUW/vZU5PcjWv1wny26KeiURdua'
+    b'/nw/Eg0VjujDIzoo1buGbe/iAGX57yh491a9UPLg/3X8f9ux5BjLQ3QNgEmzKuhUU01/m8t57dqANLHK01K29pwclvKiPyY4vztN'
+    b'uV6KRU79VU79r5xz7nPqn3LqB+xaguTbjP3dTMpzAjmNrZ7PqV/I2HNGO/XLO/Vjnfo1nPM/5tRv4tRv7dTv4Jy/h1O/n1M/pDw/'
+    b'ebjzu6OU4wJjnfrPOfUnOeec4tR/1ak/3ak/0zn/bKf+fKf+Iqf+Euf8Hzj1P3bqr3Lqr3XOv8Gpv8mpv8Wpv805/26n/vdO/X1O'
+    b'/f3O+X926h936p9y6p9xzn/OqX/JqR8gsfudySlI7H5+cioSu48KRMY1vs2lI7H7ncnpSew+LnAHid1HBTBOEbvPTGL3O5OzkNj9'
+    b'/ORsJHYfFUCcFbvPSWL3O5Nzkdh9XOAeEruPCkTGEf495COx+53J+Unsfn7y/SR2HxVArlTsvjCJ3e9MLkJi93GBoiR2HxVAXBa7'
+    b'jyax+53JJUjsfn5yKRK7jwogtyp2X57E7ncmVyCx+7hAkMTuowIRDaNfP5bE7ncmVyKx+/nJVUjsPiqAOC52X5PE7ncm1yKx+7hA'
+    b'HRK7jwogLyt2X4/E7ncm1yex+/nJDUnsPioAnavYfRMSu9+Z3JTE7uMCLUjsPiqAuC9235rE7ncmtyGx+/nJCSR2HxXAnJzYfUcS'
+    b'u9+Z3InE7uMCXUnsPioAnbjYfQ8Su9+ZnEhi9/OTe5HYfVQA/YTYfT8Su9+Z3J/E7uMCA0nsPioQWS9ox88Ru0+O5Dlg9+wDIYLd'
+    b'sw+gn0jn+wDqp/d9IESwe/YB1M/o+wDqZ/Z9APWz+D6A82fzfQD1c/g+gPo5fR9A/Vy+D+D89/g+gPr3+T6A+vl8H0D9/L4P4Pz3'
+    b'+z6A+gV9H0D9wr4PoH4R3wdw/qK+D6B+cd8HUD/a9wHUL+H7AM5fyvcB1C/r+wDql/d9APUr+D6A8wd9H0B94/sA6sf6PoD6lXwf'
+    b'wPmr+D6A+tV9H0D9mr4PoH4t3wdw/jq+D6B+Xd8HUL+e7wOoX9/3AZy/oe8DqN/Y9wHUb+L7AOo39X0A52/h+wDqt/R9APVb+z6A'
+    b'+m18H8D5E3wfQP32vg+gfkffB1C/k+8DOH9X3wdQv5vvA6jfw/cB1E/0fQDn7+X7AOr38X0A9fv5PoD6/X0fwPkH+j6A+oN9H9Cx'
+    b'j46D4APC8AFhjv1SP51TP70yfMDWz+jUz+zUz+KcP5tTP4dTP6dTP5dz/nuc+vc59fM59fM757/fqV/QqV/YqV/EOX9Rp35xp360'
+    b'U7+Ec/5STv2yTv3yTv0KzvmDTn3j1I916ldyzl/FqV/dqV/TqV/LOX8dp35dp349p3595/wNnfqNnfpNnPpNnfO3cOq3dOq3duq3'
+    b'cc6f4NRv79Tv6NTv5Jy/q1O/m1O/h1M/0Tl/L6d+H6d+P6d+f+f8A536g/9U/y/z+niXkHl6vIPIHDzeZ2R+He9CMl+OdyqZC8f7'
+    b'mMxz451I5q3xTihz0nifkvlmvIvK/DHexWRuGO/DMu+Ld2mZx8U7uczR4n1e5l/xbihzq5hHkLlSvFfKPCjmMmSOE/MgMmeJ+RSZ'
+    b'j8RcjMw18lw199uYD5J5Qbwjy5wf5qFkDg/v1zI/h7kwmXvDPJrMpeHfZJ4MdWUODOeQOS2cW+ar8DdlLgrXInNLuEaZN8K1y5wQ'
+    b'7gn3Juuacc+y3pnfsTl3wes7AwG0Gb9Xc95D1o2hjXmtZyCAtsczkDWustYRz0rW8eIZ8hoUXtN9wt8/AM9c1k/CFvg9mfM/vNYz'
+    b'cl+erIeDTck6Odgar/XkNVb8Psz5KFm7yzb75+uz7Lr2EEmuCiw5Kf73fNddB2nXu1+5RkxyRpF3eV37HlIfiMyT7N2nbNfBhyij'
+    b'sz+R5HHwXi6+AZYcDVhyMWDJv4AlzwIWnwFLDgUsuRKw5EfAkgcBS+4DLDkOXsc3VlnyF2DJU4AlNwGWHARY/A0s+QW+l0XKkjsA'
+    b'S44ALH4Ilvl/sMz5g2VuHyxz+GDxT7DMz4NlTh5zITL3DpY5drD4LVjmz8EyZw6WuXGwzIeDxZ/BMr8NljltsMxdg2W+Gix+Dpa5'
+    b'6Ku1EzLnfPUaTIkFYJlnjqwV9eeZr16/KXPLYJlbjqwz9WOHu/YTLOuSOWdUWFniy9XrRmX/ALDEHTDP81275lTiERhzxcKYKxbG'
+    b'/LCwxCwwzwteq/eQWAbGnLCw7FVw9dpYWZ+NeCJ7GIAl9oFlXS1Y9jYAyzpvsMRHsOjywLI+FyxxEyx7IYAxxyss8RQs68vBmNcV'
+    b'lrXAYIm5YJ6zZJZ16mCJxVfrUjB/KywxGsxr85llPTIY87TCEsfBslYeLHszgCW+/5lGBfFcfhdxXv4W5kbl2tAvyL3gfHLv+PvS'
+    b'Vrh2aVvcqzwLtI08O7SlPGvUFdtAXbEl1BXbQ12xVdiU2DZsUHwBNiu+AxsXX4N/iG/Cn8SX4X+Se4K/ShyAf0vOC/9d8mX475Jf'
+    b'w3+X+IP/LmMLxCGJXcjpyVgEeQKJe4hzksdEjkFyoMhnSv4UcVRyr8hbSK4W/yaxGnFaxk/IA0ucR4yX8RbyKJLXRh5b+hH0IZJP'
+    b'R/5c+iD0P5LHRx8leX8cRTOAo+gNcJSxI/JJ0m9C+yBjTegmpM/FOEO0GdBuSH+NPlw0IRhniIYE/b/oTzBGkHECxhkyPr718/d/'
+    b'5L3hRrFoZW4Uu/sR3QgWTcmNYqvzuDHs7ol0I9jqIW4MW43Cv5fFRm8Ui43eKBYbvVEsNnqjWGz0RrHY6I1isdEbxWKvf5dxjr/C'
+    b'8u6Ce/o7jDb+KyzvH3jmf4dhg3+FZZwIn/g7DB/9K+zuiXYjWMbyN4plruZG8d/Zh+efZjseuZLtOOJKtv3/lWz77SvZ1Wq67Ooe'
+    b'XXY1hC67ejyXXW2by+IPV7PY8dVs7e9KtnZzJdvnfSX/2br7/4253a9lbvdr2e6DeyVzu1/L3O7Xst1H+0rmdr+Wud2vZbsP/5Xs'
+    b'7g3kMrf7tWz347uS7b571+p/bmmAbmmA/ts0QL69k9g754HZ3jkPzPbua4B8e09HYu+cB2Z75zww2zvngcXeM5PYO+eB2d45D8z2'
+    b'znlgsfecJPbOeWC2d84Ds737GiDf3vOR2DvngdneOQ/M9s55YLH3wiT2znlgtnfOA7O9cx5Y7D2axN45D8z2znlgtnfOA4u9lyex'
+    b'd84Ds71zHpjtnfPAYu+xJPbOeWC2d84Ds71zHljsvSaJvXMemO2d88Bs75wHFnuvR2LvnAdme+c8MNs754HF3puQ2DvngdneOQ/M'
+    b'9s55YLH31iT2znlgtnfOA7O9cx5Y7L0jib1zHpjtnfPAbO+cBxZ770Fi75wHZnvnPDDbO+eBxd77kdg754HZ3jkPzJo3XwMUEN0D'
+    b'/EB0D/AD0T1w3Nf9OzzRPcAPRPcAPxDdA8d91T14onuAH4juAX4gugeO+6J7WOWJ7gF+ILoH+IHoHjju63p0I7oH+IHoHuAHonvg'
+    b'uC+6h3xGdA/wA9E9wA9E98BxX3QPsUZ0D/AD0T3AD0T3wHFfdA+tjege4Aeie4AfiO6B477qHozoHuAHonuAH4jugeO+6B6eM6J7'
+    b'gB+I7gF+ILoHjvuie5huRPcAPxDdA/xAdA8c90X3sMiI7gF+ILoH+IHoHjjui+5hlRHdA/xAdA/wA9E9cNwX3cMWI7oH+IHoHuAH'
+    b'onvguC+6h31GdA/wA9E9wA9E98BxX3QPp4zoHuAHonuAH4ju4Zb+55b+55b+59b4/9b4/9b4/9YagFtrAP7b1wCI7t/aPY9/RPdv'
+    b'7Z7HP6L7t3bP4x/R/Vu75/GP6P6t3fP4R3T/1u55/CO6f2v3PP4R3b+1ex7/iO7f2j2Pf0T3b+2exz+i+7d2z+Mf0f1bu+fxj+j+'
+    b'rd3z+Ed0/9buefwjun9r9zz+Ed2/tXse/4ju39o9j39E92/tnsc/ovu3ds/jH9H9W7vn8Y/o/q3d8/hHdP/W7nn8I7p/a/c8/hHd'
+    b'v7V7Hv+I7t/aPY9/RPdv7Z7HP6L7t3bP4x/R/Vu75/GP6P6t3fP4R3T/1u55/CO6f2v3PP6Rcb9d+3Jr3H9r3P/fPO6//v4/wn/3'
+    b'G2CyFkD03MKyFuBqPY3sVRPRyus3aXhvH2HROEd0d/4+MbKfj7DdR421ZNfTvoh+WTRpwrKHSmSErN8V4X17hO2+JqyzV+3Rn3wP'
+    b'zO4pIt/wkGs+8G//HpjdJ4O1gsJ2fwv5Rgj/uN8Ds/tPBAJ2b4nwNc8upMxr9flHtJCie9Tn8n5Ze52+9lbWZgiLljZynfptJN5X'
+    b'R6/T18DiR7Su+BFNq2g7he03mQIB0aX6tqGMdf/Cf/XbYOIDEa2s+kCIxAfw7+IDqC8+gPOIthDnF80h/q5oEaF7FY0idK+iXYTu'
+    b'VTSN0L2K1hG6V8kLY28C0UairVTPH25D2csIbSsafuxjIXsQYa8E0e1jLw2xe+yzIHaPPTzE7qF1FbuH1lXsHlpXWRsD+xEdPjTp'
+    b'sn8O1qqI9h7adtn3BmtbJAeNNS+yXw2087IXDdbIiK4eunvZQwb73IiWHnvkyDoZ6FtFPw99q6yTgb5VdPLQt4qtQ8sqto49isTW'
+    b'sS5BbB17f4itY02D6IERN0QnjHgi+W60t+iK8RxEb4znIzpkPDfRJ+N5im4Z6zlUyz23sJFv3yE2yrfvEDPl23eIpaKvRoyV75VB'
+    b'yyr2jZy32De0rGLfWDMj377DOhjYsbs2Rmwd/y62jvpi6ziP2DrOL7aOvyu2juuReI/rlHiP65d4j/uSfcdwv7KmBe0g+4WhfWQd'
+    b'C++L0vaadWDuXl1of1kHhuci68DwvGSNCp6j7I2F5yv6CeTSZV0K1jvI3lVYHyH7UmE9haw/wZ4/siYM+6PImhPsNSRrwrDWQ+we'
+    b'ti52D1sXu4eti93D1sXuYeti97B1sXv0H7KGBP2K7G2E/kb2LUI/JHsSoX+SdSDQcst6D2i5ZV2Hq59C28iaDbSZrM1AW8oaDLSx'
+    b'rLVA25/3v/OKZ4J4I32zxHj02bIWAn25aEHQx8vaBvT9soYBe9lJjMc6KYnx2ENPYjw03OIDsHvxAdi9+ADsXnwAdi8+ALv/v77/'
+    b'ePW/u/XdvsLtQ9y+xf0epfudSvf7le53Ld3vXbrfwXS/j2m/Lcg+ICyxRnxA2Gpx2Ae0P1xS6rr9udX0yHfE+MfuPyXfj/RbSve9'
+    b'Yh8QtvttsQ/otek+X/LdSv6x+4uxDwjbfc3YB643hnLHVu6Yyx2LuWM091uu7jdeXQ2zxAfxAWH7nTn5dptc/zBliUtXj0/dcas7'
+    b'nnXHue74V/ZzFB8Qln0kxQeE7VrEK/Xwdh2jfNOUf+waSH+my9+rHX0d9vtEAaNvQAHL2gcwfh8FjP3FUMDoP1DAsm4CjL+Nwr+b'
+    b'L7LnJxh9DAqfJzay5gKM60bhc7b2UMDoh1DAWKuBAsY9o2CPLKzRRAGjr0Lh/S+neyhgtBcKGO8sKGD0Zyhg7HeGAkZbo4DR56KA'
+    b'0eehgLHWEwWM54QCRl+IAsYYEAWM/T5RwHjGKFg7hP4SBYxxIgoY60RRwLAPFDD6VBQwxpIoYOz3iQKGbaGA0e+iRPb5Do83UcBY'
+    b'Y4oChl2igNE3o4AxJkUBY60vChg2jYI4j/4bBYxxDgoY61NRwPAH6RfQx6OAMUZCAWONMQoYvoQCxjohFDDGVyhgvAOigOGHKGCs'
+    b'MUIBY2yGAsZ7IgoYPoyCPbiwPgkFjHEdChjvkihg+D8KGGubUMAYa6OAMT5EASN2oICxLgoFjPE4ChhjSxQw4g4KGGuqUMAYs6PI'
+    b'fp8oYMQsFPRNWI+FgnV1GNejYL8wjGlRsN4R8U50i9bvEQPY73EUv8dR/B5H8Xscxe9xFL/HUfweR/F7HMXvcRS/x1H8HkfxexzF'
+    b'73EUv8dR/B5H8Xscxe9xFL/HUfweR/F7HMXvcRS/x1H8HkfxexzF73EUv8dR/B5H8Xscxe9xFL/HUfweR/F7HMXvcRS/x1H8Hkfx'
+    b'exzF73EUv8dR/B5H8Xscxe9xFL/HUfweR/F7HMXvI+8ovt/jKH6Po/g9juL3OIrf4yh+j6P4PY7i9ziK3+Mofo+j+D2O4vc4it/j'
+    b'KH6Po/g9juL3OIrf4yh+j6P4PY7i9ziK3+Mofo+j+D2O4vc4it/jKH6Po/g9juL3OIrf4yh+j6P4PY7i9ziK3+Mofo+j+D2O4vc4'
+    b'it/jKH6Po/g9jtbv/zP7fvH7/9S+X/z+P7XvF7//T+37xe//U/t+rJfHnAQK9hDFnAEK9grF+xyK7C2Agn0e8P7trgX4d33/y+6f'
+    b'EgjI3vpXz/3LHvT8/lLzuvP3Ml959buYOwdv9/vm/e+vN49u96e+8j3UnQt3321lbb99X/7r301w5555f1d5h+19zdwCryX3v9U2'
+    b'PKQs+ytzDiOg39DjNgvp/jrCvC9SiOw7aIjse2qIbPv53+iO7Nke0jlQ/UafvyexzKUK8/u3fM/+D2XZV9jmIf76NyZ4/oCZ52BD'
+    b'JPPL+l3xyPyT/23AJaXs9/E+KK8s+/7avEJIv8N1ve+Zy/6+Mod+vW+b814TzHZ9DO8xISx7+tq8AjP2ChbmOaFrv3/Oc0h/53sc'
+    b'vC+wMO8PzGznmkK6j4bsmyxscyO8j7Mw3z+zzbeEdL8S2eda2OZwQrrHiv0eObPNF125B7q7P7u7d7y7Ds3dc9/9HoD77fa/0laS'
+    b'U7l6Pyabt1Qfuq7P2e/MX+lnss+4zSGGNEcgLHt/c35qt7L9Fs6VfiN7bdt83LV+YL/3Hv7dD+23Ku2332Xu7+p1cH9e2A5CZHNn'
+    b'19o42xMz25nci/3GJNtlSPdyud5aPOy5xP+NWWwZLLYMZt/hPYhk3hQse8KAZU+YyD5F/t41GM/KnDFY5pLBMlcK5v2/mW0O8v9u'
+    b'K9RHPkx+V3JDYLF3sOSSwO6eSzI/Cpb5UbB8mwAs3zVAO0hOFyx9F+/NFVB2v+ngfg/C/Q6F+80L15/cb3nYnHeIbH8b0hxiZF9x'
+    b'P8/4V2OW63Punmlu/vQ/cT3v1fx/x4+/FrP+qfjBOQL/PJEczbX9JfvStX2kGzPYP/2xxc/2G7Wyp/3V/Z/sXf93bMruj8cs34uI'
+    b'fPdhVxNl1nww2/FPyN+Djplzesw8fmTmHEKIrE8xs68xy3cV7LdOmOVbCravY5bvJ9jvhjDbZyXf+GDmfMu163o5P6P3rmz7gJB+'
+    b'00C+6SAs3yWQ7x2on0bGpH+u//kyxbCgLSk9KUtTVtES/m9aKg2boWVpyrVaCg3fryX8+0bKbZWzaqk0rICWpDUltYT/hpaTlRtq'
+    b'KTQ8QUubtb20hK9Dy9H8Y7TcVnmilgfip2oJX6uWljPmaUlas1jL5J+Wawnfj5avC3yh5WTlbVpuT/hOS/ietVSdeUxLm7VntAze'
+    b'f1FLuF1IyvdZ0mo5mj+DlvMlMmoJt52W7A1yaHkgPreWkj3v0xJuXy2PTSyopeWMKC1dFxfXEn4GWp7ZWlbL5J8qannrtNESfk5a'
+    b'1mStoeXrArW1/FDyMS3hZ6nlUoPHtdye0FxLrl6ttISft5aykzpoqTqzi5aGS7prCduElu7b+moZvH+AlrFnhmgR2xeG7aMOc0oP'
+    b'vwuG7eOcfh0Pf4vfv2Z4uAaus9bDtUXeiSP2nyDnMbiXyJqasO3jHvl3CxjcO7/LlISdy98yaCswbB9tyOdMMGjbyHtt2PbR5v71'
+    b'GDyLyPtI2PbxjPhvTTR4dmDYPp6pf80Gz5rfg2H/Uf41LDawDY7xy+Gbcl8GtgSG7cPG+Nq2GdgeGLYPm/Tv3cBWwbB92DBf8xkD'
+    b'2waL7fvtQ/j/YPx31ON7yUD4/ch7X/h8OK/fhoS/B8bfx3XwPeYmXF9kjiF8vbhuv50J9wPG/eE++d5h/5z/RXugXfxnQWgvMNoP'
+    b'7chtUpHQvmC0N9rdf16wtwjj+eA5cVvVhp1HGM8Tz9V/pvAv1n6Fnz/sgNuwOfyadV1he4Hd+M8d9857LYftC3bGbdsF1xxh2CPs'
+    b'0rcN/K0Iw35hx9zmA1An6Nq7O77h/xZS29dv2EfOpXU8O/cww6mzVpmvVc+j4xi+t5Davn2PL2mcv6XMbRdS2xfmttbrUeZnE1Lb'
+    b'F+ZnqdeszM8+pLZvxzfLnetZq8y2FVLbF2Zb1HtXZtsNqe0Ls61r+2g/zL4h95LBznmUyEhOGyqz78k95lZmX9V2VmbflnuPUuZY'
+    b'oM9CmWOHtElFZY41+ryUOTZJW9kxJccyfabKHPukDZvb98dIrNTnrsyxVdrWvp9yLFbbUObYLW0+QJlt345HrS+ESGI/WGJ/5F1p'
+    b'bS9lif2RuYeZdj5GYn9kT+nhCcoS+8ES+yPjtAZ2bkZiP1hiP1hiP1hiP1hiP1hiP38zq6KyxH7+lllJZYn9/I05u5+PxH7+9p/9'
+    b'9pzEfrDEfrDE/sieAZXtt/Yk9ke+pZXffuNPYn9kT5oUKZ02v2jfSdeeMbZtjxnbnvuNbcPvjG23bca21RfGts9aY9tkufN9Sfv9'
+    b'Son9fL8zjL3Hqcbe10Rj72WM3WcpxTDnmns515ngXFtD53qqONdQ0vm7BZy/ldU5f0r33j3nvjznmj3nepw6VZx/T+nWuc77uP2p'
+    b'3z5V8LbKiyu+dHx3TKZqQ4Pdd5eN+WX+E8Hl01cGPx8/Lubyx3ODsaPOBxvNWhPz6bpDwVpZcnnT4y7GdD2e1euQqbS346s8wQef'
+    b'KOWdX/Go9/bxmGCWeXFe4N723ntxLYPlV/bxht89yAt0Hxqst2ast7rxM16Fky8EO/Z/3YvtPMm7Y9Lc4Ozeizz69FUv4dVPgpPm'
+    b'rvFWdn7Tq7NvZ/B41h1e7KMLvMWv/RIs99bPXuV+S70GO1J7Hza84NX8cbmXZmZWL/ezac2Ecau8iwXye2dPZjKNh6333mkV7W1t'
+    b'kMu0XP6591pCrPf1wgJmTpkvvUceqO/FBYoarDVbuCzeu6dyGVM+81bv6zRPeXW6GjO4+zbv7owjvOoDa5g/Cm739l8a523sWs8M'
+    b'KLHdy/jIFO9Smaamx8vbvOyBmd73u9qYPG23egPuWug99GhnM+j5LV7sqA+9O8f3NNmKbvbaNlnv/Tg5yTxuvvAOj/rae6/kUFP7'
+    b'sw3exux7vTQXRphiX631nvv9qPfc9NHm/fhPvPLFznkdC4w1hUYv91LsTWnGDZlgPqr6nvfBpvRm4bKJ5tSMd7zVP2U2P6x90aSZ'
+    b'M9cbfG9Oc9/sKWZxwkyvblJe06X1K6b8d696pc4XNN8ce81kyfWSN25ycdO+1nQzqMAEr0WjsmZd3xmmzG2jvfhixpzpM8v03xQK'
+    b'P6fqZka1t0zq1L28HQXrmmE/zTb3NmvrparS2Lzw6FxTdlEj79nElmbXyHmmZp4a3pfvtDeXxr5tNiwv7z10sZtJ1Xq+WTo+yktT'
+    b'v6+JSbHAPL3sHu/jhUNMmm4LzIL6mbxv0o0wgbkLTLHWKb2ZMaPN3kULzJmUx4Pduo01x0cuMHlD24Pl33jODCy6wHzeZ2Xwri0v'
+    b'mOD0+WZf5nnBFBenhN+V3jbt604OLsr3mvnh3DxTtdvIYL5Kb5gsP8w1u0p3D7Zt8qZZMmWOefurRsEB7eeabIVmm992xgY3dFxg'
+    b'So1504z5LDr4Yut3zbvrZprmmx8M1qr9nvl+1xumWdZ8wecLfWjSrJ9m+q7MG9xy+mOTNO4181LBB4MNF64yD5V5xbz8enTwyybr'
+    b'wvc6xUy4VClY9+QGM/7+l8yjK5sG+yR+EbaXSWbr/r7BRns3G9xDqPX44PHSW02zj8aZX7PPCh7rtcMMXzXGlA2uCDZ4ZbdJtXiU'
+    b'MYe/CW6d+53pP3GEuSvNhWCXaXvNiLZDTaO9Gb1B/X80IxsNNENGFfDSlz8QvqenzNgz5byM3x0y2St2N6crPeZ5bY6YStM6mpiG'
+    b'Hb0anx8zxZPbmOjXh4bt6qT5qE1z0/P8BO+byqfMg5vizMzYad6a+qfNvCp1TdVO73hPV/7VHN1Yw7zUb5W3LdtZ06ZrJdO001bv'
+    b'0qe/m0yFY8z4mINe66bnzddpypgPDpzzpn15wRzM8LC5/b20pmOBS2ZMsIh5sXUW82Tjy6bla/ebi73vMa8++YehMveZ5OOFTNq2'
+    b'yebLtLlM4NNS5sv7ArQ/FzSNsWbPgAAVSMxkVr1YxwzbGKDCmW43b4xoarJlSEFbL6Y17Ta0NxVjUtDqCqnM7S17m7NPpKAHJid7'
+    b'd+Qdan7pmYJq9Dzv5Sgz2mxKSkFHU//qlXpygjnUOwWNafqLl/3Tl8y4+BTU9qlj3pcxr5sOVVPQ2fjDXvPNb5rNuVLQwEKHvKH9'
+    b'FpgsBwJ0bs0Bjyq+Zx6eGaAHqh3wfsu8wvRvEqDhMw94y86tMzVSBSjjmYNe9KlNJm/tZDO6+GGv75ntpvGgP8wvjY55MSn2mG3T'
+    b'LpvVvX7xxmY/aF5afMnEjPvV+6LYCTP2w4sm72sXvHk1fzM5F18w738dMBXiL5u+b5w3S7amNic+SklNR54zBeLSmz5r01LLhN9N'
+    b'u4YZTadPM9DI8mfNni+zhf89I61K/5v5/LNcpu6HWemjHWfMUZPPTH8rB9097XT43bCQuW9Mbrq/w79MhhnFzZY299GQ6FNm4zNl'
+    b'TcZiBeihiyfNsJ+NKXHsQXrqsxPmqxU1zNSXi9AfU4+b3rfVNzXKF6P1PY+ZbaubmSrro6lTg6Pm6PG25hCVpmMVjpgBw7ubUbPL'
+    b'0ZGHDpvDw5LMqPMVaUmRn83Lvw0zE8oamlL6kAl+O9rMblGJptQ5aDKdHG++6lKV4nofMFlLvGgyxdegXAv2m8bTXjGrzCNU/txP'
+    b'5tlyM8xPKR6lRY1+MvHn5pjBcx+jrZ/+aI7vecfElG1Awbo/mm8PLTMb34qjk8f2hd8TV5rhFxpT+Tf2mVTN15v2JZpS7m77zLuf'
+    b'bDL3P9Kc9jfcZ14y201CtScinG3Hd2ZH/lbUqfs+U2HIfpP0Q2vq89Y+k847ZhoMjqemF/aZyunPmPcuJ1DWLj+G35EvmEdatqNT'
+    b'53+M2E3W6e1p1ps/mY8fT0MrV3egzT32m2cfS09V1nekrs0PmJQ176S4uZ0ouu1B0z82C03p1pk+HHfInCubnTJm70LLdv5soqNy'
+    b'UdrXu1D/2CMmKde99E26rrTo86Nmb8r8VLxxV5rf67i54+ADtGBkV7rXO2mWrSwcfiZdqUGhU6bkhKL0+aSudDn6tCnZKJruTAzX'
+    b'afar+SRjaVpTuiu9O+Osif6oHMXu7UIfZThvyjaNocHdu1DFiRdNkcOGBh3uTBPK/mGyta9MYx/pTE8PDNDprdXo4kudqNjxFPRV'
+    b'0Vr02ZcdKbZzKkrdqw6dONWBcpxNTYdnPUZZUnSgdBPS0kOrG9Cw5Ha0okw62ryhEYVtgg4dTk+7lzWhyRsT6LvZt9OZ8c0pNDWe'
+    b'Xul5JxWq25Jmt2hDoZqZqNevrWluttb0TJEsFD00gUZ90pLa35WNlp1pR8+3eYJyps9Oaet0pHaXmtNjae+mzaM7U+rnmtGSO3LR'
+    b'h/O60op7m1Kd3Hlo3bvdaNTsx2nNw/fShVd60OLijSlv7bxUv0tPOrgkjtp0zU9b7+1NieUb0phJ99OmpU/Rbyvr0xsrH6TY6L60'
+    b'oXo9eutEIdo7vh+V2FaXXskXRa9v7U+jEx6lkY2K0sMXkqjbhdqUZVxx+intQHpmyiMEH1h2biAVoVp03x8lqeGWQfT6LzWoXtky'
+    b'4Wc8mCbMq07Du5Wjw9FD6ExiNVo5qwLt/mgIbapWlVJ+w3suZipchd7KwO9F7XJVptQVeI1rn9yVaFM856nLF4ulWaOrRjhNfaLJ'
+    b'c3iN64DRhmat4fz16a0efbHzkQhnLeHRiv11/PnsIH19mNe4li4epHSHeJ6+7JcxtPzbBrR00ZDwODGGfv40ji7SEEpfL4ZobmPa'
+    b'vGYwDS8dQ2uHNqEHYwZTsEQMbXysGQXmDqJx1WLocrYW1DjjoHA8iKG2m56gPl0H0ovvx1DdpFb07roB9Gv2IK3P04YW3D2AJo0N'
+    b'Us7F8bS8fRIl5vFoWrAtbVnSn8qt9Wjx8nY0ObkfBYcbalC0Q/hZ96OhzYkGPd+R7nm5L7WsHRuZi+5/pA8lNaxESWW70HqvD+1N'
+    b'rEwzn+pKdSc/RaVmV6Emc56klWd705bTVWnq5m60pGVvatewOmU+0p2e3tyLXvm8BnU+24O21+wVPk8tqv97IlXf3JNS/usR6nq8'
+    b'Jz3dqicdmF6H4nf2oh8uJ1K/+Lphu+lNtd9ODNt1Pao68qlw3EykHDkbhO23D6UpnUhD08fRwQx9qVaWRHo8fWMqtKIv/RxIpOnZ'
+    b'm9CL7frR3pSJlLFYM9qRuj8VzBX+98da0JGp/SlnlURqNaAl9SucRCmHJdLMd1pTkYVJNHZnIvU+Gk9vFh1ArSr1pBFR7cLvMvim'
+    b'SE+K6t4h3OYDaWSzXnT3+52o35CB4b/fO7IW+I6DA+muLb3puVrdaHH1QXRo4VP04MQetGbmIKr/Zh9au7tnRMdzYUnfcPs/Rakb'
+    b'D6YD3/ajik360t63B4ftLonundA/7M9DwrFhAH2xcgC90mgI7dozkGYdGEQF5w2hfAlXrgP+H1WyQV8=')
+
+
+class _Casacmap(Mapping):
+    def __init__(self, names):
+        self._names = tuple(names)
+        self._lut = None
+        self._cmap = {}
+
+    def lut(self, name=None):
+        if self._lut is None:
+            raw = decompress(b64decode(_casacolors_lut))
+            self._lut = np.frombuffer(raw, dtype='<f4').reshape((len(self._names), _casacolors_size, 3))
+        if name is None:
+            return self._lut
+        return self._lut[self._names.index(name)]
+
+    def __getitem__(self, name):
+        if name not in self._cmap:
+            if name not in self._names:
+                raise KeyError(name)
+            from matplotlib.colors import ListedColormap
+            rgba = np.ones((_casacolors_size, 4), dtype=float)
+            rgba[:, :3] = self.lut(name)
+            self._cmap[name] = ListedColormap(rgba, name=name)
+        return self._cmap[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __repr__(self):
+        return 'casacmap({})'.format(', '.join(self._names))
+
+
+casacmap = _Casacmap(_casacolors_names)
+
+
+_rgbalut = {}
+
+
+def _lut(cmap):
+    lut = np.empty((cmap.N+3, 4), dtype=np.uint8)
+    lut[:cmap.N] = cmap(np.arange(cmap.N), bytes=True)
+    lut[cmap.N:] = cmap(np.ma.array([-1, cmap.N, 0], mask=[False, False, True]), bytes=True)
+    return lut
+
+
+def rgbalut(cmap):
+    """
+    uint8 RGBA lookup table of a colormap (a Colormap, a casacmap name or a
+    matplotlib colormap name). The N colors are followed by the under, over
+    and bad colors. Tables of colormap names are built once and cached;
+    those of Colormap objects are built from the object on every call, since
+    a name does not identify their colors.
+    """
+    if not isinstance(cmap, str):
+        return _lut(cmap)
+    if cmap not in _rgbalut:
+        if cmap in casacmap:
+            _rgbalut[cmap] = _lut(casacmap[cmap])
+        else:
+            import matplotlib
+            _rgbalut[cmap] = _lut(matplotlib.colormaps[cmap])
+    return _rgbalut[cmap]
+
+
+def colorize(data, cmap, vmin=None, vmax=None, norm=None, out=None, chunk=2**20):
+    """
+    Map a 2D array to a (ny, nx, 4) uint8 RGBA image through rgbalut(cmap).
+
+    The data are normalized by 'norm', or linearly between vmin and vmax
+    (the finite data range by default, found chunk by chunk), and quantized
+    straight to table indices in chunks of about 'chunk' pixels, so no float
+    RGBA copy of the image is made. The data are normalized in the
+    precision matplotlib uses, so the colors are those of cmap(norm(data)).
+    'out' is an optional preallocated uint8 buffer.
+    """
+    from matplotlib.colors import Normalize
+    from .imaging import _minmax
+    lut = rgbalut(cmap)
+    n = len(lut)-3
+    if type(norm) is Normalize:
+        vmin, vmax, norm = norm.vmin, norm.vmax, None
+    if norm is None and (vmin is None or vmax is None):
+        lo, hi, _ = _minmax(data, chunk)
+        vmin = lo if vmin is None else vmin
+        vmax = hi if vmax is None else vmax
+    if norm is None:
+        # float64 limits as in Normalize, which also sets the precision of the float32 operations
+        vmin, vmax = np.float64(vmin), np.float64(vmax)
+    if out is None:
+        out = np.empty(np.shape(data)+(4,), dtype=np.uint8)
+    # the precision of Normalize: float data keep theirs, small integers become float32
+    dtype = np.asarray(data[:0]).dtype
+    if np.issubdtype(dtype, np.integer) or dtype == np.bool_:
+        dtype = np.promote_types(dtype, np.float32)
+    elif dtype not in (np.float32, np.float64):
+        dtype = np.float64
+    step = max(1, int(chunk//max(1, np.shape(data)[1])))
+    for i in range(0, np.shape(data)[0], step):
+        if norm is None:
+            x = np.array(data[i:i+step], dtype=dtype)
+            x -= vmin
+            if vmax > vmin:
+                x /= vmax-vmin
+            else:
+                x[~np.isnan(x)] = 0.
+        else:
+            x = np.ma.filled(norm(np.asarray(data[i:i+step])), np.nan).astype(dtype, copy=False)
+        x *= n
+        with np.errstate(invalid='ignore'):
+            idx = np.clip(x, -1, n+1).astype(np.intp)
+            idx[x == n] = n-1
+            idx[x < 0] = n
+            idx[x > n] = n+1
+        idx[np.isnan(x)] = n+2
+        np.take(lut, idx, axis=0, out=out[i:i+step])
+    return out
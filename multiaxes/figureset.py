@@ -0,0 +1,103 @@
+import itertools
+from functools import partial
+
+import numpy as np
+
+
+def _layout(nx, ny, share, kwargs):
+    from .multiaxes import Multiaxes
+    mx = Multiaxes(nx=nx, ny=ny, **kwargs)
+    if share is not None:
+        mx.shareaxes(pad=share)
+    return mx
+
+
+def _shrunk(lay):
+    # compute_layout() scaled the panels down to fit the page height
+    return lay['xs'].sum() < lay['remain_width']*(1.-1e-9)
+
+
+def pagegrid(n=None, panel=None, nx=None, ny=None, share=None, **kwargs):
+    """
+    (nx, ny) of a figure-set page for panels at least 'panel' inch wide.
+
+    Without 'nx', it is the most columns whose panels are still 'panel'
+    wide on the page width of 'col'. Without 'ny', it is the most rows that
+    fit in the page height without shrinking the panels, and no more than
+    the 'n' items need. kwargs are the Multiaxes() arguments other than
+    nx and ny.
+    """
+    if nx is None:
+        if panel is None:
+            raise ValueError("'panel' or 'nx' is needed.")
+        nx = 1
+        while _layout(nx+1, 1, share, kwargs).compute_layout()['xs'][0] >= panel:
+            nx += 1
+            if n is not None and nx >= n:
+                break
+    if ny is None:
+        ny = 1
+        rows = None if n is None else -(-n//nx)
+        while (rows is None or ny < rows) and not _shrunk(_layout(nx, ny+1, share, kwargs).compute_layout()):
+            ny += 1
+    return nx, ny
+
+
+def _plotpage(plot_fn, fig, ax, cax, page):
+    # one page: plot_fn(ax, cax, item) per item, top-left panel first, unused panels hidden;
+    # the axes are those of the previous page of the process, cleared
+    items = page[1]
+    axes, caxes = np.ravel(ax), np.ravel(cax)
+    for k, a in enumerate(axes):
+        if k < len(items):
+            plot_fn(a, caxes[k], items[k])
+        else:
+            a.set_visible(False)
+            if caxes[k] is not None:
+                caxes[k].set_visible(False)
+
+
+def figureset(items, plot_fn, outdir, panel=None, nx=None, ny=None, share=None, fname='f{:d}.pdf', start=1,
+              workers=None, style=True, savekw=None, **kwargs):
+    """
+    Split 'items' over numbered pages of an AAS figure set.
+
+    plot_fn(ax, cax, item) draws one item in one panel and must be picklable
+    with workers > 1. The page grid comes from pagegrid() and every page is
+    rendered from the same layout by Multiaxes.render_many, each worker
+    drawing the page once and clearing it for the next page; only the last
+    page can have fewer rows and empty (hidden) panels. 'fname' is formatted
+    with the page number, counted from 'start'. kwargs are the Multiaxes()
+    arguments other than nx and ny. 'items' can be any iterable and is read
+    one page at a time. Returns a generator of (page, filename, error) in
+    completion order.
+    """
+    n = len(items) if hasattr(items, '__len__') else None
+    nx, ny = pagegrid(n, panel, nx, ny, share, **kwargs)
+    size = nx*ny
+    items = iter(items)
+    savekw = savekw or {}
+    rest = []
+
+    def pages():
+        # full pages; a last, partial page is kept for a layout with fewer rows
+        for page in itertools.count():
+            chunk = list(itertools.islice(items, size))
+            if len(chunk) == size:
+                yield page, chunk
+            else:
+                if chunk:
+                    rest.append((page, chunk))
+                return
+
+    def path(index, page):
+        return fname.format(page[0]+start)
+
+    plot = partial(_plotpage, plot_fn)
+    for out in _layout(nx, ny, share, kwargs).render_many(pages(), plot, outdir, workers, path, style, True, **savekw):
+        yield out
+    if rest:
+        page, chunk = rest[0]
+        mx = _layout(nx, -(-len(chunk)//nx), share, kwargs)
+        for out in mx.render_many(rest, plot, outdir, 1, path, style, True, **savekw):
+            yield (page,)+out[1:]
@@ -0,0 +1,157 @@
+import warnings
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+from .buildcache import fingerprint
+
+_reducers = {'mean': np.nanmean, 'min': np.nanmin, 'max': np.nanmax}
+
+# contourpaths() results, least recently used first
+_contours = OrderedDict()
+_contourlock = threading.Lock()
+contourcache_size = 32
+# fingerprints of in-memory arrays by id, with a weak reference and the buffer they were taken of
+_fingerprints = {}
+
+
+def blockreduce(data, factor, method='mean', chunk=2**22):
+    """
+    Reduce a 2D array by (fy, fx) pixel blocks with 'mean', 'min' or 'max'.
+
+    'data' can be any array that supports row slicing (e.g. np.memmap or an
+    HDF5 dataset). It is read in strips of about 'chunk' pixels, so only one
+    strip is in memory at a time. Partial blocks on the upper edges are
+    reduced over their valid pixels and NaNs are ignored.
+    """
+    if np.isscalar(factor):
+        factor = (factor, factor)
+    fy, fx = int(factor[0]), int(factor[1])
+    if method not in _reducers:
+        raise ValueError("'method' should be in {}".format(list(_reducers)))
+    reduce = _reducers[method]
+    ny, nx = data.shape
+    by, bx = -(-ny//fy), -(-nx//fx)
+    out = np.empty((by, bx), dtype=float)
+    step = max(1, int(chunk//(fy*nx)))
+    with warnings.catch_warnings():
+        # all-NaN blocks give NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for b0 in range(0, by, step):
+            b1 = min(by, b0+step)
+            strip = np.full(((b1-b0)*fy, bx*fx), np.nan)
+            rows = np.asarray(data[b0*fy:b1*fy])
+            strip[:rows.shape[0], :nx] = rows
+            out[b0:b1] = reduce(strip.reshape(b1-b0, fy, bx, fx), axis=(1, 3))
+    return out
+
+
+def _strips(data, chunk):
+    # float copies of consecutive slabs along the first axis, each about 'chunk' elements
+    shape = np.shape(data)
+    if len(shape) == 0:
+        yield np.asarray(data, dtype=float).reshape(1)
+        return
+    step = max(1, int(chunk//max(1, int(np.prod(shape[1:])))))
+    for i in range(0, shape[0], step):
+        yield np.asarray(data[i:i+step], dtype=float)
+
+
+def _minmax(data, chunk):
+    lo, hi, n = np.inf, -np.inf, 0
+    for strip in _strips(data, chunk):
+        strip = strip[np.isfinite(strip)]
+        if strip.size:
+            lo, hi, n = min(lo, strip.min()), max(hi, strip.max()), n+strip.size
+    return lo, hi, n
+
+
+def _histogram(data, bins, lo, hi, chunk):
+    hist = np.zeros(bins, dtype=np.int64)
+    for strip in _strips(data, chunk):
+        hist += np.histogram(strip[np.isfinite(strip)], bins, (lo, hi))[0]
+    return hist
+
+
+def sharedlimits(arrays, percentile=None, bins=4096, chunk=2**22, workers=None):
+    """
+    Common (vmin, vmax) of several arrays, read in chunks and in parallel.
+
+    Without 'percentile' the limits are the global finite minimum and maximum.
+    With percentile=(lo, hi) they are approximated from a global histogram of
+    'bins' bins, within one bin width. Arrays can be memory-mapped; only one
+    chunk of about 'chunk' elements per worker thread is held at a time.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    arrays = list(arrays)
+    with ThreadPoolExecutor(workers) as pool:
+        stats = list(pool.map(lambda a: _minmax(a, chunk), arrays))
+        lo = min(s[0] for s in stats)
+        hi = max(s[1] for s in stats)
+        if not np.isfinite(lo):
+            raise ValueError('No finite values to set the limits.')
+        if percentile is None or hi <= lo:
+            return float(lo), float(hi)
+        hist = sum(pool.map(lambda a: _histogram(a, bins, lo, hi, chunk), arrays))
+    cdf = np.concatenate(([0], np.cumsum(hist)))
+    edges = np.linspace(lo, hi, bins+1)
+    vmin, vmax = np.interp(np.asarray(percentile, dtype=float)/100.*cdf[-1], cdf, edges)
+    return float(vmin), float(vmax)
+
+
+def _datakey(data):
+    # fingerprint() of 'data', hashed once per in-memory array
+    if type(data) is not np.ndarray:
+        return fingerprint(data)
+    ident = id(data)
+    buf = (data.__array_interface__['data'][0], data.shape, data.strides, data.dtype.str)
+    entry = _fingerprints.get(ident)
+    if entry is not None and entry[0]() is data and entry[1] == buf:
+        return entry[2]
+    key = fingerprint(data)
+    _fingerprints[ident] = (weakref.ref(data, lambda ref: _fingerprints.pop(ident, None)), buf, key)
+    return key
+
+
+def contourpaths(data, levels, factor=1, cache=True):
+    """
+    Contour lines of a 2D array as {level: matplotlib Path} in pixel
+    coordinates of 'data', one compound path per level.
+
+    With factor > 1 the lines are traced on blockreduce(data, factor) and
+    scaled back to the full pixel grid. Results are kept in a cache of the
+    last 'contourcache_size' (data, levels, factor), where 'data' is keyed
+    by multiaxes.fingerprint(), so repeated overlays of the same map are not
+    traced again. An in-memory array is hashed once and then recognized by
+    identity, so after changing its values in place pass cache=False or a
+    copy. The paths are shared; do not modify them.
+    """
+    import contourpy
+    from matplotlib.path import Path
+    levels = tuple(float(v) for v in np.atleast_1d(levels))
+    if np.isscalar(factor):
+        factor = (factor, factor)
+    fy, fx = int(factor[0]), int(factor[1])
+    key = (_datakey(data), levels, fy, fx)
+    if cache:
+        with _contourlock:
+            if key in _contours:
+                _contours.move_to_end(key)
+                return _contours[key]
+    img = blockreduce(data, (fy, fx)) if fy > 1 or fx > 1 else np.asarray(data, dtype=float)
+    gen = contourpy.contour_generator(z=np.ma.masked_invalid(img), line_type='ChunkCombinedCode', chunk_size=0)
+    paths = {}
+    for v in levels:
+        points, codes = gen.lines(v)
+        if points[0] is None:
+            paths[v] = Path(np.zeros((0, 2)))
+            continue
+        # block centres back to full-resolution pixel coordinates
+        points = points[0]*(fx, fy)+((fx-1)/2., (fy-1)/2.)
+        paths[v] = Path(points, codes[0], readonly=True)
+    if cache:
+        with _contourlock:
+            _contours[key] = paths
+            while len(_contours) > contourcache_size:
+                _contours.popitem(last=False)
+    return paths
@@ -0,0 +1,100 @@
+import numpy as np
+from functools import lru_cache
+
+
+def _isum(a, n):
+    # a[:i+1].sum() for i in range(n)
+    return np.cumsum(a)[:n]
+
+
+def _esum(a, n):
+    # a[:i].sum() for i in range(n)
+    return np.concatenate(([0.], np.cumsum(a)))[:n]
+
+
+def compute_layout(col, xr, yr, xl, yl, xp, yp, tp, cw, cl, cp, mg, sc, cb='t', page=(7.3, 3.485, 8.)):
+    """
+    Solve the Multiaxes geometry without matplotlib.
+
+    All lengths are in inch, 'page' is the (full width, column width, height)
+    of the journal page. Returns a dictionary with the figure size and the
+    (ny, nx, 4) arrays 'ax' and 'cax' of [x0, y0, width, height] rectangles in
+    figure fraction, where row 0 is the bottom row. Panels without a color bar
+    have a zero-size 'cax' rectangle.
+    """
+    xr, yr, xl, yl, xp, yp, tp, cw, cl, cp, mg = [np.asarray(a, dtype=float)
+                                                  for a in (xr, yr, xl, yl, xp, yp, tp, cw, cl, cp, mg)]
+    nx, ny = len(xr), len(yr)
+    apj_width, apj_col, apj_height = page
+    if col == 1:
+        fig_width = apj_col*sc
+    elif col == 2:
+        fig_width = apj_width*sc
+    else:
+        fig_width = apj_col*col*sc
+    page_height = apj_height*sc
+    cbout = cw.sum()+cl.sum()+cp.sum()
+    if cb == 't':
+        outx = yl.sum()+xp.sum()+mg[[0, 2]].sum()
+        outy = xl.sum()+yp.sum()+tp.sum()+cbout+mg[[1, 3]].sum()
+    else:
+        outx = yl.sum()+xp.sum()+cbout+mg[[0, 2]].sum()
+        outy = xl.sum()+yp.sum()+tp.sum()+mg[[1, 3]].sum()
+    remain_width = fig_width-outx
+    xs = xr/xr.sum()*remain_width
+    ys = xs[0]/yr
+    remain_height = page_height-outy
+    if ys.sum() > remain_height:
+        xs *= remain_height/ys.sum()
+        ys *= remain_height/ys.sum()
+        fig_width = xs.sum()+outx
+    fig_height = ys.sum()+outy
+
+    # left and bottom edges of the panels
+    x0 = mg[0]+_isum(yl, nx)+_esum(xs, nx)+_esum(xp, nx)
+    y0 = mg[1]+_isum(xl, ny)+_esum(ys, ny)+_esum(tp, ny)+_esum(yp, ny)
+    if cb == 't':
+        y0 += _esum(cw, ny)+_esum(cl, ny)+_esum(cp, ny)
+    else:
+        x0 += _esum(cw, nx)+_esum(cl, nx)+_esum(cp, nx)
+    axpos = np.zeros((ny, nx, 4), dtype=float)
+    axpos[..., 0] = x0[np.newaxis, :]
+    axpos[..., 1] = y0[:, np.newaxis]
+    axpos[..., 2] = xs[np.newaxis, :]
+    axpos[..., 3] = ys[:, np.newaxis]
+
+    # color bars sit above (top) or beside (right) their panels, after the pad
+    caxpos = np.zeros((ny, nx, 4), dtype=float)
+    if cb == 't':
+        caxpos[..., 0] = x0[np.newaxis, :]
+        caxpos[..., 1] = (y0+ys+cp)[:, np.newaxis]
+        caxpos[..., 2] = xs[np.newaxis, :]
+        caxpos[..., 3] = cw[:, np.newaxis]
+    else:
+        caxpos[..., 0] = (x0+xs+cp)[np.newaxis, :]
+        caxpos[..., 1] = y0[:, np.newaxis]
+        caxpos[..., 2] = cw[np.newaxis, :]
+        caxpos[..., 3] = ys[:, np.newaxis]
+    caxpos[~((caxpos[..., 2] > 0.) & (caxpos[..., 3] > 0.))] = 0.
+    axpos /= [fig_width, fig_height, fig_width, fig_height]
+    caxpos /= [fig_width, fig_height, fig_width, fig_height]
+    return {'outx': outx, 'outy': outy, 'remain_width': remain_width, 'remain_height': remain_height,
+            'xs': xs, 'ys': ys, 'figsize': (fig_width, fig_height), 'ax': axpos, 'cax': caxpos}
+
+
+def layoutkey(col, xr, yr, xl, yl, xp, yp, tp, cw, cl, cp, mg, sc, cb='t', page=(7.3, 3.485, 8.)):
+    # hashable, normalized form of the compute_layout() arguments
+    arrays = tuple(tuple(np.asarray(a, dtype=float).ravel().tolist()) for a in (xr, yr, xl, yl, xp, yp, tp, cw, cl, cp, mg))
+    return (col,)+arrays+(float(sc), cb, tuple(float(p) for p in page))
+
+
+@lru_cache(maxsize=256)
+def cached_layout(key):
+    """
+    compute_layout() memoized on a layoutkey(). The returned arrays are
+    read-only because they are shared by every hit.
+    """
+    lay = compute_layout(key[0], *key[1:12], sc=key[12], cb=key[13], page=key[14])
+    for k in ('xs', 'ys', 'ax', 'cax'):
+        lay[k].setflags(write=False)
+    return lay
@@ -0,0 +1,78 @@
+from functools import lru_cache
+
+# sample tick labels of panels without a tick label list, (x, y)
+_plainticks = (('0.0', '0.5', '1.0'), ('0.0', '0.5', '1.0'))
+_wcsticks = (('$5^\\mathrm{h}35^\\mathrm{m}30^\\mathrm{s}$',), ('$-5^\\circ20^\\prime$',))
+
+
+@lru_cache(maxsize=1)
+def _renderer():
+    # text metrics only; at 72 dpi one pixel is one point
+    from matplotlib.backends.backend_agg import RendererAgg
+    return RendererAgg(1, 1, 72)
+
+
+@lru_cache(maxsize=4096)
+def _textextent(s, fname, size, weight, mathfont, usetex):
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.cbook import is_math_text
+    prop = FontProperties(fname=fname, size=size, weight=weight)
+    ismath = 'TeX' if usetex else is_math_text(s)
+    w, h, d = _renderer().get_text_width_height_descent(s, prop, ismath)
+    # like matplotlib Text, a line is at least as high and deep as 'lp'
+    lp = _renderer().get_text_width_height_descent('lp', prop, False)
+    d1 = max(d, lp[2])
+    return float(w), float(max(h-d, lp[1]-lp[2])+d1), float(d1)
+
+
+def textextent(s, size=None, family=None, weight=None):
+    """
+    (width, height, descent) in points of a string in the current rcParams,
+    without drawing a figure. Lines are measured one by one, cached on the
+    resolved font file, size, weight and string.
+    """
+    import matplotlib
+    from matplotlib.font_manager import FontProperties, findfont
+    prop = FontProperties(family=family, size=size, weight=weight)
+    key = (findfont(prop), prop.get_size_in_points(), prop.get_weight(), matplotlib.rcParams['mathtext.fontset'],
+           bool(matplotlib.rcParams['text.usetex']))
+    lines = [_textextent(line, *key) for line in str(s).split('\n')]
+    if len(lines) == 1:
+        return lines[0]
+    # Text spaces the lines by 1.2 font sizes
+    return (max(w for w, h, d in lines), (len(lines)-1)*1.2*key[1]+lines[-1][1], lines[-1][2])
+
+
+def tickout(axis, rc=None):
+    # points outside the axes taken by the ticks of 'x' or 'y' and the tick label pad
+    import matplotlib
+    rc = matplotlib.rcParams if rc is None else rc
+    size, direction = rc[axis+'tick.major.size'], rc[axis+'tick.direction']
+    out = {'in': 0., 'out': size, 'inout': size/2.}[direction]
+    return out+rc[axis+'tick.major.pad']
+
+
+def labelextent(axis, ticks, label=None, rc=None, family=None):
+    """
+    Points outside the axes taken by the tick labels and the axis label of
+    'x' (height) or 'y' (width). 'rc' is a mapping read instead of the
+    global rcParams, 'family' the font family of the tick labels.
+    """
+    import matplotlib
+    rc = matplotlib.rcParams if rc is None else rc
+    ext = tickout(axis, rc)
+    if ticks:
+        if rc['axes.unicode_minus']:
+            ticks = [t if '$' in t else t.replace('-', '\N{MINUS SIGN}') for t in ticks]
+        sizes = [textextent(t, rc[axis+'tick.labelsize'], family) for t in ticks]
+        ext += max(s[1] for s in sizes) if axis == 'x' else max(s[0] for s in sizes)
+    if label:
+        # y labels are rotated, so their height is the width they take
+        ext += rc['axes.labelpad']+textextent(label, rc['axes.labelsize'])[1]
+    return ext
+
+
+def titleextent(title, rc=None):
+    import matplotlib
+    rc = matplotlib.rcParams if rc is None else rc
+    return rc['axes.titlepad']+textextent(title, rc['axes.titlesize'], weight=rc['axes.titleweight'])[1]
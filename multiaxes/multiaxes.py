@@ -1,24 +1,174 @@
+import os
+import sys
+import json
+import time
 import numpy as np
-from matplotlib import pyplot as plt
-from astropy.visualization.wcsaxes.core import WCSAxes
+from contextlib import contextmanager
 from warnings import warn
+from .layout import compute_layout, layoutkey, cached_layout
+from .imaging import blockreduce, sharedlimits, contourpaths
+from .colorbars import colorize
 
-plt.rcParams['xtick.direction'] = 'in'
-plt.rcParams['ytick.direction'] = 'in'
-plt.rcParams['xtick.top'] = True
-plt.rcParams['ytick.right'] = True
-plt.rcParams['xtick.major.size'] = 5
-plt.rcParams['ytick.major.size'] = 5
-plt.rcParams['xtick.minor.size'] = 3
-plt.rcParams['ytick.minor.size'] = 3
-# plt.rcParams['xtick.minor.visible'] = True
-# plt.rcParams['ytick.minor.visible'] = True
-plt.rcParams['xtick.labelsize'] = 'small'
-plt.rcParams['ytick.labelsize'] = 'small'
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = 'DejaVu Sans'
-plt.rcParams['mathtext.fontset'] = 'dejavusans'
-plt.rcParams['image.interpolation'] = 'nearest'
+# matplotlib style used for Multiaxes figures, applied to the axes made by drawfig() (see _styleaxes);
+# 'image.interpolation' is the default of Multiaxes.imshow() and channelmap()
+rcstyle = {
+    'xtick.direction': 'in',
+    'ytick.direction': 'in',
+    'xtick.top': True,
+    'ytick.right': True,
+    'xtick.major.size': 5,
+    'ytick.major.size': 5,
+    'xtick.minor.size': 3,
+    'ytick.minor.size': 3,
+    # 'xtick.minor.visible': True,
+    # 'ytick.minor.visible': True,
+    'xtick.labelsize': 'small',
+    'ytick.labelsize': 'small',
+    'font.family': 'sans-serif',
+    'font.sans-serif': 'DejaVu Sans',
+    'mathtext.fontset': 'dejavusans',
+    'image.interpolation': 'nearest',
+}
+
+
+_families = ('serif', 'sans-serif', 'cursive', 'fantasy', 'monospace')
+
+
+def usestyle():
+    import matplotlib
+    matplotlib.rcParams.update(rcstyle)
+
+
+def _stylefamily(style):
+    # font family of the style, with generic families resolved by the style itself
+    family = style.get('font.family')
+    if isinstance(family, str) and family in _families:
+        family = style.get('font.'+family, family)
+    return family
+
+
+def _styleaxes(ax, style=None):
+    # tick style of 'style' (rcstyle) on one axes, set on the axes instead of the global rcParams
+    style = rcstyle if style is None else style
+    family = _stylefamily(style)
+    if _iswcsaxes(ax):
+        kw = {}
+        if 'xtick.direction' in style:
+            kw['direction'] = style['xtick.direction']
+        if 'xtick.major.size' in style:
+            kw['length'] = style['xtick.major.size']
+        if 'xtick.labelsize' in style:
+            kw['labelsize'] = style['xtick.labelsize']
+        ax.tick_params(which='major', **kw)
+        if 'xtick.minor.size' in style:
+            ax.tick_params(which='minor', length=style['xtick.minor.size'])
+        if family is not None:
+            for coord in ax.coords:
+                coord.set_ticklabel(family=family)
+        return
+    for axis, side in (('x', 'top'), ('y', 'right')):
+        major, minor = {}, {}
+        if axis+'tick.direction' in style:
+            major['direction'] = minor['direction'] = style[axis+'tick.direction']
+        if axis+'tick.major.size' in style:
+            major['length'] = style[axis+'tick.major.size']
+        if axis+'tick.minor.size' in style:
+            minor['length'] = style[axis+'tick.minor.size']
+        if axis+'tick.labelsize' in style:
+            major['labelsize'] = minor['labelsize'] = style[axis+'tick.labelsize']
+        if family is not None:
+            major['labelfontfamily'] = minor['labelfontfamily'] = family
+        if axis+'tick.'+side in style:
+            major[side] = minor[side] = style[axis+'tick.'+side]
+        ax.tick_params(axis=axis, which='major', **major)
+        ax.tick_params(axis=axis, which='minor', **minor)
+
+
+# per-instance settings carried over to the copies of a Multiaxes made by fromspec()
+_settingkeys = ('rasterdensity', 'rasterdpi', 'hook')
+
+
+def _settings(mx):
+    return {k: getattr(mx, k) for k in _settingkeys if k in vars(mx)}
+
+
+def _iswcsaxes(ax):
+    # a WCSAxes can only exist once astropy.visualization.wcsaxes has been imported
+    if 'astropy.visualization.wcsaxes.core' not in sys.modules:
+        return False
+    from astropy.visualization.wcsaxes.core import WCSAxes
+    return isinstance(ax, WCSAxes)
+
+
+def _elements(artist):
+    # number of drawn elements (points, vertices or mesh cells) of a data artist
+    from matplotlib.collections import Collection, QuadMesh
+    from matplotlib.lines import Line2D
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, QuadMesh):
+        return int(np.prod(artist.get_coordinates().shape[:2]))
+    if isinstance(artist, Collection):
+        n = len(artist.get_offsets())
+        if n > 1:
+            return n
+        return sum(len(p.vertices) for p in artist.get_paths())
+    return 0
+
+
+# PIL format names of the raster outputs written from one Agg drawing
+_rasterformats = {'png': 'PNG', 'jpg': 'JPEG', 'jpeg': 'JPEG', 'tif': 'TIFF', 'tiff': 'TIFF', 'webp': 'WEBP'}
+
+
+def _aggrgba(fig, dpi, **kwargs):
+    # draw the figure once with Agg at 'dpi' and return a copy of the RGBA buffer
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    if kwargs:
+        # savefig options (bbox_inches, transparent, facecolor, ...) need the savefig path
+        import io
+        from PIL import Image
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi, **kwargs)
+        buf.seek(0)
+        return np.asarray(Image.open(buf).convert('RGBA'))
+    canvas, figdpi = fig.canvas, fig.dpi
+    agg = canvas if isinstance(canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    try:
+        fig.dpi = dpi
+        agg.draw()
+        return np.asarray(agg.buffer_rgba()).copy()
+    finally:
+        fig.dpi = figdpi
+        fig.set_canvas(canvas)
+
+
+def _encode(rgba, fname, fmt, dpi):
+    from PIL import Image
+    t0 = time.perf_counter()
+    img = Image.fromarray(rgba)
+    if fmt == 'JPEG':
+        img = img.convert('RGB')
+    img.save(fname, format=fmt, dpi=(dpi, dpi))
+    return {'fname': fname, 'format': fmt.lower(), 'size': os.path.getsize(fname),
+            'time': time.perf_counter()-t0, 'dpi': dpi, 'rasterized': 0}
+
+
+def _setframe(artist, value):
+    # new frame data of an animated artist
+    if value is None:
+        return
+    if hasattr(artist, 'set_text'):
+        artist.set_text(value)
+    elif hasattr(artist, 'set_data'):
+        artist.set_data(value)
+    else:
+        artist.set_array(value)
+
+
+def _nullticklabel(axis):
+    from matplotlib.ticker import NullFormatter
+    axis.set_major_formatter(NullFormatter())
+    axis.set_minor_formatter(NullFormatter())
 
 
 class Multiaxes:
@@ -29,14 +179,14 @@ class Multiaxes:
         else:
             warn("col = {}, figure width doesn't match with column or page width.")
             self._col = float(col)
-        if int(nx) in range(1, 20):
+        if int(nx) >= 1:
             self._nx = int(nx)
         else:
-            raise ValueError("'nx' is number of column in figure, (1 to 19)")
-        if int(ny) in range(1, 20):
+            raise ValueError("'nx' is number of column in figure, (1 or more)")
+        if int(ny) >= 1:
             self._ny = int(ny)
         else:
-            raise ValueError("'ny' is number of line in figure, (1 to 19)")
+            raise ValueError("'ny' is number of line in figure, (1 or more)")
         self._yr = np.zeros(ny, dtype=float)
         self._xr = np.zeros(nx, dtype=float)
         self._xl = np.zeros(ny, dtype=float)
@@ -89,6 +239,12 @@ class Multiaxes:
         self._mg[2] *= 1.5
 
     _fig = None
+    _style = True
+    _lay = None
+    _report = None
+    hook = None
+    rasterdensity = 1000.
+    rasterdpi = 300.
     _ax = None
     _cax = None
     _sharex = False
@@ -148,29 +304,136 @@ class Multiaxes:
                 self._cp[:-1] = 0.
         return
 
-    def drawfig(self, verbose=False, border=False):
-        if self._col == int(1):
-            fig_width = self._apj_col*self._sc
-        elif self._col == int(2):
-            fig_width = self._apj_width*self._sc
+    def automargin(self, xlabel=None, ylabel=None, title=None, clabel=None, xticks=None, yticks=None, cticks=None,
+                   pad=0.02, style=True):
+        # label, title and color bar label spaces measured from the strings, in inch plus 'pad'
+        import matplotlib
+        from collections import ChainMap
+        from . import metrics
+        wcs = any(p is not None for p in self._pj.flat)
+        sample = metrics._wcsticks if wcs else metrics._plainticks
+        xticks = sample[0] if xticks is None else xticks
+        yticks = sample[1] if yticks is None else yticks
+        cticks = metrics._plainticks[0] if cticks is None else cticks
+        # the style of the drawn axes, read on top of the global rcParams without changing them
+        rc = ChainMap(rcstyle, matplotlib.rcParams) if style else matplotlib.rcParams
+        family = _stylefamily(rcstyle) if style else None
+        xl = metrics.labelextent('x', xticks, xlabel, rc, family)/72.+pad
+        yl = metrics.labelextent('y', yticks, ylabel, rc, family)/72.+pad
+        tp = None if title is None else metrics.titleextent(title, rc)/72.+pad
+        cl = metrics.labelextent('x' if self._cb == 't' else 'y', cticks, clabel, rc, family)/72.+pad
+        self._xl[:] = xl
+        self._yl[:] = yl
+        if self._sharex:
+            self._xl[1:] = 0.
+        if self._sharey:
+            self._yl[1:] = 0.
+        if tp is not None:
+            self._tp[:] = tp
+            if self._sharex:
+                self._tp[:-1] = 0.
+        self._cl[self._cw > 0.] = cl
+        return {'xlab': xl, 'ylab': yl, 'tit': tp, 'clab': cl}
+
+    def drawfig(self, verbose=False, border=False, style=True, reuse=False, pyplot=True, hook=None):
+        if reuse and self._fig is not None:
+            return self.clearfig()
+        self._style = style
+        out = self._drawfig(verbose, border, pyplot)
+        hook = self.hook if hook is None else hook
+        if hook is not None:
+            hook(self._report)
+        return out
+
+    @property
+    def report(self):
+        return self._report
+
+    @contextmanager
+    def figure(self, verbose=False, border=False, style=True):
+        # pyplot-free figure on an Agg canvas, released when the block exits
+        try:
+            yield self.drawfig(verbose, border, style, pyplot=False)
+        finally:
+            self.closefig()
+
+    def closefig(self):
+        if self._fig is not None:
+            if getattr(self._fig.canvas, 'manager', None) is not None:
+                from matplotlib import pyplot as plt
+                plt.close(self._fig)
+            else:
+                self._fig.clear()
+        self._fig, self._ax, self._cax = None, None, None
+
+    def _layoutkey(self):
+        return layoutkey(self._col, self._xr, self._yr, self._xl, self._yl, self._xp, self._yp, self._tp,
+                         self._cw, self._cl, self._cp, self._mg, self._sc, self._cb,
+                         page=(self._apj_width, self._apj_col, self._apj_height))
+
+    def compute_layout(self, cache=True):
+        key = self._layoutkey()
+        if self._lay is not None and self._lay[0] == key:
+            return dict(self._lay[1])
+        if cache:
+            return dict(cached_layout(key))
+        return compute_layout(key[0], *key[1:12], sc=key[12], cb=key[13], page=key[14])
+
+    def spec(self, layout=True):
+        sp = {'col': self._col, 'nx': self._nx, 'ny': self._ny, 'cpos': 'top' if self._cb == 't' else 'right',
+              'scale': 1./self._sc, 'sharex': self._sharex, 'sharey': self._sharey}
+        for k in ('yr', 'xr', 'xl', 'yl', 'xp', 'yp', 'tp', 'cw', 'cl', 'cp', 'mg'):
+            sp[k] = getattr(self, '_'+k).tolist()
+        if layout:
+            lay = self.compute_layout()
+            sp['layout'] = {'figsize': [float(v) for v in lay['figsize']], 'ax': lay['ax'].tolist(),
+                            'cax': lay['cax'].tolist(), 'xs': lay['xs'].tolist(), 'ys': lay['ys'].tolist(),
+                            'outx': float(lay['outx']), 'outy': float(lay['outy']),
+                            'remain_width': float(lay['remain_width']), 'remain_height': float(lay['remain_height'])}
+        return sp
+
+    @classmethod
+    def fromspec(cls, spec, proj=None):
+        mx = cls(col=spec['col'], nx=spec['nx'], ny=spec['ny'], cpos=spec['cpos'], scale=spec['scale'], proj=proj)
+        for k in ('yr', 'xr', 'xl', 'yl', 'xp', 'yp', 'tp', 'cw', 'cl', 'cp', 'mg'):
+            getattr(mx, '_'+k)[:] = spec[k]
+        mx._sharex, mx._sharey = bool(spec['sharex']), bool(spec['sharey'])
+        if spec.get('layout') is not None:
+            lay = dict(spec['layout'])
+            for k in ('ax', 'cax', 'xs', 'ys'):
+                lay[k] = np.array(lay[k], dtype=float)
+            lay['figsize'] = tuple(lay['figsize'])
+            mx._lay = (mx._layoutkey(), lay)
+        return mx
+
+    def savespec(self, fname, layout=True):
+        sp = self.spec(layout)
+        if str(fname).endswith('.npz'):
+            lay = sp.pop('layout', None)
+            arrays = {} if lay is None else {'layout_'+k: np.asarray(v) for k, v in lay.items()}
+            np.savez(fname, spec=json.dumps(sp), **arrays)
         else:
-            fig_width = self._apj_col*self._col*self._sc
-        page_height = self._apj_height*self._sc
-        if self._cb == 't':
-            outx = self._yl.sum()+self._xp.sum()+self._mg[[0, 2]].sum()
-            outy = self._xl.sum()+self._yp.sum()+self._tp.sum()+self._cw.sum()+self._cl.sum()+self._cp.sum()+self._mg[[1, 3]].sum()
+            with open(fname, 'w') as f:
+                json.dump(sp, f)
+
+    @classmethod
+    def loadspec(cls, fname, proj=None):
+        if str(fname).endswith('.npz'):
+            with np.load(fname) as npz:
+                sp = json.loads(str(npz['spec']))
+                lay = {k[7:]: npz[k] for k in npz.files if k.startswith('layout_')}
+            if lay:
+                sp['layout'] = {k: (float(v) if v.ndim == 0 else v) for k, v in lay.items()}
         else:
-            outx = self._yl.sum()+self._xp.sum()+self._cw.sum()+self._cl.sum()+self._cp.sum()+self._mg[[0, 2]].sum()
-            outy = self._xl.sum()+self._yp.sum()+self._tp.sum()+self._mg[[1, 3]].sum()
-        remain_width = fig_width-outx
-        xs = self._xr/self._xr.sum()*remain_width
-        ys = xs[0]/self._yr
-        remain_height = page_height-outy
-        if ys.sum() > remain_height:
-            xs *= remain_height/ys.sum()
-            ys *= remain_height/ys.sum()
-            fig_width = xs.sum()+outx
-        fig_height = ys.sum()+outy
+            with open(fname) as f:
+                sp = json.load(f)
+        return cls.fromspec(sp, proj)
+
+    def _drawfig(self, verbose, border, pyplot):
+        t = [time.perf_counter()]
+        lay = self.compute_layout()
+        t.append(time.perf_counter())
+        fig_width, fig_height = lay['figsize']
         if verbose:
             print('x-label height =', self._xl)
             print('y-label width =', self._yl)
@@ -184,16 +447,24 @@ class Multiaxes:
                 print('colorbar width =', self._cw)
                 print('colorbar label width =', self._cl)
                 print('colorbar pad width =', self._cp)
-            print('outside x width =', outx)
-            print('outside y height =', outy)
-            print('remain width =', remain_width)
-            print('remain height =', remain_height)
-            print('x-size width =', xs)
-            print('y-size height =', ys)
+            print('outside x width =', lay['outx'])
+            print('outside y height =', lay['outy'])
+            print('remain width =', lay['remain_width'])
+            print('remain height =', lay['remain_height'])
+            print('x-size width =', lay['xs'])
+            print('y-size height =', lay['ys'])
             print('figure width =', fig_width)
             print('figure height =', fig_height)
-        self._fig = plt.figure(figsize=(fig_width, fig_height))
+        if pyplot:
+            from matplotlib import pyplot as plt
+            self._fig = plt.figure(figsize=(fig_width, fig_height))
+        else:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self._fig = Figure(figsize=(fig_width, fig_height))
+            FigureCanvasAgg(self._fig)
         self._fw, self._fh = fig_width, fig_height
+        t.append(time.perf_counter())
         self._ax = np.zeros((self._ny, self._nx), dtype=object)
         self._cax = np.zeros((self._ny, self._nx), dtype=object)
         if border:
@@ -204,70 +475,377 @@ class Multiaxes:
             bd = self._fig.add_axes([x0, y0, x1, y1])
             bd.axes.get_xaxis().set_visible(False)
             bd.axes.get_yaxis().set_visible(False)
+            self._border = bd
+        else:
+            self._border = None
+        panel = np.zeros((self._ny, self._nx), dtype=float)
+        share = 0.
         for yi in range(self._ny):
             for xi in range(self._nx):
-                if self._cb == 't':
-                    x0 = (self._mg[0]+self._yl[:xi+1].sum()+xs[:xi].sum()+self._xp[:xi].sum())/fig_width
-                    y0 = (self._mg[1]+self._xl[:yi+1].sum()+ys[:yi].sum()+self._tp[:yi].sum()+self._yp[:yi].sum()
-                          +self._cw[:yi].sum()+self._cl[:yi].sum()+self._cp[:yi].sum())/fig_height
-                else:
-                    x0 = (self._mg[0]+self._yl[:xi+1].sum()+xs[:xi].sum()+self._xp[:xi].sum()
-                          +self._cw[:xi].sum()+self._cl[:xi].sum()+self._cp[:xi].sum())/fig_width
-                    y0 = (self._mg[1]+self._xl[:yi+1].sum()+ys[:yi].sum()+self._tp[:yi].sum()
-                          +self._yp[:yi].sum())/fig_height
-                x1 = xs[xi]/fig_width
-                y1 = ys[yi]/fig_height
                 if verbose:
-                    print('ax[{}, {}] = ({:.3f}, {:.3f}, {:.3f}, {:.3f})'.format(yi, xi, x0, y0, x1, y1))
-                self._ax[yi, xi] = self._fig.add_axes([x0, y0, x1, y1], projection=self._pj[yi, xi])
-                if self._sharey and xi > 0:
-                    if isinstance(self._ax[yi, xi], WCSAxes):
-                        self._ax[yi, xi].coords[1].set_ticklabel_visible(False)
-                        self._ax[yi, xi].coords[1].set_axislabel('')
-                    else:
-                        self._ax[yi, xi].yaxis.set_major_formatter(plt.NullFormatter())
-                        self._ax[yi, xi].yaxis.set_minor_formatter(plt.NullFormatter())
-                if self._sharex and yi > 0:
-                    if isinstance(self._ax[yi, xi], WCSAxes):
-                        self._ax[yi, xi].coords[0].set_ticklabel_visible(False)
-                        self._ax[yi, xi].coords[0].set_axislabel('')
-                    else:
-                        self._ax[yi, xi].xaxis.set_major_formatter(plt.NullFormatter())
-                        self._ax[yi, xi].xaxis.set_minor_formatter(plt.NullFormatter())
+                    print('ax[{}, {}] = ({:.3f}, {:.3f}, {:.3f}, {:.3f})'.format(yi, xi, *lay['ax'][yi, xi]))
+                t0 = time.perf_counter()
+                self._ax[yi, xi] = self._fig.add_axes(lay['ax'][yi, xi], projection=self._pj[yi, xi])
+                if self._style:
+                    _styleaxes(self._ax[yi, xi])
+                t1 = time.perf_counter()
+                self.removeticklabel(self._ax[yi, xi], (self._sharex and yi > 0, self._sharey and xi > 0))
+                panel[yi, xi] = t1-t0
+                share += time.perf_counter()-t1
+        t.append(time.perf_counter())
         for yi in range(self._ny):
             for xi in range(self._nx):
-                if self._cb == 't':
-                    x0 = (self._mg[0]+self._yl[:xi+1].sum()+xs[:xi].sum()+self._xp[:xi].sum())/fig_width
-                    y0 = (self._mg[1]+self._xl[:yi+1].sum()+ys[:yi+1].sum()+self._tp[:yi].sum()+self._yp[:yi].sum()
-                          +self._cw[:yi].sum()+self._cl[:yi].sum()+self._cp[:yi+1].sum())/fig_height
-                    x1 = xs[xi]/fig_width
-                    y1 = self._cw[yi]/fig_height
-                else:
-                    x0 = (self._mg[0]+self._yl[:xi+1].sum()+xs[:xi+1].sum()+self._xp[:xi].sum()
-                          +self._cw[:xi].sum()+self._cl[:xi].sum()+self._cp[:xi+1].sum())/fig_width
-                    y0 = (self._mg[1]+self._xl[:yi+1].sum()+ys[:yi].sum()+self._tp[:yi].sum()
-                          +self._yp[:yi].sum())/fig_height
-                    x1 = self._cw[xi]/fig_width
-                    y1 = ys[yi]/fig_height
                 if verbose:
-                    print('cax[{}, {}] = ({:.3f}, {:.3f}, {:.3f}, {:.3f})'.format(yi, xi, x0, y0, x1, y1))
-                if (x1 > 0.) and (y1 > 0.):
-                    self._cax[yi, xi] = self._fig.add_axes([x0, y0, x1, y1])
+                    print('cax[{}, {}] = ({:.3f}, {:.3f}, {:.3f}, {:.3f})'.format(yi, xi, *lay['cax'][yi, xi]))
+                if lay['cax'][yi, xi, 2] > 0.:
+                    self._cax[yi, xi] = self._fig.add_axes(lay['cax'][yi, xi])
+                    if self._style:
+                        _styleaxes(self._cax[yi, xi])
                     if self._cb == 't':
                         self._cax[yi, xi].xaxis.tick_top()
                 else:
                     self._cax[yi, xi] = None
+        t.append(time.perf_counter())
+        projected = np.array([[p is not None for p in row] for row in self._pj], dtype=bool)
+        self._report = {
+            'timing': {'layout': t[1]-t[0], 'figure': t[2]-t[1], 'axes': t[3]-t[2]-share,
+                       'projection': float(panel[projected].sum()), 'sharing': share, 'colorbar': t[4]-t[3],
+                       'total': t[4]-t[0]},
+            'panel_time': panel, 'projected': projected, 'figsize': (fig_width, fig_height),
+            'ax': lay['ax'], 'cax': lay['cax'], 'xs': lay['xs'], 'ys': lay['ys']}
+        self._axgrid, self._caxgrid = self._ax, self._cax
+        self._drawn = {'ax': lay['ax'], 'cax': lay['cax'], 'figsize': (fig_width, fig_height),
+                       'sharex': self._sharex, 'sharey': self._sharey}
+        return self._gridview()
+
+    def _gridview(self):
+        # user view of the (ny, nx) axes grids, top row first
+        self._ax, self._cax = self._axgrid, self._caxgrid
         if self._nx == 1 or self._ny == 1:
             self._ax = self._ax.flatten()
             self._cax = self._cax.flatten()
         if self._nx == 1 and self._ny == 1:
-            self._ax = self.ax[0]
+            self._ax = self._ax[0]
             self._cax = self._cax[0]
         if self._ny > 1:
             self._ax = np.flip(self._ax, axis=0)
             self._cax = np.flip(self._cax, axis=0)
         return self._fig, self._ax, self._cax
 
+    def relayout(self):
+        # apply title(), shareaxes() and padding changes to the drawn figure in place
+        if self._fig is None:
+            return self.drawfig()
+        lay = self.compute_layout()
+        old = self._drawn
+        fig_width, fig_height = lay['figsize']
+        if not np.allclose(old['figsize'], lay['figsize']):
+            self._fig.set_size_inches(fig_width, fig_height)
+            self._fw, self._fh = fig_width, fig_height
+            if self._border is not None:
+                self._border.set_position([self._mg[0]/fig_width, self._mg[1]/fig_height,
+                                           (fig_width-self._mg[[0, 2]].sum())/fig_width,
+                                           (fig_height-self._mg[[1, 3]].sum())/fig_height])
+        for yi in range(self._ny):
+            for xi in range(self._nx):
+                if not np.allclose(old['ax'][yi, xi], lay['ax'][yi, xi]):
+                    self._axgrid[yi, xi].set_position(lay['ax'][yi, xi])
+                self.removeticklabel(self._axgrid[yi, xi], (self._sharex and not old['sharex'] and yi > 0,
+                                                            self._sharey and not old['sharey'] and xi > 0))
+                cax = self._caxgrid[yi, xi]
+                if lay['cax'][yi, xi, 2] > 0.:
+                    if cax is None:
+                        self._caxgrid[yi, xi] = self._fig.add_axes(lay['cax'][yi, xi])
+                        if self._style:
+                            _styleaxes(self._caxgrid[yi, xi])
+                        if self._cb == 't':
+                            self._caxgrid[yi, xi].xaxis.tick_top()
+                    elif not np.allclose(old['cax'][yi, xi], lay['cax'][yi, xi]):
+                        cax.set_position(lay['cax'][yi, xi])
+                elif cax is not None:
+                    cax.remove()
+                    self._caxgrid[yi, xi] = None
+        self._drawn = {'ax': lay['ax'], 'cax': lay['cax'], 'figsize': (fig_width, fig_height),
+                       'sharex': self._sharex, 'sharey': self._sharey}
+        return self._gridview()
+
+    def clearfig(self):
+        # remove the plotted data but keep the axes, tick formatters and sharing of the figure
+        for a in self._fig.axes:
+            if getattr(a, '_colorbar', None) is not None:
+                tick, label = a.xaxis.get_ticks_position(), a.xaxis.get_label_position()
+                a.cla()
+                # cla() resets the ticks to the rcParams, so set the style of the figure again
+                if self._style:
+                    _styleaxes(a)
+                if tick == 'top':
+                    a.xaxis.tick_top()
+                a.xaxis.set_label_position(label)
+                continue
+            for artist in (list(a.lines)+list(a.collections)+list(a.images)+list(a.patches)+list(a.texts)
+                           +list(a.tables)+list(a.artists)):
+                artist.remove()
+            if a.get_legend() is not None:
+                a.get_legend().remove()
+            for loc in ('left', 'center', 'right'):
+                a.set_title('', loc=loc)
+            a.relim()
+            a.set_autoscale_on(True)
+            # the next lines start from the first color again, as on a new axes
+            a.set_prop_cycle(None)
+        suptitle = getattr(self._fig, '_suptitle', None)
+        for t in list(self._fig.texts):
+            if t is suptitle:
+                t.set_text('')
+            else:
+                t.remove()
+        for lg in list(self._fig.legends):
+            lg.remove()
+        return self._fig, self._ax, self._cax
+
+    def render_many(self, items, plot_fn, outdir, workers=None, fname='{:04d}.png', style=True, reuse=False,
+                    **kwargs):
+        from .batch import render_many
+        return render_many(self, items, plot_fn, outdir, workers, fname, style, reuse, **kwargs)
+
+    def imshow(self, ax, data, dpi=None, method='mean', lut=False, **kwargs):
+        # show a 2D map block-reduced to the pixel footprint of the panel at the output dpi
+        import matplotlib
+        if self._style and 'image.interpolation' in rcstyle:
+            kwargs.setdefault('interpolation', rcstyle['image.interpolation'])
+        if np.ndim(data) != 2:
+            return ax.imshow(data, **kwargs)
+        if dpi is None:
+            dpi = matplotlib.rcParams['savefig.dpi']
+            if dpi == 'figure':
+                dpi = self._fig.dpi
+        w, h = ax.get_position().size*self._fig.get_size_inches()*dpi
+        ny, nx = np.shape(data)
+        f = max(1, int(min(nx/max(w, 1.), ny/max(h, 1.))))
+        if f > 1:
+            img = blockreduce(data, f, method)
+        else:
+            img = np.asarray(data)
+        if 'extent' not in kwargs:
+            x1, y1 = img.shape[1]*f-0.5, img.shape[0]*f-0.5
+            if kwargs.get('origin', matplotlib.rcParams['image.origin']) == 'lower':
+                kwargs['extent'] = (-0.5, x1, -0.5, y1)
+            else:
+                kwargs['extent'] = (-0.5, x1, y1, -0.5)
+        if lut:
+            # pre-rendered uint8 RGBA through the colormap lookup table
+            cmap = kwargs.pop('cmap', None) or matplotlib.rcParams['image.cmap']
+            img = colorize(img, cmap, kwargs.pop('vmin', None), kwargs.pop('vmax', None), kwargs.pop('norm', None))
+        return ax.imshow(img, **kwargs)
+
+    def contour(self, ax, data, levels, factor=1, wcs=None, cache=True, **kwargs):
+        # cached contour paths of one map, added as a PathCollection to each of the given panels
+        from matplotlib.collections import PathCollection
+        paths = contourpaths(data, levels, factor, cache)
+        levels = np.array(list(paths))
+        if 'colors' in kwargs:
+            kwargs['edgecolors'] = kwargs.pop('colors')
+        kwargs.setdefault('facecolors', 'none')
+        kwargs.setdefault('zorder', 2)
+        out = []
+        for a in np.ravel(ax):
+            # per panel, so that the WCS transform of one panel is not used for the next
+            kw = dict(kwargs)
+            if wcs is not None and _iswcsaxes(a):
+                kw['transform'] = a.get_transform(wcs)
+            pc = PathCollection(list(paths.values()), **kw)
+            if 'edgecolors' not in kw:
+                # edge colors mapped from the levels through cmap and norm, also after set_norm()
+                pc.set_array(levels)
+            a.add_collection(pc, autolim=False)
+            out.append(pc)
+        return out if np.ndim(ax) else out[0]
+
+    def channelmap(self, cube, channels, binning=1, wcs=None, velocities=None, fmt='{:.2f} km/s', dpi=None,
+                   norm=None, percentile=None, textkw=None, **kwargs):
+        # one (binned) channel of a (nchan, ny, nx) cube per panel, top-left panel first
+        if wcs is not None and self._fig is None:
+            self._pj[:, :] = wcs.celestial
+        if self._fig is None:
+            self.drawfig()
+        channels = np.arange(cube.shape[0])[channels] if isinstance(channels, slice) else np.asarray(channels)
+        panels = np.ravel(self._ax)
+        if len(channels) > len(panels):
+            raise ValueError('{} channels for {} panels.'.format(len(channels), len(panels)))
+        kwargs.setdefault('origin', 'lower')
+        textkw = dict({'ha': 'left', 'va': 'top'}, **(textkw or {}))
+        images = []
+        for ax, c in zip(panels, channels):
+            if binning > 1:
+                # accumulate plane by plane, so that at most two planes are in memory
+                plane = np.zeros(cube.shape[1:], dtype=float)
+                for k in range(c, min(c+binning, cube.shape[0])):
+                    plane += cube[k]
+                plane /= min(c+binning, cube.shape[0])-c
+            else:
+                plane = cube[c]
+            images.append(self.imshow(ax, plane, dpi=dpi, **kwargs))
+            v = self._velocity(c, binning, wcs, velocities)
+            if v is not None and fmt:
+                ax.text(0.05, 0.95, fmt.format(v), transform=ax.transAxes, **textkw)
+        if norm is None and 'vmin' not in kwargs and 'vmax' not in kwargs:
+            norm = self.sharenorm([im.get_array() for im in images], percentile, apply=False)
+        if norm is not None:
+            for im in images:
+                im.set_norm(norm)
+        return images
+
+    def _velocity(self, c, binning, wcs, velocities):
+        if velocities is not None:
+            return np.mean(velocities[c:c+binning])
+        if wcs is None or wcs.spectral.naxis == 0:
+            return None
+        from astropy import units as u
+        spec = wcs.spectral
+        v = u.Quantity(spec.pixel_to_world_values(c+(binning-1)/2.), spec.world_axis_units[0])
+        if v.unit.is_equivalent(u.km/u.s):
+            return v.to_value(u.km/u.s)
+        return v.value
+
+    def rasterize(self, density=None, dpi=None):
+        # rasterize data artists with more elements per printed square inch than 'density'
+        density = self.rasterdensity if density is None else density
+        dpi = self.rasterdpi if dpi is None else dpi
+        n = 0
+        w, h = self._fig.get_size_inches()
+        for a in self._fig.axes:
+            pos = a.get_position()
+            area = pos.width*w*pos.height*h/self._sc**2
+            for artist in list(a.lines)+list(a.collections):
+                if _elements(artist) > density*area:
+                    artist.set_rasterized(True)
+                    n += 1
+        # figure dpi that gives 'dpi' pixels per inch in print at 'scale'
+        return n, dpi/self._sc
+
+    def savefig(self, fname, rasterize=True, **kwargs):
+        fmt = kwargs.get('format') or os.path.splitext(str(fname))[1][1:].lower()
+        n = 0
+        if rasterize and fmt in ('pdf', 'eps', 'ps', 'svg'):
+            n, dpi = self.rasterize()
+            if n > 0:
+                kwargs.setdefault('dpi', dpi)
+        t0 = time.perf_counter()
+        self._fig.savefig(fname, **kwargs)
+        t = time.perf_counter()-t0
+        if hasattr(fname, 'tell'):
+            size = fname.tell()
+        else:
+            size = os.path.getsize(fname)
+        return {'fname': fname, 'format': fmt, 'size': size, 'time': t, 'dpi': kwargs.get('dpi'), 'rasterized': n}
+
+    def export(self, fname, formats=('pdf', 'png'), dpi=None, workers=None, rasterize=True, **kwargs):
+        # save 'fname'.<format> for all formats; raster formats share one Agg drawing and are encoded in threads,
+        # kwargs are the savefig options of all formats
+        import matplotlib
+        from concurrent.futures import ThreadPoolExecutor
+        raster = [f for f in formats if f.lower() in _rasterformats]
+        vector = [f for f in formats if f.lower() not in _rasterformats]
+        if dpi is None:
+            dpi = matplotlib.rcParams['savefig.dpi']
+            if dpi == 'figure':
+                dpi = self._fig.dpi
+        reports = []
+        with ThreadPoolExecutor(workers) as pool:
+            futures = []
+            if raster:
+                rgba = _aggrgba(self._fig, dpi, **kwargs)
+                for f in raster:
+                    futures.append(pool.submit(_encode, rgba, '{}.{}'.format(fname, f), _rasterformats[f.lower()], dpi))
+            for f in vector:
+                reports.append(self.savefig('{}.{}'.format(fname, f), rasterize=rasterize, **kwargs))
+            reports = [future.result() for future in futures]+reports
+        return reports
+
+    def stream(self, artists, frames, dpi=None, copy=False):
+        # RGBA frames with only 'artists' redrawn over a cached background; one value per artist per frame
+        import matplotlib
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        artists = list(artists)
+        if dpi is None:
+            dpi = matplotlib.rcParams['savefig.dpi']
+            if dpi == 'figure':
+                dpi = self._fig.dpi
+        canvas, figdpi = self._fig.canvas, self._fig.dpi
+        agg = canvas if isinstance(canvas, FigureCanvasAgg) else FigureCanvasAgg(self._fig)
+        animated = [artist.get_animated() for artist in artists]
+        patches = [self._fig.patch]+[a.patch for a in self._fig.axes]
+        visible = [p.get_visible() for p in patches]
+        try:
+            self._fig.dpi = dpi
+            for artist in artists:
+                artist.set_animated(True)
+            # static foreground (ticks, frames, labels) without the figure and axes backgrounds,
+            # blended back over the changed regions of every frame
+            for p in patches:
+                p.set_visible(False)
+            agg.draw()
+            fg = np.asarray(agg.buffer_rgba())
+            h = fg.shape[0]
+            mask = np.zeros(fg.shape[:2], dtype=bool)
+            for a in {artist.axes for artist in artists}:
+                x0, y0, x1, y1 = np.round(a.bbox.extents).astype(int)
+                mask[max(0, h-y1):h-y0, max(0, x0):x1] = True
+            idx = np.nonzero(mask & (fg[..., 3] > 0))
+            fgrgb = fg[idx][:, :3].astype(np.uint16)
+            alpha = fg[idx][:, 3:].astype(np.uint16)
+            for p, v in zip(patches, visible):
+                p.set_visible(v)
+            agg.draw()
+            background = agg.copy_from_bbox(self._fig.bbox)
+            for frame in frames:
+                agg.restore_region(background)
+                for artist, value in zip(artists, frame):
+                    _setframe(artist, value)
+                    artist.axes.draw_artist(artist)
+                rgba = np.asarray(agg.buffer_rgba())
+                rgba[idx[0], idx[1], :3] = (fgrgb*alpha+rgba[idx][:, :3]*(255-alpha)+127)//255
+                yield rgba.copy() if copy else rgba
+        finally:
+            for artist, anim in zip(artists, animated):
+                artist.set_animated(anim)
+            for p, v in zip(patches, visible):
+                p.set_visible(v)
+            self._fig.dpi = figdpi
+            self._fig.set_canvas(canvas)
+
+    def movie(self, fname, artists, frames, fps=10, dpi=None, encoder='ffmpeg', args=None):
+        # pipe the stream() frames to an encoder process reading raw RGBA from stdin
+        import shutil
+        import subprocess
+        if shutil.which(encoder) is None:
+            raise RuntimeError("Encoder '{}' is not found.".format(encoder))
+        if args is None:
+            args = ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        t0 = time.perf_counter()
+        proc = None
+        n = 0
+        try:
+            for rgba in self.stream(artists, frames, dpi):
+                if proc is None:
+                    h, w = rgba.shape[:2]
+                    cmd = [encoder, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                           '-s', '{}x{}'.format(w, h), '-r', str(fps), '-i', '-']+list(args)+[str(fname)]
+                    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                proc.stdin.write(rgba.data)
+                n += 1
+        finally:
+            if proc is not None:
+                proc.stdin.close()
+                if proc.wait() != 0:
+                    raise RuntimeError("'{}' exited with status {}.".format(encoder, proc.returncode))
+        return {'fname': fname, 'frames': n, 'time': time.perf_counter()-t0,
+                'size': os.path.getsize(fname) if n else 0}
+
+    def build(self, fname, plot_fn, inputs=(), cachedir='.multiaxes', force=False, **kwargs):
+        from .buildcache import build
+        return build(self, fname, plot_fn, inputs, cachedir, force, **kwargs)
+
     def subaxes(self, ax, box):
         x0, y0, x1, y1 = ax._position.get_points().flatten()
         x1, y1 = x1-x0, y1-y0
@@ -297,8 +875,60 @@ class Multiaxes:
                             sg[yi, xi].set_axis_on()
         return sg
 
+    def spectragrid(self, ax, grid, spectra, x=None, pad=0., frame=False, repr=None, norm='cell', **kwargs):
+        # subgrid of line profiles drawn as one LineCollection in the axes coordinates of 'ax'
+        import matplotlib
+        from matplotlib.collections import LineCollection
+        x0, y0, x1, y1 = ax._position.get_points().flatten()
+        x1, y1 = x1-x0, y1-y0
+        nx, ny = grid
+        xw, yh = x1/nx, y1/ny
+        spectra = np.asarray(spectra, dtype=float).reshape((ny, nx, -1))
+        if x is None:
+            x = np.arange(spectra.shape[-1], dtype=float)
+        x = np.asarray(x, dtype=float)
+        xlim = np.nanmin(x), np.nanmax(x)
+        if norm == 'cell':
+            lo, hi = np.nanmin(spectra, axis=-1), np.nanmax(spectra, axis=-1)
+        elif norm == 'global':
+            lo, hi = np.full((ny, nx), np.nanmin(spectra)), np.full((ny, nx), np.nanmax(spectra))
+        else:
+            lo, hi = np.full((ny, nx), float(norm[0])), np.full((ny, nx), float(norm[1]))
+        span = np.where(hi > lo, hi-lo, 1.)
+        # cell origin and size in axes fraction, with the same figure-fraction pad as subgrid
+        cx = (np.arange(nx)+pad/2./xw)/nx
+        cy = (np.arange(ny)+pad/2./yh)/ny
+        cw, ch = (xw-pad)/x1, (yh-pad)/y1
+        u = (x-xlim[0])/(xlim[1]-xlim[0])
+        v = (spectra-lo[..., np.newaxis])/span[..., np.newaxis]
+        segs = np.empty(spectra.shape+(2,), dtype=float)
+        segs[..., 0] = cx[np.newaxis, :, np.newaxis]+u*cw
+        segs[..., 1] = cy[:, np.newaxis, np.newaxis]+v*ch
+        keep = np.ones((ny, nx), dtype=bool)
+        if repr is not None:
+            keep[repr[1], repr[0]] = False
+        lc = LineCollection(segs[keep], transform=ax.transAxes, **kwargs)
+        ax.add_collection(lc, autolim=False)
+        if frame:
+            bx = cx[np.newaxis, :, np.newaxis]+np.array([0., cw, cw, 0., 0.])
+            by = cy[:, np.newaxis, np.newaxis]+np.array([0., 0., ch, ch, 0.])
+            box = np.stack(np.broadcast_arrays(bx, by), axis=-1)
+            ax.add_collection(LineCollection(box[keep], transform=ax.transAxes, colors='k',
+                                             linewidths=matplotlib.rcParams['axes.linewidth']), autolim=False)
+        rax = None
+        if repr is not None:
+            xi, yi = repr
+            rax = self._fig.add_axes([x0+xw*xi+pad/2., y0+yh*yi+pad/2., xw-pad, yh-pad], fc='None')
+            rax.plot(x, spectra[yi, xi], color=lc.get_color()[0], lw=lc.get_linewidth()[0])
+            rax.set_xlim(xlim)
+            rax.set_ylim(lo[yi, xi], lo[yi, xi]+span[yi, xi])
+        return lc, rax
+
     def colorbar(self, mappable=None, cax=None, ax=None, **kwargs):
-        return plt.colorbar(mappable, cax, ax, **kwargs)
+        if mappable is None:
+            from matplotlib import pyplot as plt
+            return plt.colorbar(mappable, cax, ax, **kwargs)
+        return self._fig.colorbar(mappable, cax=cax, ax=ax, **kwargs)
 
     def sharecolorbar(self, loc='right', width=0.1, pad=0.):
         if loc == 'right':
@@ -327,13 +957,34 @@ class Multiaxes:
             raise ValueError("Shared color bar can be located 'right' or 'top'.")
         return self._cax
 
+    def sharenorm(self, arrays=None, percentile=None, norm=None, apply=True, **kwargs):
+        # one normalization for all panels, from the given arrays or the images already shown
+        from matplotlib.colors import Normalize
+        if arrays is None:
+            arrays = [im.get_array() for a in self._axgrid.flat for im in a.images]
+        elif isinstance(arrays, np.ndarray) and arrays.dtype == object:
+            arrays = arrays.ravel()
+        vmin, vmax = sharedlimits(arrays, percentile, **kwargs)
+        norm = (Normalize if norm is None else norm)(vmin=vmin, vmax=vmax)
+        if apply:
+            self.applynorm(norm)
+        return norm
+
+    def applynorm(self, norm):
+        from matplotlib.cm import ScalarMappable
+        for a in self._axgrid.flat:
+            for artist in list(a.images)+list(a.collections):
+                if isinstance(artist, ScalarMappable) and artist.get_array() is not None:
+                    artist.set_norm(norm)
+        return
+
     def topcolorbar(self, cax):
         cax.xaxis.tick_top()
         cax.xaxis.set_label_position('top')
 
     def removeticklabel(self, ax, xy=(True, True)):
-        for ix in ax.flatten():
-            if isinstance(ix, WCSAxes):
+        for ix in np.ravel(ax):
+            if _iswcsaxes(ix):
                 if xy[0]:
                     ix.coords[0].set_ticklabel_visible(False)
                     ix.coords[0].set_axislabel('')
@@ -342,9 +993,7 @@ class Multiaxes:
                     ix.coords[1].set_axislabel('')
             else:
                 if xy[0]:
-                    ix.xaxis.set_major_formatter(plt.NullFormatter())
-                    ix.xaxis.set_minor_formatter(plt.NullFormatter())
+                    _nullticklabel(ix.xaxis)
                 if xy[1]:
-                    ix.yaxis.set_major_formatter(plt.NullFormatter())
-                    ix.yaxis.set_minor_formatter(plt.NullFormatter())
+                    _nullticklabel(ix.yaxis)
         return
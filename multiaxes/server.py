@@ -0,0 +1,293 @@
+"""
+Local render server
+
+Usage:
+    python -m multiaxes.server --port 8765 -j 4
+
+Keeps a pool of worker processes with matplotlib, astropy, the CASA color
+maps and the font cache already loaded, and renders figure specs (the
+format of the multiaxes command) on request:
+
+    POST /render    body: JSON spec, or an .npz with the JSON spec in
+                    '__spec__' and the arrays it names as data sources
+    GET  /metrics   counters and latency percentiles as JSON
+    GET  /health
+
+The spec 'format' (png, pdf, ...) selects the output, returned as the
+response body. Arrays can also be passed in shared memory as data sources
+{shm: name, shape: [...], dtype: ...}. At most 'workers' figures are
+rendered at a time and 'queue' more wait; further requests get 503.
+Binds to 127.0.0.1 only.
+"""
+
+import argparse
+import gc
+import io
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+import numpy as np
+
+_types = {'png': 'image/png', 'pdf': 'application/pdf', 'svg': 'image/svg+xml', 'eps': 'application/postscript',
+          'jpg': 'image/jpeg', 'jpeg': 'image/jpeg'}
+
+# spec of the figure drawn by every worker at start
+_warmspec = {'layout': {'nx': 2, 'cb': 0.1, 'xlab': 0.4, 'ylab': 0.4}, 'panels': [
+    {'data': 'a', 'cmap': 'Rainbow2', 'colorbar': 'label', 'title': 'warm'},
+    {'data': 'a', 'plot': 'contour', 'levels': [0.5], 'xlabel': '$x$ ($\\mu$m)'}]}
+
+
+class Busy(Exception):
+    pass
+
+
+def _initworker():
+    import matplotlib
+    matplotlib.use('Agg')
+    from .colorbars import casacmap
+    for name in casacmap:
+        casacmap[name]
+    # the first draw loads the fonts, mathtext and the Agg text cache
+    _render(dict(_warmspec), {'a': np.random.rand(8, 8)})
+
+
+def _ping():
+    return True
+
+
+def _attach(spec):
+    # shared-memory data sources as arrays, with the segments to close
+    from multiprocessing import shared_memory, resource_tracker
+    arrays, segments = {}, []
+    for name, src in list(spec.get('data', {}).items()):
+        if isinstance(src, dict) and 'shm' in src:
+            shm = shared_memory.SharedMemory(name=src['shm'])
+            # the segment belongs to the client, do not unlink it when the worker exits
+            resource_tracker.unregister(shm._name, 'shared_memory')
+            segments.append(shm)
+            arrays[name] = np.ndarray(src['shape'], dtype=src.get('dtype', 'float64'), buffer=shm.buf)
+            del spec['data'][name]
+    return arrays, segments
+
+
+def _render(spec, arrays):
+    from .cli import render
+    buf = io.BytesIO()
+    spec['output'] = buf
+    spec['save'] = dict(spec.get('save', {}), format=spec.get('format', 'png'))
+    render(spec, arrays=arrays)
+    return buf.getvalue()
+
+
+def _renderrequest(spec, payload):
+    # in a worker: (output bytes, start time, render time) or (None, start time, traceback)
+    t0 = time.time()
+    arrays, segments = {}, []
+    try:
+        if payload:
+            with np.load(io.BytesIO(payload), allow_pickle=False) as npz:
+                arrays = {k: npz[k] for k in npz.files if k != '__spec__'}
+        views, segments = _attach(spec)
+        arrays.update(views)
+        out = _render(spec, arrays)
+        return out, t0, time.time()-t0
+    except Exception:
+        return None, t0, traceback.format_exc()
+    finally:
+        arrays = views = None
+        gc.collect()
+        for shm in segments:
+            try:
+                shm.close()
+            except BufferError:
+                # still viewed by an artist; the mapping goes when it is collected
+                pass
+
+
+def _percentiles(values):
+    if not values:
+        return {'p50': None, 'p90': None, 'p99': None, 'mean': None}
+    p = np.percentile(values, [50, 90, 99])
+    return {'p50': float(p[0]), 'p90': float(p[1]), 'p99': float(p[2]), 'mean': float(np.mean(values))}
+
+
+class RenderServer:
+    """
+    Pool of warm render processes behind a localhost HTTP server.
+
+    render(spec, arrays) is the same path without HTTP. Use as a context
+    manager, or start() and stop().
+    """
+
+    def __init__(self, port=0, workers=2, queue=16, history=1000, host='127.0.0.1'):
+        self.host, self.port = host, port
+        self.workers, self.queue = workers, queue
+        self._slots = threading.BoundedSemaphore(workers+queue)
+        self._lock = threading.Lock()
+        self._latency = deque(maxlen=history)
+        self._counts = {'requests': 0, 'errors': 0, 'rejected': 0, 'inflight': 0}
+        self._pool = None
+        self._http = None
+
+    def start(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from http.server import ThreadingHTTPServer
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_initworker)
+        # start and warm every worker before the first request
+        for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        self._http = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        self._http.daemon_threads = True
+        self.port = self._http.server_address[1]
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self):
+        return 'http://{}:{}'.format(self.host, self.port)
+
+    def render(self, spec, arrays=None, payload=None):
+        """
+        Render a spec in a worker and return the output bytes. 'arrays' are
+        in-memory data sources, 'payload' the same as .npz bytes. Raises
+        Busy when the queue is full and RuntimeError with the worker
+        traceback when rendering fails.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._counts['rejected'] += 1
+            raise Busy('{} renders in progress or queued.'.format(self.workers+self.queue))
+        t0 = time.time()
+        with self._lock:
+            self._counts['requests'] += 1
+            self._counts['inflight'] += 1
+        try:
+            if arrays:
+                buf = io.BytesIO()
+                np.savez(buf, **arrays)
+                payload = buf.getvalue()
+            out, start, rendered = self._pool.submit(_renderrequest, spec, payload).result()
+        finally:
+            self._slots.release()
+            with self._lock:
+                self._counts['inflight'] -= 1
+        with self._lock:
+            if out is None:
+                self._counts['errors'] += 1
+            else:
+                self._latency.append((start-t0, rendered, time.time()-t0))
+        if out is None:
+            raise RuntimeError(rendered)
+        return out
+
+    def metrics(self):
+        with self._lock:
+            latency = list(self._latency)
+            out = dict(self._counts, workers=self.workers, queue=self.queue)
+        for i, key in enumerate(('queue_time', 'render_time', 'total_time')):
+            out[key] = _percentiles([lat[i] for lat in latency])
+        return out
+
+
+def _handler(server):
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, body, ctype='application/json'):
+            self.send_response(code)
+            self.send_header('Content-Type', ctype)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/metrics':
+                self._send(200, json.dumps(server.metrics()).encode())
+            elif self.path == '/health':
+                self._send(200, b'{"status": "ok"}')
+            else:
+                self._send(404, b'{"error": "not found"}')
+
+        def do_POST(self):
+            if self.path != '/render':
+                return self._send(404, b'{"error": "not found"}')
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            try:
+                if body[:2] == b'PK':
+                    with np.load(io.BytesIO(body), allow_pickle=False) as npz:
+                        spec = json.loads(str(npz['__spec__']))
+                    payload = body
+                else:
+                    spec, payload = json.loads(body.decode()), None
+            except Exception as err:
+                return self._send(400, json.dumps({'error': str(err)}).encode())
+            try:
+                out = server.render(spec, payload=payload)
+            except Busy as err:
+                return self._send(503, json.dumps({'error': str(err)}).encode())
+            except RuntimeError as err:
+                return self._send(500, json.dumps({'error': str(err)}).encode())
+            self._send(200, out, _types.get(spec.get('format', 'png'), 'application/octet-stream'))
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def request(url, spec, arrays=None, timeout=60.):
+    """
+    Render a spec on a RenderServer at 'url' and return the output bytes.
+    'arrays' are sent with the spec as an .npz body.
+    """
+    from urllib.request import Request, urlopen
+    if arrays:
+        buf = io.BytesIO()
+        np.savez(buf, __spec__=json.dumps(spec), **arrays)
+        body, ctype = buf.getvalue(), 'application/octet-stream'
+    else:
+        body, ctype = json.dumps(spec).encode(), 'application/json'
+    req = Request(url.rstrip('/')+'/render', data=body, headers={'Content-Type': ctype})
+    with urlopen(req, timeout=timeout) as res:
+        return res.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m multiaxes.server', description='Local Multiaxes render server.')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-j', '--workers', type=int, default=2, help='number of worker processes (default 2)')
+    parser.add_argument('--queue', type=int, default=16, help='requests waiting for a worker (default 16)')
+    args = parser.parse_args(argv)
+    server = RenderServer(args.port, args.workers, args.queue).start()
+    print('Serving on {} with {} workers'.format(server.url, args.workers))
+    sys.stdout.flush()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
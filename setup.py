@@ -14,6 +14,8 @@ setup(
     url="https://github.com/radioshiny/multiaxes",
     packages=find_packages(),
     classifiers=[
-        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3",
     ],
-    python_requires='>=2.7', install_requires=['numpy', 'matplotlib', 'astropy'])
+    entry_points={'console_scripts': ['multiaxes=multiaxes.cli:main']},
+    extras_require={'yaml': ['pyyaml']},
+    python_requires='>=3.9', install_requires=['numpy', 'matplotlib>=3.8', 'contourpy', 'pillow', 'astropy'])
@@ -0,0 +1,55 @@
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from multiaxes import Multiaxes
+
+
+def _plot(fig, ax, cax, item):
+    for a in np.ravel(ax):
+        a.plot([0, item])
+
+
+def _crash(fig, ax, cax, item):
+    os._exit(1)
+
+
+def test_render_many(tmp_path):
+    out = sorted(Multiaxes(nx=2).render_many(range(4), _plot, str(tmp_path), workers=2))
+    assert [o[0] for o in out] == [0, 1, 2, 3]
+    assert all(err is None and os.path.isfile(fname) for _, fname, err in out)
+
+
+def test_render_many_unpicklable(tmp_path):
+    out = sorted(Multiaxes().render_many(range(3), lambda fig, ax, cax, item: None, str(tmp_path), workers=2))
+    assert [o[0] for o in out] == [0, 1, 2]
+    assert all(fname is None and 'pickle' in err.lower() for _, fname, err in out)
+
+
+def test_render_many_worker_crash(tmp_path):
+    out = sorted(Multiaxes().render_many(range(3), _crash, str(tmp_path), workers=2))
+    assert [o[0] for o in out] == [0, 1, 2]
+    assert all(fname is None and 'BrokenProcessPool' in err for _, fname, err in out)
+
+
+def test_render_many_settings(tmp_path):
+    reports = []
+    mx = Multiaxes()
+    mx.hook = reports.append
+    out = list(mx.render_many(range(2), _plot, str(tmp_path), workers=1))
+    assert all(err is None for _, _, err in out)
+    assert len(reports) == 2
+
+
+def test_render_many_reuse(tmp_path):
+    from PIL import Image
+    mx = Multiaxes(nx=2, cb=0.1)
+    for reuse in (False, True):
+        out = list(mx.render_many(range(3), _plot, str(tmp_path/str(reuse)), workers=1, reuse=reuse))
+        assert all(err is None for _, _, err in out)
+    for i in range(3):
+        name = '{:04d}.png'.format(i)
+        fresh, reused = (np.asarray(Image.open(str(tmp_path/str(r)/name))) for r in (False, True))
+        assert np.array_equal(fresh, reused)
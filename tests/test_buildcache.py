@@ -0,0 +1,42 @@
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+
+from multiaxes import Multiaxes, fingerprint
+
+SCALE = 1.
+
+
+def _scaled(y):
+    return [v*SCALE for v in y]
+
+
+def _plot(fig, ax, cax, inputs):
+    ax.plot(_scaled(inputs))
+
+
+def _closure(k):
+    def plot(fig, ax, cax, inputs):
+        ax.plot([k])
+    return plot
+
+
+def test_fingerprint_globals_and_closures(monkeypatch):
+    key = fingerprint(_plot)
+    assert fingerprint(_plot) == key
+    monkeypatch.setattr(sys.modules[__name__], 'SCALE', 2.)
+    assert fingerprint(_plot) != key
+    assert fingerprint(_closure(1)) == fingerprint(_closure(1))
+    assert fingerprint(_closure(1)) != fingerprint(_closure(2))
+
+
+def test_build_keeps_figure(tmp_path):
+    mx = Multiaxes()
+    fig, ax, cax = mx.drawfig(pyplot=False)
+    fname, cachedir = str(tmp_path/'fig.png'), str(tmp_path/'cache')
+    assert not mx.build(fname, _plot, [0, 1], cachedir)['skipped']
+    assert mx._fig is fig
+    assert mx.build(fname, _plot, [0, 1], cachedir)['skipped']
+    assert not mx.build(fname, _plot, [0, 2], cachedir)['skipped']
+    mx.closefig()
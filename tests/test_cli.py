@@ -0,0 +1,21 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from multiaxes import cli
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_cli_renders_every_spec(tmp_path, workers, capsys):
+    np.save(str(tmp_path/'a.npy'), np.random.rand(20, 20))
+    spec = {'layout': {'nx': 2}, 'data': {'a': 'a.npy'}, 'panels': [{'data': 'a'}, {'data': 'a', 'plot': 'contour'}]}
+    with open(str(tmp_path/'many.json'), 'w') as f:
+        json.dump([dict(spec, output='f{}.png'.format(i)) for i in range(3)], f)
+    with open(str(tmp_path/'bad.json'), 'w') as f:
+        f.write('{')
+    outdir = str(tmp_path/'out')
+    assert cli.main([str(tmp_path/'many.json'), str(tmp_path/'bad.json'), '-j', str(workers), '-o', outdir]) == 1
+    assert sorted(os.listdir(outdir)) == ['f0.png', 'f1.png', 'f2.png']
+    assert '4 figures, 1 failed' in capsys.readouterr().out
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+import matplotlib
+from matplotlib.colors import Normalize
+
+from multiaxes import colorize
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int16])
+@pytest.mark.parametrize('limits', [(-2., 2.), (0.1, 0.7), (0., 200.)])
+def test_colorize_bin_edges(dtype, limits):
+    cmap = matplotlib.colormaps['viridis']
+    vmin, vmax = limits
+    edges = vmin+np.arange(-3, cmap.N+4)*(vmax-vmin)/cmap.N
+    data = np.concatenate([edges, np.nextafter(edges, np.inf), np.nextafter(edges, -np.inf)])
+    data = data.astype(dtype)[:len(data)//4*4].reshape(4, -1)
+    ref = cmap(Normalize(vmin, vmax)(data), bytes=True)
+    assert (colorize(data, cmap, vmin, vmax, chunk=100) == ref).all()
+    finite = data[np.isfinite(data)]
+    assert (colorize(data, cmap) == cmap(Normalize(finite.min(), finite.max())(data), bytes=True)).all()
+
+
+def test_colorize_reported_value():
+    cmap = matplotlib.colormaps['viridis']
+    data = np.array([[0.34374992, np.nan]])
+    ref = cmap(Normalize(-2., 2.)(data), bytes=True)
+    out = colorize(data, cmap, norm=Normalize(-2., 2.))
+    assert (out[0, 0] == ref[0, 0]).all()
+    assert out[0, 1, 3] == 0
+
+
+def test_rgbalut_same_name():
+    from matplotlib.colors import ListedColormap
+    data = np.array([[0., 0.5, 1.]])
+    for colors in (['r', 'g', 'b'], ['r', 'y', 'b']):
+        cmap = ListedColormap(colors)
+        assert (colorize(data, cmap, 0., 1.) == cmap(Normalize(0., 1.)(data), bytes=True)).all()
@@ -0,0 +1,45 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from astropy.wcs import WCS
+
+from multiaxes import Multiaxes
+
+
+def test_contour_transform_per_panel():
+    w = WCS(naxis=2)
+    w.wcs.ctype = ['RA---TAN', 'DEC--TAN']
+    w.wcs.crval = [83.8, -5.4]
+    w.wcs.cdelt = [-1e-3, 1e-3]
+    mx = Multiaxes(nx=2)
+    mx._pj[0, 0] = w
+    y, x = np.mgrid[:32, :32]
+    with mx.figure() as (fig, ax, cax):
+        wcsax, plain = np.ravel(ax)
+        pcs = mx.contour([wcsax, plain], np.hypot(x-16, y-16), [4, 8], wcs=w)
+        assert pcs[0].get_transform() != plain.transData
+        assert pcs[1].get_transform() == plain.transData
+
+
+def test_contourpaths_hashes_once(monkeypatch):
+    from multiaxes import imaging
+    calls = []
+    fingerprint = imaging.fingerprint
+    monkeypatch.setattr(imaging, 'fingerprint', lambda data: calls.append(1) or fingerprint(data))
+    data = np.random.rand(40, 40)
+    first = imaging.contourpaths(data, [0.5])
+    assert imaging.contourpaths(data, [0.5]) is first
+    assert len(calls) == 1
+
+
+def test_contour_follows_norm():
+    from matplotlib.colors import Normalize
+    y, x = np.mgrid[:32, :32]
+    mx = Multiaxes()
+    with mx.figure() as (fig, ax, cax):
+        pc = mx.contour(ax, np.hypot(x-16, y-16), [4, 8, 12], cmap='viridis')
+        fig.canvas.draw()
+        before = pc.get_edgecolor().copy()
+        mx.applynorm(Normalize(0., 100.))
+        fig.canvas.draw()
+        assert not np.array_equal(pc.get_edgecolor(), before)
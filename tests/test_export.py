@@ -0,0 +1,20 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from PIL import Image
+
+from multiaxes import Multiaxes
+
+
+def test_export_raster_savefig_options(tmp_path):
+    mx = Multiaxes(nx=2, cb=0.1)
+    kw = dict(bbox_inches='tight', pad_inches=0.3, transparent=True)
+    with mx.figure() as (fig, ax, cax):
+        np.ravel(ax)[0].plot([0, 1])
+        mx.export(str(tmp_path/'fig'), formats=('png', 'jpg'), dpi=80, **kw)
+        fig.savefig(str(tmp_path/'ref.png'), dpi=80, **kw)
+    out = np.asarray(Image.open(str(tmp_path/'fig.png')))
+    ref = np.asarray(Image.open(str(tmp_path/'ref.png')))
+    assert out.shape == ref.shape
+    assert (out == ref).all()
+    assert Image.open(str(tmp_path/'fig.jpg')).size == (ref.shape[1], ref.shape[0])
@@ -0,0 +1,25 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from PIL import Image
+
+from multiaxes import figureset, pagegrid
+
+
+def _plot(ax, cax, item):
+    ax.plot(np.sin(np.arange(20)*item/10.))
+
+
+def test_pagegrid():
+    assert pagegrid(23, panel=1.5, col=2) == (4, 4)
+    assert pagegrid(3, panel=1.5, col=2) == (3, 1)
+
+
+def test_figureset_last_page(tmp_path):
+    out = sorted(figureset(range(23), _plot, str(tmp_path), panel=1.5, col=2, workers=1, fname='f{:d}.png',
+                           savekw={'dpi': 40}))
+    assert [(page, err) for page, _, err in out] == [(0, None), (1, None)]
+    full, last = (Image.open(str(tmp_path/'f{:d}.png'.format(i))).size for i in (1, 2))
+    assert last[0] == full[0]
+    # 7 items on 4 columns: two of the four rows
+    assert abs(last[1]/float(full[1])-0.5) < 0.1
@@ -0,0 +1,46 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+
+import multiaxes.layout
+import multiaxes.multiaxes
+from multiaxes import Multiaxes
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError('compute_layout() called')
+
+
+def _multiaxes():
+    mx = Multiaxes(col=2, nx=3, ny=2, cb=0.1, xlab=0.37, ylab=0.41)
+    mx.shareaxes()
+    return mx
+
+
+def test_repeated_layout(monkeypatch):
+    first = _multiaxes().compute_layout()
+    monkeypatch.setattr(multiaxes.layout, 'compute_layout', _fail)
+    monkeypatch.setattr(multiaxes.multiaxes, 'compute_layout', _fail)
+    again = _multiaxes().compute_layout()
+    assert again['figsize'] == first['figsize']
+    assert np.array_equal(again['ax'], first['ax'])
+    assert np.array_equal(again['cax'], first['cax'])
+
+
+@pytest.mark.parametrize('ext', ['json', 'npz'])
+def test_spec_skips_layout(tmp_path, ext, monkeypatch):
+    mx = _multiaxes()
+    first = mx.compute_layout(cache=False)
+    fname = str(tmp_path/('spec.'+ext))
+    mx.savespec(fname)
+    spec = mx.spec()
+    # only the layout stored in the spec can be used
+    multiaxes.layout.cached_layout.cache_clear()
+    monkeypatch.setattr(multiaxes.layout, 'compute_layout', _fail)
+    monkeypatch.setattr(multiaxes.multiaxes, 'compute_layout', _fail)
+    for m in (Multiaxes.fromspec(spec), Multiaxes.loadspec(fname)):
+        fig, ax, cax = m.drawfig(pyplot=False)
+        assert tuple(fig.get_size_inches()) == pytest.approx(first['figsize'])
+        assert np.allclose(m.compute_layout()['ax'], first['ax'])
+        m.closefig()
@@ -0,0 +1,41 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from multiaxes import Multiaxes
+
+
+def _state(mx, fig, ax, cax):
+    positions = np.array([a.get_position().bounds for a in np.ravel(ax)])
+    cpositions = [None if c is None else c.get_position().bounds for c in np.ravel(cax)]
+    return tuple(fig.get_size_inches()), positions, cpositions
+
+
+def _multiaxes():
+    return Multiaxes(col=2, nx=3, ny=2, cb=0.1, xlab=0.4, ylab=0.5)
+
+
+def _changes(mx):
+    mx.title(0.3)
+    mx.shareaxes(pad=0.05)
+
+
+def test_relayout_matches_drawfig():
+    mx = _multiaxes()
+    fig, ax, cax = mx.drawfig(pyplot=False)
+    lines = [a.plot([0, k])[0] for k, a in enumerate(np.ravel(ax))]
+    _changes(mx)
+    fig, ax, cax = mx.relayout()
+    size, positions, cpositions = _state(mx, fig, ax, cax)
+
+    ref = _multiaxes()
+    _changes(ref)
+    rfig, rax, rcax = ref.drawfig(pyplot=False)
+    rsize, rpositions, rcpositions = _state(ref, rfig, rax, rcax)
+    assert np.allclose(size, rsize)
+    assert np.allclose(positions, rpositions)
+    assert [c is None for c in cpositions] == [c is None for c in rcpositions]
+    assert all(c is None or np.allclose(c, r) for c, r in zip(cpositions, rcpositions))
+    assert [a.lines[0] for a in np.ravel(ax)] == lines
+    mx.closefig()
+    ref.closefig()
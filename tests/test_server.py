@@ -0,0 +1,65 @@
+import json
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import numpy as np
+import pytest
+
+from multiaxes.server import Busy, RenderServer, request
+
+_spec = {'layout': {'nx': 2}, 'panels': [{'data': 'a'}, {'data': 'a', 'plot': 'contour', 'levels': [0.5]}],
+         'format': 'png'}
+
+
+@pytest.fixture(scope='module')
+def server():
+    with RenderServer(workers=1, queue=1) as srv:
+        yield srv
+
+
+def test_render_json(server, tmp_path):
+    fname = str(tmp_path/'a.npy')
+    np.save(fname, np.random.rand(16, 16))
+    out = request(server.url, dict(_spec, data={'a': fname}))
+    assert out[:8] == b'\x89PNG\r\n\x1a\n'
+
+
+def test_render_npz(server):
+    out = request(server.url, dict(_spec, format='svg'), {'a': np.random.rand(16, 16)})
+    assert b'<svg' in out
+
+
+def test_bad_spec(server):
+    with pytest.raises(HTTPError) as err:
+        request(server.url, {'layout': {'nx': 1}, 'panels': [{'data': 'missing'}]})
+    assert err.value.code == 500
+    assert 'missing' in json.loads(err.value.read().decode())['error']
+
+
+def test_busy(server):
+    # hold both slots (one worker, one queued) so that the next request is rejected
+    for _ in range(server.workers+server.queue):
+        assert server._slots.acquire(blocking=False)
+    try:
+        with pytest.raises(Busy):
+            server.render(_spec, {'a': np.zeros((4, 4))})
+        with pytest.raises(HTTPError) as err:
+            request(server.url, {'layout': {'nx': 1}, 'panels': []})
+        assert err.value.code == 503
+    finally:
+        for _ in range(server.workers+server.queue):
+            server._slots.release()
+
+
+def test_metrics(server):
+    before = json.loads(urlopen(server.url+'/metrics').read().decode())
+    request(server.url, {'layout': {'nx': 1}, 'panels': []})
+    with pytest.raises(HTTPError):
+        request(server.url, {'layout': {'nx': 1}, 'panels': [{'data': 'missing'}]})
+    after = json.loads(urlopen(server.url+'/metrics').read().decode())
+    assert after['requests'] == before['requests']+2
+    assert after['errors'] == before['errors']+1
+    assert after['inflight'] == 0
+    assert after['workers'] == 1 and after['queue'] == 1
+    assert after['render_time']['p50'] is not None
+    assert json.loads(urlopen(server.url+'/health').read().decode()) == {'status': 'ok'}
@@ -0,0 +1,51 @@
+import shutil
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from multiaxes import Multiaxes
+
+
+def _scene(mx):
+    fig, ax, cax = mx.drawfig(pyplot=False)
+    axes = np.ravel(ax)
+    rng = np.random.default_rng(1)
+    cube = rng.random((4, 24, 24))
+    ims = [a.imshow(cube[0], origin='lower', vmin=0., vmax=1.) for a in axes]
+    for im, c in zip(ims, np.ravel(cax)):
+        mx.colorbar(im, cax=c, orientation='horizontal')
+    label = axes[0].text(0.05, 0.9, '', transform=axes[0].transAxes, color='w')
+    frames = [[cube[k]]*len(ims)+['frame {}'.format(k)] for k in range(len(cube))]
+    return fig, ims+[label], frames
+
+
+def test_stream_matches_full_draw():
+    mx = Multiaxes(nx=2, cb=0.1)
+    fig, artists, frames = _scene(mx)
+    streamed = list(mx.stream(artists, frames, dpi=60, copy=True))
+    fig.dpi = 60
+    agg = FigureCanvasAgg(fig)
+    for frame, values in zip(streamed, frames):
+        for artist, value in zip(artists, values):
+            if hasattr(artist, 'set_text'):
+                artist.set_text(value)
+            else:
+                artist.set_data(value)
+        agg.draw()
+        full = np.asarray(agg.buffer_rgba()).astype(int)
+        assert frame.shape == full.shape
+        assert np.abs(frame.astype(int)-full).max() <= 3
+    mx.closefig()
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg is not installed')
+def test_movie(tmp_path):
+    mx = Multiaxes(nx=2, cb=0.1)
+    fig, artists, frames = _scene(mx)
+    report = mx.movie(str(tmp_path/'cube.mp4'), artists, frames, fps=5, dpi=60)
+    assert report['frames'] == len(frames)
+    assert report['size'] > 0
+    mx.closefig()
@@ -0,0 +1,34 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from multiaxes import Multiaxes, rcstyle
+
+
+def _caxticks(mx, reuse):
+    fig, ax, cax = mx.drawfig(reuse=reuse, pyplot=False)
+    c = np.ravel(cax)[0]
+    im = np.ravel(ax)[0].imshow(np.random.rand(5, 5))
+    mx.colorbar(im, cax=c, orientation='horizontal')
+    mx.topcolorbar(c)
+    fig.canvas.draw()
+    tick = c.xaxis.get_major_ticks()[0]
+    return tick._tickdir, tick._size, c.xaxis.get_ticks_position()
+
+
+def test_clearfig_keeps_colorbar_style():
+    mx = Multiaxes(nx=2, cb=0.1)
+    first = _caxticks(mx, False)
+    assert first == (rcstyle['xtick.direction'], rcstyle['xtick.major.size'], 'top')
+    assert _caxticks(mx, True) == first
+    mx.closefig()
+
+
+def test_imshow_interpolation():
+    mx = Multiaxes(nx=2)
+    with mx.figure() as (fig, ax, cax):
+        a, b = np.ravel(ax)
+        assert mx.imshow(a, np.random.rand(8, 8)).get_interpolation() == rcstyle['image.interpolation']
+        assert mx.imshow(b, np.random.rand(8, 8), interpolation='bilinear').get_interpolation() == 'bilinear'
+    with mx.figure(style=False) as (fig, ax, cax):
+        assert mx.imshow(np.ravel(ax)[0], np.random.rand(8, 8)).get_interpolation() == 'auto'
@@ -0,0 +1,36 @@
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from multiaxes import Multiaxes
+
+
+def _render(seed):
+    mx = Multiaxes(nx=2, ny=2, cb=0.1)
+    mx.shareaxes()
+    x = np.linspace(0., 1., 50)
+    with mx.figure() as (fig, ax, cax):
+        for i, a in enumerate(np.ravel(ax)):
+            a.plot(x, np.sin(x*(seed+i)))
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=50)
+    return hashlib.sha256(buf.getvalue()).hexdigest()
+
+
+def test_drawfig_keeps_rcparams():
+    before = dict(matplotlib.rcParams)
+    with Multiaxes(nx=2).figure():
+        pass
+    assert dict(matplotlib.rcParams) == before
+
+
+def test_threaded_render_is_deterministic():
+    jobs = [i % 4 for i in range(64)]
+    serial = {seed: _render(seed) for seed in set(jobs)}
+    with ThreadPoolExecutor(8) as pool:
+        threaded = list(pool.map(_render, jobs))
+    assert threaded == [serial[seed] for seed in jobs]